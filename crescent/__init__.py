@@ -8,9 +8,14 @@ from crescent.errors import *
 from crescent.events import *
 from crescent.exceptions import *
 from crescent.hooks import *
+from crescent.internal.snapshot import *
 from crescent.locale import *
 from crescent.mentionable import *
+from crescent.offload import *
 from crescent.plugin import *
+from crescent.scheduler import *
+from crescent.tracing import *
+from crescent.watchdog import *
 from crescent.typedefs import *
 
 __version__: str = version("hikari-crescent")
@@ -20,6 +25,8 @@ __all__: Sequence[str] = (
     "user_command",
     "message_command",
     "option",
+    "DynamicCommand",
+    "ConverterCache",
     "hook",
     "HookResult",
     "Group",
@@ -27,8 +34,12 @@ __all__: Sequence[str] = (
     "Client",
     "GatewayTraits",
     "RESTTraits",
+    "CommandSnapshot",
     "Context",
     "AutocompleteContext",
+    "LazyMessage",
+    "ResponseTemplate",
+    "CoalescingEditor",
     "catch_command",
     "catch_event",
     "catch_autocomplete",
@@ -49,4 +60,13 @@ __all__: Sequence[str] = (
     "ClassCommandProto",
     "Plugin",
     "PluginManager",
+    "Tracer",
+    "MemoryTracer",
+    "RecordedSpan",
+    "OpenTelemetryTracer",
+    "LoopWatchdog",
+    "StallReport",
+    "OffloadPools",
+    "ExecutorT",
+    "FairScheduler",
 )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from asyncio import get_running_loop
+from asyncio import get_running_loop, wait
 from contextlib import suppress
 from functools import partial
 from itertools import chain
@@ -14,8 +14,10 @@ from hikari import (
     InteractionServerAware,
     PartialInteraction,
     RESTBotAware,
+    ShardPayloadEvent,
     Snowflakeish,
     StartedEvent,
+    StoppingEvent,
 )
 from hikari.traits import EventManagerAware, RESTAware
 
@@ -23,17 +25,24 @@ from crescent.hooks import add_hooks
 from crescent.internal.handle_resp import handle_resp
 from crescent.internal.includable import Includable
 from crescent.internal.registry import CommandHandler, ErrorHandler
+from crescent.offload import OffloadPools
 from crescent.plugin import PluginManager
 from crescent.typedefs import EventHookCallbackT
 from crescent.utils import create_task
 
 if TYPE_CHECKING:
     from asyncio import Future
+    from datetime import timedelta
     from typing import Any, Awaitable, Callable, Coroutine, Sequence, TypeVar
 
     from hikari.api import InteractionResponseBuilder
 
     from crescent.context import AutocompleteContext, Context
+    from crescent.internal.snapshot import CommandSnapshot
+    from crescent.scheduler import FairScheduler
+    from crescent.testing import InteractionRecorder
+    from crescent.tracing import Tracer
+    from crescent.watchdog import LoopWatchdog
     from crescent.typedefs import (
         AutocompleteErrorHandlerCallbackT,
         CommandErrorHandlerCallbackT,
@@ -94,6 +103,14 @@ class Client:
         command_after_hooks: list[CommandHookCallbackT] | None = None,
         event_hooks: list[EventHookCallbackT[hk_Event]] | None = None,
         event_after_hooks: list[EventHookCallbackT[hk_Event]] | None = None,
+        auto_defer_after: timedelta | None = None,
+        auto_defer_ephemeral: bool = False,
+        command_snapshot: CommandSnapshot | None = None,
+        tracer: Tracer | None = None,
+        interaction_recorder: InteractionRecorder | None = None,
+        watchdog: LoopWatchdog | None = None,
+        offload_pools: OffloadPools | None = None,
+        scheduler: FairScheduler | None = None,
     ):
         """
         Args:
@@ -137,6 +154,45 @@ class Client:
                 List of hooks to run before all commands.
             command_after_hooks:
                 List of hooks to run after all commands.
+            auto_defer_after:
+                If a command has not responded after this amount of time, defer the
+                interaction automatically so the response is not lost. Discord requires
+                an initial response within 3 seconds. Commands can override this with
+                the `auto_defer_after` kwarg. If `None`, interactions are never deferred
+                automatically.
+            auto_defer_ephemeral:
+                Whether automatic deferrals are ephemeral. Commands can override this
+                with the `auto_defer_ephemeral` kwarg.
+            command_snapshot:
+                Share one command sync between every process running this bot. The
+                first process publishes the commands, and processes whose commands
+                match the snapshot skip the sync. See `CommandSnapshot`.
+
+                ### Example
+
+                ```python
+                client = crescent.Client(
+                    bot, command_snapshot=crescent.CommandSnapshot("commands.json")
+                )
+                ```
+            tracer:
+                Open spans around the hooks, callback, converters, responses and
+                error handlers of every interaction. See `crescent.Tracer`. If
+                `None`, nothing is traced.
+            interaction_recorder:
+                Record the payload of every interaction so it can be replayed with
+                `crescent.testing.LoadDriver`. Only gateway bots can record
+                interactions. See `crescent.testing.InteractionRecorder`.
+            watchdog:
+                Report the command, event or task that blocked the event loop. See
+                `crescent.LoopWatchdog`.
+            offload_pools:
+                The pools that `Context.offload` runs blocking functions in. Defaults
+                to `crescent.OffloadPools()`.
+            scheduler:
+                Queue interactions per guild and user and share the bot between them
+                fairly. See `crescent.FairScheduler`. If `None`, every interaction is
+                handled as soon as it is received.
         """
         self.app = app
         self.model = model
@@ -144,6 +200,7 @@ class Client:
         if update_commands:
             self._add_startup_callback(self._post_commands)
         self._add_startup_callback(self._on_start)
+        self._add_shutdown_callback(self._on_stop)
 
         if tracked_guilds is None:
             tracked_guilds = ()
@@ -152,7 +209,15 @@ class Client:
             tracked_guilds = tuple(chain(tracked_guilds, (default_guild,)))
 
         self.allow_unknown_interactions = allow_unknown_interactions
+        self.auto_defer_after: timedelta | None = auto_defer_after
+        self.auto_defer_ephemeral: bool = auto_defer_ephemeral
         self.update_commands = update_commands
+        self.command_snapshot: CommandSnapshot | None = command_snapshot
+        self.tracer: Tracer | None = tracer
+        self.interaction_recorder: InteractionRecorder | None = interaction_recorder
+        self.watchdog: LoopWatchdog | None = watchdog
+        self.offload_pools: OffloadPools = offload_pools or OffloadPools()
+        self.scheduler: FairScheduler | None = scheduler
 
         self.command_hooks: list[CommandHookCallbackT] = command_hooks or []
         self.command_after_hooks: list[CommandHookCallbackT] = command_after_hooks or []
@@ -177,7 +242,11 @@ class Client:
 
         if isinstance(app, GatewayTraits):
             app.event_manager.subscribe(InteractionCreateEvent, self._on_interaction_event)
+            if interaction_recorder:
+                app.event_manager.subscribe(ShardPayloadEvent, interaction_recorder._on_payload)
             return
+        if interaction_recorder:
+            raise ValueError("Interactions can only be recorded by gateway bots.")
         app.interaction_server.set_listener(
             CommandInteraction,  # pyright: ignore
             self._on_rest_interaction,  # type: ignore
@@ -189,16 +258,28 @@ class Client:
 
     async def _on_rest_interaction(
         self, interaction: PartialInteraction
-    ) -> InteractionResponseBuilder:
+    ) -> InteractionResponseBuilder | None:
         future: Future[InteractionResponseBuilder] = get_running_loop().create_future()
-        create_task(handle_resp(self, interaction, future))
-        return await future
+        if self.scheduler is None:
+            create_task(handle_resp(self, interaction, future))
+            return await future
+
+        self.scheduler._submit(self, interaction, future)
+        await wait((future,))
+        # The scheduler cancels the future of dropped interactions. No response is sent.
+        return None if future.cancelled() else future.result()
 
     async def _on_interaction_event(self, event: InteractionCreateEvent) -> None:
-        await handle_resp(self, event.interaction, None)
+        if self.scheduler is None:
+            await handle_resp(self, event.interaction, None)
+        else:
+            self.scheduler._submit(self, event.interaction, None)
 
-    def _post_commands(self) -> Coroutine[Any, Any, None]:
-        return self._command_handler.register_commands()
+    async def _post_commands(self) -> None:
+        if self.command_snapshot:
+            await self.command_snapshot.sync(self._command_handler)
+        else:
+            await self._command_handler.register_commands()
 
     @overload
     def include(self, obj: INCLUDABLE) -> INCLUDABLE: ...
@@ -311,6 +392,13 @@ class Client:
 
     async def _on_start(self) -> None:
         self._started = True
+        if self.watchdog:
+            self.watchdog.start()
+
+    async def _on_stop(self) -> None:
+        if self.watchdog:
+            self.watchdog.stop()
+        self.offload_pools.shutdown(wait=False)
 
     def _add_startup_callback(
         self, callback: Callable[[], Awaitable[None]]
@@ -325,3 +413,12 @@ class Client:
             self.app.add_startup_callback(on_start)
             return partial(self.app.remove_startup_callback, on_start)
         return None
+
+    def _add_shutdown_callback(self, callback: Callable[[], Awaitable[None]]) -> None:
+        async def on_stop(_: Any) -> None:
+            await callback()
+
+        if isinstance(self.app, GatewayTraits):
+            self.app.event_manager.subscribe(StoppingEvent, on_stop)
+        elif isinstance(self.app, RESTBotAware):
+            self.app.add_shutdown_callback(on_stop)
@@ -1,6 +1,8 @@
 from typing import Sequence
 
+from crescent.commands.converter_cache import *
 from crescent.commands.decorators import *
+from crescent.commands.dynamic import *
 from crescent.commands.groups import *
 from crescent.commands.options import *
 
@@ -8,8 +10,10 @@ __all__: Sequence[str] = (
     "command",
     "user_command",
     "message_command",
+    "DynamicCommand",
     "Group",
     "SubGroup",
     "ClassCommandOption",
+    "ConverterCache",
     "option",
 )
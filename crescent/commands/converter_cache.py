@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from asyncio import shield
+from collections import OrderedDict
+from inspect import isawaitable
+from math import inf
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from crescent.utils import create_task
+
+if TYPE_CHECKING:
+    from asyncio import Task
+    from datetime import timedelta
+    from typing import Any, Awaitable, Callable, Hashable, Sequence
+
+    from hikari import Snowflake
+
+__all__: Sequence[str] = ("ConverterCache",)
+
+
+class ConverterCache:
+    """
+    A cache for the results of an option's converter. Pass a cache to
+    `ClassCommandOption.convert` to reuse the converted value when the same option
+    value is used again.
+
+    When several commands convert the same value at once, the converter is only
+    called one time and every command waits for the same result. Errors raised by
+    the converter are never cached.
+
+    ### Example
+    ```python
+    async def fetch_player(name: str) -> Player:
+        return await database.fetch_player(name)
+
+    @client.include
+    @crescent.command
+    class stats:
+        player = crescent.option(str).convert(
+            fetch_player,
+            cache=crescent.ConverterCache(ttl=datetime.timedelta(minutes=5), max_size=1000),
+        )
+
+        async def callback(self, ctx: crescent.Context) -> None:
+            ...
+    ```
+
+    Args:
+        ttl:
+            How long a result is kept. Results are kept until they are evicted if
+            this is `None`.
+        max_size:
+            The maximum amount of results to keep. The least recently used result
+            is evicted when the cache is full.
+        key:
+            A function that returns the key to cache a value under. The value itself
+            is used by default, so it must be hashable.
+        per_guild:
+            If `True`, results are not shared between guilds.
+    """
+
+    __slots__ = ("ttl", "max_size", "key", "per_guild", "hits", "misses", "_entries", "_pending")
+
+    def __init__(
+        self,
+        *,
+        ttl: timedelta | None = None,
+        max_size: int | None = None,
+        key: Callable[[Any], Hashable] | None = None,
+        per_guild: bool = False,
+    ) -> None:
+        self.ttl: timedelta | None = ttl
+        self.max_size: int | None = max_size
+        self.key: Callable[[Any], Hashable] | None = key
+        self.per_guild: bool = per_guild
+
+        self.hits: int = 0
+        """The amount of conversions that reused a cached or in-flight result."""
+        self.misses: int = 0
+        """The amount of conversions that called the converter."""
+
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        """A map of keys to `(expires at, result)`, ordered from least recently used."""
+        self._pending: dict[Hashable, Task[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of conversions that were served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Remove every cached result. Conversions that are in progress are kept."""
+        self._entries.clear()
+
+    def _convert(
+        self, converter: Callable[[Any], Any], value: Any, guild_id: Snowflake | None
+    ) -> Any:
+        """
+        Convert `value`, reusing a cached result if there is one. Returns an awaitable
+        if the result is not known yet.
+        """
+        cache_key = (
+            guild_id if self.per_guild else None,
+            self.key(value) if self.key else value,
+        )
+
+        if entry := self._entries.get(cache_key):
+            expires_at, result = entry
+            if expires_at > monotonic():
+                self.hits += 1
+                self._entries.move_to_end(cache_key)
+                return result
+            del self._entries[cache_key]
+
+        if pending := self._pending.get(cache_key):
+            self.hits += 1
+            return shield(pending)
+
+        self.misses += 1
+        result = converter(value)
+
+        if not isawaitable(result):
+            self._store(cache_key, result)
+            return result
+
+        task = create_task(self._resolve(cache_key, result))
+        self._pending[cache_key] = task
+        # Shielded so one command being cancelled does not cancel the conversion for
+        # every other command waiting on it.
+        return shield(task)
+
+    async def _resolve(self, cache_key: Hashable, result: Awaitable[Any]) -> Any:
+        try:
+            value = await result
+        finally:
+            del self._pending[cache_key]
+
+        self._store(cache_key, value)
+        return value
+
+    def _store(self, cache_key: Hashable, result: Any) -> None:
+        expires_at = monotonic() + self.ttl.total_seconds() if self.ttl is not None else inf
+        self._entries[cache_key] = (expires_at, result)
+        self._entries.move_to_end(cache_key)
+
+        if self.max_size is not None:
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from asyncio import Task, create_task
+from asyncio import gather
 from functools import partial, wraps
 from inspect import isawaitable, isclass, isfunction
 from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, cast, overload
@@ -12,6 +12,7 @@ from hikari import (
     CommandType,
     Permissions,
     Snowflakeish,
+    UndefinedNoneOr,
     UndefinedOr,
     UndefinedType,
 )
@@ -22,8 +23,11 @@ from crescent.internal.registry import register_command
 from crescent.locale import LocaleBuilder
 
 if TYPE_CHECKING:
+    from datetime import timedelta
     from typing import Any, Sequence, TypeVar
 
+    from crescent.commands.converter_cache import ConverterCache
+    from crescent.context import Context
     from crescent.internal.app_command import AppCommandMeta
     from crescent.internal.includable import Includable
     from crescent.typedefs import (
@@ -41,55 +45,81 @@ __all__: Sequence[str] = ("command", "user_command", "message_command")
 
 def _class_command_callback(
     cls: type[ClassCommandProto],
-    defaults: dict[str, Any],
-    name_map: dict[str, str],
-    converters: dict[str, Callable[[Any], Any]],
+    plan: tuple[tuple[str, str, Any, Callable[[Any], Any] | None, ConverterCache | None], ...],
 ) -> CommandCallbackT:
-    @wraps(cls.callback)
-    async def callback(*args: Any, **kwargs: Any) -> Any:
-        values = defaults.copy()
-        values.update(kwargs)
+    """
+    Create the callback for a class command.
 
-        cmd = cls()
+    Args:
+        plan:
+            A `(name, key, default, converter, cache)` tuple for every option, where
+            `name` is the name of the option used by Discord and `key` is the name of
+            the attribute on the class.
+    """
+    has_converters = any(conv for _, _, _, conv, _ in plan)
 
-        async def set_later(key: str, value: object | Awaitable[object]) -> None:
-            if isawaitable(value):
-                value = await value
-            setattr(cmd, key, value)
+    async def convert(ctx: Context, kwargs: dict[str, Any]) -> ClassCommandProto:
+        cmd = cls()
 
         errors: list[ConverterExceptionMeta] = []
-        tasks: list[tuple[Task[None], str, Any]] = []
-        # [(Task, option key, raw value)]
+        awaitables: list[Awaitable[Any]] = []
+        pending: list[tuple[str, Any]] = []
+        # [(option key, raw value)] for every awaitable
 
-        for key, raw_val in values.items():
-            # val: The converted (if a converter existed) value
-            # raw_val: The original value passed by Discord
-            # key: The key of the option on the class
-            # name: The name of the option used by Discord
+        for name, key, default, conv, cache in plan:
+            raw_val = kwargs.get(name, default)
 
-            key = name_map.get(key, key)
+            if conv is None:
+                setattr(cmd, key, raw_val)
+                continue
 
-            if conv := converters.get(key):
-                try:
+            try:
+                if cache is None:
                     val = conv(raw_val)
-                except Exception as e:
-                    errors.append(ConverterExceptionMeta(cls, key, raw_val, e))
-                    continue
-            else:
-                val = raw_val
+                else:
+                    val = cache._convert(conv, raw_val, ctx.guild_id)
+            except Exception as e:
+                errors.append(ConverterExceptionMeta(cls, key, raw_val, e))
+                continue
 
-            tasks.append((create_task(set_later(key, val)), key, raw_val))
+            if isawaitable(val):
+                awaitables.append(val)
+                pending.append((key, raw_val))
+            else:
+                setattr(cmd, key, val)
 
-        for t, key, raw_val in tasks:
+        if len(awaitables) == 1:
+            # Awaiting directly avoids creating a task.
+            key, raw_val = pending[0]
             try:
-                await t
+                setattr(cmd, key, await awaitables[0])
             except Exception as e:
                 errors.append(ConverterExceptionMeta(cls, key, raw_val, e))
+        elif awaitables:
+            results = await gather(*awaitables, return_exceptions=True)
+            for (key, raw_val), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    errors.append(ConverterExceptionMeta(cls, key, raw_val, result))
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    setattr(cmd, key, result)
 
         if errors:
             raise ConverterExceptions(errors)
 
-        return await cmd.callback(*args)
+        return cmd
+
+    @wraps(cls.callback)
+    async def callback(ctx: Context, *args: Any, **kwargs: Any) -> Any:
+        tracer = ctx.client.tracer if has_converters else None
+        if tracer is None:
+            cmd = await convert(ctx, kwargs)
+        else:
+            with tracer.span("crescent.converters"):
+                cmd = await convert(ctx, kwargs)
+
+        return await cmd.callback(ctx, *args)
 
     return callback
 
@@ -109,6 +139,8 @@ def command(
     default_member_permissions: UndefinedType | int | Permissions = ...,
     context_types: UndefinedOr[Iterable[ApplicationContextType]] = ...,
     nsfw: bool | None = ...,
+    auto_defer_after: UndefinedNoneOr[timedelta] = ...,
+    auto_defer_ephemeral: UndefinedOr[bool] = ...,
 ) -> Callable[[CommandCallbackT | type[ClassCommandProto]], Includable[AppCommandMeta]]: ...
 
 
@@ -122,6 +154,8 @@ def command(
     default_member_permissions: UndefinedType | int | Permissions = UNDEFINED,
     context_types: UndefinedOr[Iterable[ApplicationContextType]] = UNDEFINED,
     nsfw: bool | None = None,
+    auto_defer_after: UndefinedNoneOr[timedelta] = UNDEFINED,
+    auto_defer_ephemeral: UndefinedOr[bool] = UNDEFINED,
 ) -> (
     Includable[AppCommandMeta]
     | Callable[[CommandCallbackT | type[ClassCommandProto]], Includable[AppCommandMeta]]
@@ -161,6 +195,13 @@ def command(
             The contexts in which the command can be used. Defaults to all.
         nsfw:
             Set to `True` to mark this command as nsfw. Defaults to `None`.
+        auto_defer_after:
+            If the command has not responded after this amount of time, defer the
+            interaction automatically. If `None`, the interaction is never deferred
+            automatically. Defaults to `Client.auto_defer_after`.
+        auto_defer_ephemeral:
+            Whether the automatic deferral is ephemeral. Defaults to
+            `Client.auto_defer_ephemeral`.
     """
     if not callback:
         return partial(
@@ -171,6 +212,8 @@ def command(
             default_member_permissions=default_member_permissions,
             context_types=context_types,
             nsfw=nsfw,
+            auto_defer_after=auto_defer_after,
+            auto_defer_ephemeral=auto_defer_ephemeral,
         )  # pyright: ignore
 
     autocomplete: dict[str, AutocompleteCallbackT[Any]] = {}
@@ -181,9 +224,7 @@ def command(
         # signature.
         callback = cast("type[ClassCommandProto]", callback)
 
-        name_map: dict[str, str] = {}
-        defaults: dict[str, Any] = {}
-        converters: dict[str, Callable[[Any], Any]] = {}
+        plan: list[tuple[str, str, Any, Callable[[Any], Any] | None, ConverterCache | None]] = []
 
         for n, v in callback.__dict__.items():
             if not isinstance(v, ClassCommandOption):
@@ -198,15 +239,9 @@ def command(
             if v.autocomplete:
                 autocomplete[generated.name] = v.autocomplete
 
-            if v.converter:
-                converters[generated.name] = v.converter
-
-            if generated.name != n:
-                name_map[generated.name] = n
-
-            defaults[generated.name] = v.default
+            plan.append((generated.name, n, v.default, v.converter, v.cache))
 
-        callback_func = _class_command_callback(callback, defaults, name_map, converters)
+        callback_func = _class_command_callback(callback, tuple(plan))
 
     elif isfunction(callback):
         callback_func = callback
@@ -225,6 +260,8 @@ def command(
         context_types=context_types,
         autocomplete=autocomplete,
         nsfw=nsfw,
+        auto_defer_after=auto_defer_after,
+        auto_defer_ephemeral=auto_defer_ephemeral,
     )
 
 
@@ -250,6 +287,8 @@ def user_command(
     default_member_permissions: UndefinedType | int | Permissions = ...,
     context_types: UndefinedOr[list[ApplicationContextType]] = ...,
     nsfw: bool | None = ...,
+    auto_defer_after: UndefinedNoneOr[timedelta] = ...,
+    auto_defer_ephemeral: UndefinedOr[bool] = ...,
 ) -> Callable[[UserCommandCallbackT], Includable[AppCommandMeta]]: ...
 
 
@@ -262,6 +301,8 @@ def user_command(
     default_member_permissions: UndefinedType | int | Permissions = UNDEFINED,
     context_types: UndefinedOr[list[ApplicationContextType]] = UNDEFINED,
     nsfw: bool | None = None,
+    auto_defer_after: UndefinedNoneOr[timedelta] = UNDEFINED,
+    auto_defer_ephemeral: UndefinedOr[bool] = UNDEFINED,
 ) -> Callable[[UserCommandCallbackT], Includable[AppCommandMeta]] | Includable[AppCommandMeta]:
     """
     Register a user command. A user command can be used by right clicking on a discord
@@ -296,6 +337,13 @@ def user_command(
             The contexts in which the command can be used. Defaults to all.
         nsfw:
             Set to `True` to mark this command as nsfw. Defaults to `None`.
+        auto_defer_after:
+            If the command has not responded after this amount of time, defer the
+            interaction automatically. If `None`, the interaction is never deferred
+            automatically. Defaults to `Client.auto_defer_after`.
+        auto_defer_ephemeral:
+            Whether the automatic deferral is ephemeral. Defaults to
+            `Client.auto_defer_ephemeral`.
     """
     if not callback:
         return partial(
@@ -305,6 +353,8 @@ def user_command(
             default_member_permissions=default_member_permissions,
             context_types=context_types,
             nsfw=nsfw,
+            auto_defer_after=auto_defer_after,
+            auto_defer_ephemeral=auto_defer_ephemeral,
         )  # pyright: ignore
 
     return register_command(
@@ -316,6 +366,8 @@ def user_command(
         default_member_permissions=default_member_permissions,
         context_types=context_types,
         nsfw=nsfw,
+        auto_defer_after=auto_defer_after,
+        auto_defer_ephemeral=auto_defer_ephemeral,
     )
 
 
@@ -331,6 +383,8 @@ def message_command(
     default_member_permissions: UndefinedType | int | Permissions = ...,
     context_types: UndefinedOr[list[ApplicationContextType]] = ...,
     nsfw: bool | None = ...,
+    auto_defer_after: UndefinedNoneOr[timedelta] = ...,
+    auto_defer_ephemeral: UndefinedOr[bool] = ...,
 ) -> Callable[[MessageCommandCallbackT], Includable[AppCommandMeta]]: ...
 
 
@@ -343,6 +397,8 @@ def message_command(
     default_member_permissions: UndefinedType | int | Permissions = UNDEFINED,
     context_types: UndefinedOr[list[ApplicationContextType]] = UNDEFINED,
     nsfw: bool | None = None,
+    auto_defer_after: UndefinedNoneOr[timedelta] = UNDEFINED,
+    auto_defer_ephemeral: UndefinedOr[bool] = UNDEFINED,
 ) -> Callable[[MessageCommandCallbackT], Includable[AppCommandMeta]] | Includable[AppCommandMeta]:
     """
     Register a message command. A message command can be used by right clicking on a discord
@@ -377,6 +433,13 @@ def message_command(
             The contexts in which the command can be used. Defaults to all.
         nsfw:
             Set to `True` to mark this command as nsfw. Defaults to `None`.
+        auto_defer_after:
+            If the command has not responded after this amount of time, defer the
+            interaction automatically. If `None`, the interaction is never deferred
+            automatically. Defaults to `Client.auto_defer_after`.
+        auto_defer_ephemeral:
+            Whether the automatic deferral is ephemeral. Defaults to
+            `Client.auto_defer_ephemeral`.
     """
     if not callback:
         return partial(
@@ -386,6 +449,8 @@ def message_command(
             default_member_permissions=default_member_permissions,
             context_types=context_types,
             nsfw=nsfw,
+            auto_defer_after=auto_defer_after,
+            auto_defer_ephemeral=auto_defer_ephemeral,
         )  # pyright: ignore
 
     return register_command(
@@ -397,4 +462,6 @@ def message_command(
         default_member_permissions=default_member_permissions,
         context_types=context_types,
         nsfw=nsfw,
+        auto_defer_after=auto_defer_after,
+        auto_defer_ephemeral=auto_defer_ephemeral,
     )
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from inspect import iscoroutinefunction
+from typing import TYPE_CHECKING
+
+from hikari import (
+    UNDEFINED,
+    CommandType,
+    Permissions,
+    UndefinedNoneOr,
+    UndefinedOr,
+    UndefinedType,
+)
+
+from crescent.internal.app_command import AppCommand, AppCommandMeta
+from crescent.internal.includable import Includable
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+    from typing import Sequence
+
+    from hikari import CommandOption, Snowflakeish
+
+    from crescent.client import Client
+    from crescent.locale import LocaleBuilder
+    from crescent.typedefs import CommandCallbackT
+
+__all__: Sequence[str] = ("DynamicCommand",)
+
+
+@dataclass(frozen=True, slots=True)
+class DynamicCommand:
+    """
+    A slash command created from data while the bot is running, such as a custom
+    command a guild made. Add these to a guild with `CommandHandler.set_guild_commands`
+    or `CommandHandler.add_guild_commands`.
+
+    Many commands can share the same callback. The callback is called with the options
+    as keyword arguments, and `ctx.command` is the name of the command that was used.
+
+    ### Example
+    ```python
+    async def tag(ctx: crescent.Context, **options: Any) -> None:
+        await ctx.respond(await get_tag(ctx.guild_id, ctx.command))
+
+    client.commands.set_guild_commands(
+        guild_id,
+        [crescent.DynamicCommand(name, tag, description="A tag.") for name in tag_names],
+    )
+    await client.commands.sync_guild_commands()
+    ```
+
+    Args:
+        name:
+            The name of the command.
+        callback:
+            The function called when the command is used.
+        description:
+            The description of the command.
+        options:
+            The options of the command.
+        default_member_permissions:
+            The default permissions for this command.
+        nsfw:
+            Set to `True` to mark this command as nsfw.
+        auto_defer_after:
+            If the command has not responded after this amount of time, defer the
+            interaction automatically. Defaults to `Client.auto_defer_after`.
+        auto_defer_ephemeral:
+            Whether the automatic deferral is ephemeral. Defaults to
+            `Client.auto_defer_ephemeral`.
+    """
+
+    name: str | LocaleBuilder
+    callback: CommandCallbackT
+    description: str | LocaleBuilder = "No Description"
+    options: Sequence[CommandOption] = ()
+    default_member_permissions: UndefinedType | int | Permissions = UNDEFINED
+    nsfw: bool | None = None
+    auto_defer_after: UndefinedNoneOr[timedelta] = UNDEFINED
+    auto_defer_ephemeral: UndefinedOr[bool] = UNDEFINED
+
+    def _build(self, guild: Snowflakeish) -> AppCommand:
+        if not iscoroutinefunction(self.callback):
+            raise ValueError(f"`{self.callback.__name__}` must be an async function.")
+
+        return AppCommand(
+            type=CommandType.SLASH,
+            name=self.name,
+            guild_id=guild,
+            description=self.description,
+            options=self.options,
+            default_member_permissions=self.default_member_permissions,
+            nsfw=self.nsfw,
+        )
+
+    def _to_includable(
+        self, app_command: AppCommand, client: Client
+    ) -> Includable[AppCommandMeta]:
+        """
+        Create the includable a command is handled with. Dynamic commands only store
+        their `AppCommand`, so this is created when the command is used.
+        """
+        metadata = AppCommandMeta(
+            owner=self.callback,
+            callback=self.callback,
+            app_command=app_command,
+            auto_defer_after=self.auto_defer_after,
+            auto_defer_ephemeral=self.auto_defer_ephemeral,
+        )
+        metadata.add_hooks(client.command_hooks, after=False)
+        metadata.add_hooks(client.command_after_hooks, after=True)
+        return Includable(metadata, _client=client)
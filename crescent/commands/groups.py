@@ -27,7 +27,7 @@ def _check_permissions(includable: Includable[AppCommandMeta]) -> None:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     """
     A command group. A command group is a top level command that contains subcommands
@@ -95,7 +95,7 @@ class Group:
         return includable
 
 
-@dataclass
+@dataclass(slots=True)
 class SubGroup:
     """
     A command subgroup. A command subgroup is a group that is under a top level group.
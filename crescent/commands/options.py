@@ -44,6 +44,7 @@ from crescent.locale import LocaleBuilder, str_or_build_locale
 from crescent.mentionable import Mentionable
 
 if TYPE_CHECKING:
+    from crescent.commands.converter_cache import ConverterCache
     from crescent.typedefs import AutocompleteCallbackT, OptionTypesT
 
 
@@ -138,9 +139,23 @@ class ClassCommandOption(Generic[In, Out]):
     max_length: int | None
     autocomplete: AutocompleteCallbackT[Any] | None
     converter: Callable[[In], Out | Awaitable[Out]] | None
-
-    def convert(self, converter: Callable[[In], T | Awaitable[T]]) -> ClassCommandOption[In, T]:
-        return replace(cast("ClassCommandOption[In, T]", self), converter=converter)
+    cache: ConverterCache | None = None
+
+    def convert(
+        self, converter: Callable[[In], T | Awaitable[T]], *, cache: ConverterCache | None = None
+    ) -> ClassCommandOption[In, T]:
+        """
+        Convert the value of this option before it is passed to the command.
+
+        Args:
+            converter:
+                A sync or async function that takes the option's value and returns
+                the converted value.
+            cache:
+                A `ConverterCache` to reuse converted values with. A cache should
+                only be used by one option.
+        """
+        return replace(cast("ClassCommandOption[In, T]", self), converter=converter, cache=cache)
 
     def _gen_option(self, name: str) -> CommandOption:
         name, name_localizations = str_or_build_locale(self.name or name)
@@ -2,6 +2,16 @@ from typing import Sequence
 
 from crescent.context.autocomplete_context import *
 from crescent.context.context import *
+from crescent.context.editor import *
 from crescent.context.interaction_context import *
+from crescent.context.lazy_message import *
+from crescent.context.template import *
 
-__all__: Sequence[str] = ("InteractionContext", "Context", "AutocompleteContext")
+__all__: Sequence[str] = (
+    "InteractionContext",
+    "Context",
+    "AutocompleteContext",
+    "LazyMessage",
+    "CoalescingEditor",
+    "ResponseTemplate",
+)
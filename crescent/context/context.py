@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from asyncio import TimerHandle, get_running_loop, sleep
+from datetime import timedelta
 from typing import TYPE_CHECKING, Union, overload
 
 from hikari import (
@@ -7,6 +9,7 @@ from hikari import (
     GatewayGuild,
     GuildThreadChannel,
     MessageFlag,
+    NotFoundError,
     PermissibleGuildChannel,
     ResponseType,
 )
@@ -18,11 +21,16 @@ from hikari.api import (
 )
 from hikari.traits import CacheAware
 
+from crescent.context.editor import CoalescingEditor
 from crescent.context.interaction_context import InteractionContext
+from crescent.context.lazy_message import LazyMessage
+from crescent.context.template import ResponseTemplate
 from crescent.exceptions import InteractionAlreadyAcknowledgedError
+from crescent.tracing import span
+from crescent.utils import create_task
 
 if TYPE_CHECKING:
-    from typing import Any, Literal, Sequence
+    from typing import Any, Callable, Literal, Sequence, TypeVar
 
     from hikari import (
         Attachment,
@@ -38,8 +46,16 @@ if TYPE_CHECKING:
         UndefinedType,
     )
 
+    from crescent.offload import ExecutorT
+
+    T = TypeVar("T")
+
 __all__: Sequence[str] = ("Context",)
 
+_REST_FETCH_ATTEMPTS = 5
+_REST_FETCH_DELAY = 0.05
+"""The delay before retrying to fetch a REST bot's response, in seconds. Doubles every try."""
+
 ResponseBuilderT = Union[
     InteractionMessageBuilder, InteractionDeferredBuilder, InteractionModalBuilder
 ]
@@ -67,21 +83,182 @@ class Context(InteractionContext):
         """Get this context's guild from the cache."""
         return self.interaction.get_guild()
 
+    @property
+    def response_message(self) -> LazyMessage:
+        """
+        A handle to the initial response message. The message is only fetched when the
+        handle is awaited.
+        """
+        if self._response_message is None:
+            self._response_message = LazyMessage(self._fetch_response_message)
+        return self._response_message
+
+    def editor(self, interval: timedelta = timedelta(seconds=1)) -> CoalescingEditor:
+        """
+        Create an editor that merges edits and queues followups so at most one request
+        is sent every `interval`. See `CoalescingEditor`.
+        """
+        return CoalescingEditor(self, interval.total_seconds())
+
+    async def offload(
+        self,
+        func: Callable[..., T],
+        /,
+        *args: Any,
+        executor: ExecutorT = "thread",
+        limit: int | None = None,
+        defer_after: UndefinedNoneOr[timedelta] = UNDEFINED,
+        ephemeral: UndefinedOr[bool] = UNDEFINED,
+    ) -> T:
+        """
+        Run a blocking function in a thread or process pool so it does not block the
+        event loop. The pools are owned by the client, see `crescent.OffloadPools`.
+
+        If the function has not finished after `defer_after` and no response was
+        created, the interaction is deferred so the response can still be sent.
+
+        ### Example
+        ```python
+        def render(text: str) -> bytes:
+            ...
+
+        @client.include
+        @crescent.command
+        async def banner(ctx: crescent.Context, text: str):
+            image = await ctx.offload(render, text, executor="process", limit=2)
+            await ctx.respond(attachment=hikari.Bytes(image, "banner.png"))
+        ```
+
+        Args:
+            func:
+                The function to run. Functions run with `executor="process"` and their
+                arguments must be picklable.
+            executor:
+                `"thread"`, `"process"` or any `concurrent.futures.Executor`.
+            limit:
+                The most functions this command can run in the pool at the same time.
+                Other calls wait for their turn. If `None`, there is no limit.
+            defer_after:
+                Defaults to `OffloadPools.defer_after`. If `None`, the interaction is
+                not deferred.
+            ephemeral:
+                Whether the deferral is ephemeral. Defaults to
+                `Client.auto_defer_ephemeral`.
+        """
+        pools = self.client.offload_pools
+
+        if defer_after is UNDEFINED:
+            defer_after = pools.defer_after
+        armed = (
+            defer_after is not None
+            and self._auto_defer is None
+            and not (self._has_created_response or self._has_deferred_response)
+        )
+        if armed:
+            assert defer_after is not None
+            if ephemeral is UNDEFINED:
+                ephemeral = self.client.auto_defer_ephemeral
+            self._arm_auto_defer(defer_after.total_seconds(), ephemeral)
+
+        tracer = self.client.tracer
+        attributes = (
+            None
+            if tracer is None
+            else {"crescent.offload.function": getattr(func, "__qualname__", repr(func))}
+        )
+
+        loop = get_running_loop()
+        pool = pools.executor(executor)
+        try:
+            with span(tracer, "crescent.offload", attributes):
+                if limit is None:
+                    return await loop.run_in_executor(pool, func, *args)
+                async with pools._limit((self.group, self.sub_group, self.command), limit):
+                    return await loop.run_in_executor(pool, func, *args)
+        finally:
+            if armed and isinstance(self._auto_defer, TimerHandle):
+                # The function finished in time. A deferral that already started is
+                # waited for by the next response.
+                self._cancel_auto_defer()
+
+    async def _fetch_response_message(self) -> Message:
+        if self._rest_interaction_future is None:
+            return await self.app.rest.fetch_interaction_response(self.application_id, self.token)
+
+        # With a REST bot the response is sent by the interaction server after the
+        # future is set, so the message may not exist yet.
+        delay = _REST_FETCH_DELAY
+        for _ in range(_REST_FETCH_ATTEMPTS - 1):
+            try:
+                return await self.app.rest.fetch_interaction_response(
+                    self.application_id, self.token
+                )
+            except NotFoundError:
+                await sleep(delay)
+                delay *= 2
+        return await self.app.rest.fetch_interaction_response(self.application_id, self.token)
+
+    def _arm_auto_defer(self, delay: float, ephemeral: bool = False) -> None:
+        """Defer this interaction after `delay` seconds if no response was created."""
+        self._auto_defer = get_running_loop().call_later(delay, self._fire_auto_defer, ephemeral)
+
+    def _fire_auto_defer(self, ephemeral: bool) -> None:
+        if self._has_created_response or self._has_deferred_response:
+            self._auto_defer = None
+            return
+        self._auto_defer = create_task(self._defer(ephemeral))
+
+    def _cancel_auto_defer(self) -> None:
+        if isinstance(self._auto_defer, TimerHandle):
+            self._auto_defer.cancel()
+        self._auto_defer = None
+
+    async def _settle_auto_defer(self) -> bool:
+        """
+        Stop the automatic deferral before responding. If the interaction is already
+        being deferred, wait for that to finish.
+
+        Returns:
+            `True` if the interaction was automatically deferred.
+        """
+        pending = self._auto_defer
+        if pending is None:
+            return False
+
+        self._auto_defer = None
+        if isinstance(pending, TimerHandle):
+            pending.cancel()
+            return False
+
+        await pending
+        return True
+
     async def defer(self, ephemeral: bool = False) -> None:
         """
         Defer this interaction response, allowing you to respond within the next 15
         minutes.
+
+        If the interaction was already deferred automatically because of
+        `auto_defer_after`, this does nothing.
         """
+        if await self._settle_auto_defer():
+            return
+        await self._defer(ephemeral)
 
+    async def _defer(self, ephemeral: bool = False) -> None:
         if future := self._unset_future:
-            future.set_result(self.interaction.build_deferred_response())
+            builder = self.interaction.build_deferred_response()
+            if ephemeral:
+                builder.set_flags(MessageFlag.EPHEMERAL)
+            future.set_result(builder)
         else:
-            await self.app.rest.create_interaction_response(
-                interaction=self.id,
-                token=self.token,
-                flags=MessageFlag.EPHEMERAL if ephemeral else UNDEFINED,
-                response_type=ResponseType.DEFERRED_MESSAGE_CREATE,
-            )
+            with span(self.client.tracer, "crescent.defer"):
+                await self.app.rest.create_interaction_response(
+                    interaction=self.id,
+                    token=self.token,
+                    flags=MessageFlag.EPHEMERAL if ephemeral else UNDEFINED,
+                    response_type=ResponseType.DEFERRED_MESSAGE_CREATE,
+                )
         self._has_deferred_response = True
 
     @overload
@@ -198,6 +375,8 @@ class Context(InteractionContext):
                 `Context.respond`. Set `ensure_message=True` to automatically
                 fetch a message and return it.
         """
+        await self._settle_auto_defer()
+
         if ephemeral:
             if flags is UNDEFINED:
                 flags = MessageFlag.EPHEMERAL
@@ -246,21 +425,22 @@ class Context(InteractionContext):
 
                 future.set_result(resp)
             else:
-                await self.app.rest.create_interaction_response(
-                    **kwargs,
-                    tts=tts,
-                    flags=flags,
-                    interaction=self.id,
-                    token=self.token,
-                    response_type=ResponseType.MESSAGE_CREATE,
-                )
+                with span(self.client.tracer, "crescent.respond"):
+                    await self.app.rest.create_interaction_response(
+                        **kwargs,
+                        tts=tts,
+                        flags=flags,
+                        interaction=self.id,
+                        token=self.token,
+                        response_type=ResponseType.MESSAGE_CREATE,
+                    )
 
             self._has_created_response = True
 
             if not ensure_message:
                 return None
 
-            return await self.app.rest.fetch_interaction_response(self.application_id, self.token)
+            return await self.response_message
 
         if self._has_deferred_response and not self._has_created_response:
             res = await self.edit(**kwargs)
@@ -269,6 +449,57 @@ class Context(InteractionContext):
 
         return await self.followup(**kwargs)
 
+    async def respond_with_template(
+        self,
+        template: ResponseTemplate,
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        ensure_message: bool = False,
+    ) -> Message | None:
+        """
+        Respond to an interaction with a `ResponseTemplate`. Like `Context.respond`,
+        this function can be used multiple times for one interaction.
+
+        Args:
+            template:
+                The template to respond with.
+            content:
+                The content to send. If not provided, the template's content is used.
+            ensure_message:
+                A message is not returned the first time you use
+                `Context.respond_with_template`. Set `ensure_message=True` to
+                automatically fetch a message and return it.
+        """
+        await self._settle_auto_defer()
+
+        if content is UNDEFINED:
+            content = template.content
+
+        if not (self._has_deferred_response or self._has_created_response):
+            if future := self._unset_future:
+                future.set_result(template._builder(content))
+            else:
+                with span(self.client.tracer, "crescent.respond"):
+                    await self.app.rest.create_interaction_response(
+                        self.id,
+                        self.token,
+                        ResponseType.MESSAGE_CREATE,
+                        content,
+                        **template._create_kwargs,
+                    )
+            self._has_created_response = True
+
+            if not ensure_message:
+                return None
+            return await self.response_message
+
+        if self._has_deferred_response and not self._has_created_response:
+            res = await self.edit(content, **template._message_kwargs)
+            self._has_created_response = True
+            return res
+
+        return await self.followup(content, **template._message_kwargs)
+
     async def respond_with_modal(
         self, title: str, custom_id: str, components: Sequence[ComponentBuilder]
     ) -> None:
@@ -286,6 +517,8 @@ class Context(InteractionContext):
             InteractionAlreadyAcknowledgedError:
                 Raised when calling this method after responding to an interaction.
         """
+        await self._settle_auto_defer()
+
         if self._has_created_response or self._has_deferred_response:
             raise InteractionAlreadyAcknowledgedError(
                 "You cannot use this method after already responding to an interaction."
@@ -321,6 +554,8 @@ class Context(InteractionContext):
         Returns:
             The message if `ensure_message` is `True` and a message builder was passed.
         """
+        await self._settle_auto_defer()
+
         if self._has_created_response or self._has_deferred_response:
             raise InteractionAlreadyAcknowledgedError(
                 "This method cannot be used after already responding to an interaction."
@@ -353,7 +588,7 @@ class Context(InteractionContext):
         self._has_created_response = True
 
         if ensure_message and isinstance(builder, InteractionMessageBuilder):
-            return await self.app.rest.fetch_interaction_response(self.application_id, self.token)
+            return await self.response_message
         return None
 
     async def edit(
@@ -411,20 +646,23 @@ class Context(InteractionContext):
                 If `True`, all mentioned roles will be sent a notification. If
                 a list of roles is provided, only those roles will be mentioned.
         """
-        return await self.app.rest.edit_interaction_response(
-            application=self.application_id,
-            token=self.token,
-            content=content,
-            attachment=attachment,
-            attachments=attachments,
-            component=component,
-            components=components,
-            embed=embed,
-            embeds=embeds,
-            mentions_everyone=mentions_everyone,
-            user_mentions=user_mentions,
-            role_mentions=role_mentions,
-        )
+        with span(self.client.tracer, "crescent.edit"):
+            message = await self.app.rest.edit_interaction_response(
+                application=self.application_id,
+                token=self.token,
+                content=content,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
+        self.response_message.set(message)
+        return message
 
     async def followup(
         self,
@@ -440,20 +678,21 @@ class Context(InteractionContext):
         user_mentions: UndefinedOr[SnowflakeishSequence[PartialUser] | bool] = UNDEFINED,
         role_mentions: UndefinedOr[SnowflakeishSequence[PartialRole] | bool] = UNDEFINED,
     ) -> Message:
-        return await self.app.rest.execute_webhook(
-            webhook=self.application_id,
-            token=self.token,
-            content=content,
-            attachment=attachment,
-            attachments=attachments,
-            component=component,
-            components=components,
-            embed=embed,
-            embeds=embeds,
-            mentions_everyone=mentions_everyone,
-            user_mentions=user_mentions,
-            role_mentions=role_mentions,
-        )
+        with span(self.client.tracer, "crescent.followup"):
+            return await self.app.rest.execute_webhook(
+                webhook=self.application_id,
+                token=self.token,
+                content=content,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
 
     async def delete(self) -> None:
         """
@@ -471,6 +710,9 @@ class Context(InteractionContext):
             await ctx.delete()
         ```
         """
-        await self.app.rest.delete_interaction_response(
-            application=self.application_id, token=self.token
-        )
+        with span(self.client.tracer, "crescent.delete"):
+            await self.app.rest.delete_interaction_response(
+                application=self.application_id, token=self.token
+            )
+        if self._response_message is not None:
+            self._response_message.invalidate()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from asyncio import Future, get_running_loop, sleep
+from collections import deque
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from hikari import UNDEFINED, RateLimitTooLongError
+
+from crescent.utils import create_task
+
+if TYPE_CHECKING:
+    from asyncio import Task
+    from typing import Any, Awaitable, Callable, Sequence
+
+    from hikari import Message, UndefinedNoneOr
+
+    from crescent.context.context import Context
+
+__all__: Sequence[str] = ("CoalescingEditor",)
+
+_EXCLUSIVE: dict[str, str] = {
+    "attachment": "attachments",
+    "attachments": "attachment",
+    "component": "components",
+    "components": "component",
+    "embed": "embeds",
+    "embeds": "embed",
+}
+"""Kwargs that can not be used together. Setting one replaces the other."""
+
+
+class CoalescingEditor:
+    """
+    Sends edits and followups for an interaction without exceeding one request every
+    `interval`. Edits made while waiting are merged, so only the latest state is
+    sent. Followups are queued and sent in order.
+
+    This is useful for commands that report progress often, because the amount of
+    requests is bounded by the interval instead of how often the command updates.
+    Use `Context.editor` to create an editor.
+
+    ### Example
+    ```python
+    @client.include
+    @crescent.command
+    async def command(ctx: crescent.Context):
+        await ctx.respond("Starting...")
+        editor = ctx.editor()
+
+        for i in range(1000):
+            await do_work(i)
+            editor.edit(f"{i / 10}% done")
+
+        editor.followup("Done!")
+        await editor.flush()
+    ```
+
+    Args:
+        ctx:
+            The context to send requests for.
+        interval:
+            The minimum amount of time between requests, in seconds.
+    """
+
+    __slots__ = ("ctx", "interval", "_edit", "_edit_futures", "_followups", "_next", "_worker")
+
+    def __init__(self, ctx: Context, interval: float) -> None:
+        self.ctx: Context = ctx
+        self.interval: float = interval
+
+        self._edit: dict[str, Any] | None = None
+        self._edit_futures: list[Future[Message]] = []
+        self._followups: deque[tuple[dict[str, Any], Future[Message]]] = deque()
+        self._next: float = 0
+        self._worker: Task[None] | None = None
+
+    def edit(self, content: UndefinedNoneOr[Any] = UNDEFINED, **kwargs: Any) -> Future[Message]:
+        """
+        Edit the initial response. Takes the same arguments as `Context.edit`.
+
+        If an edit is already waiting to be sent, the arguments are merged into it.
+
+        Returns:
+            A future that resolves to the edited message once the edit is sent.
+        """
+        if content is not UNDEFINED:
+            kwargs["content"] = content
+
+        if self._edit is None:
+            self._edit = kwargs
+        else:
+            for key in kwargs:
+                if other := _EXCLUSIVE.get(key):
+                    self._edit.pop(other, None)
+            self._edit.update(kwargs)
+
+        future: Future[Message] = get_running_loop().create_future()
+        self._edit_futures.append(future)
+        self._start()
+        return future
+
+    def followup(
+        self, content: UndefinedNoneOr[Any] = UNDEFINED, **kwargs: Any
+    ) -> Future[Message]:
+        """
+        Queue a followup message. Takes the same arguments as `Context.followup`.
+
+        Returns:
+            A future that resolves to the message once it is sent.
+        """
+        if content is not UNDEFINED:
+            kwargs["content"] = content
+
+        future: Future[Message] = get_running_loop().create_future()
+        self._followups.append((kwargs, future))
+        self._start()
+        return future
+
+    async def flush(self) -> None:
+        """Wait until every queued edit and followup is sent."""
+        if self._worker is not None:
+            await self._worker
+
+    def _start(self) -> None:
+        if self._worker is None:
+            self._worker = create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            while self._edit is not None or self._followups:
+                delay = self._next - monotonic()
+                if delay > 0:
+                    await sleep(delay)
+
+                if self._edit is not None:
+                    kwargs, futures = self._edit, self._edit_futures
+                    self._edit, self._edit_futures = None, []
+                    await self._send(self._send_edit, kwargs, futures)
+                else:
+                    kwargs, future = self._followups.popleft()
+                    await self._send(self.ctx.followup, kwargs, [future])
+
+                self._next = monotonic() + self.interval
+        finally:
+            self._worker = None
+
+    async def _send_edit(self, **kwargs: Any) -> Message:
+        message = await self.ctx.edit(**kwargs)
+        self.ctx._has_created_response = True
+        return message
+
+    @staticmethod
+    async def _send(
+        send: Callable[..., Awaitable[Message]],
+        kwargs: dict[str, Any],
+        futures: Sequence[Future[Message]],
+    ) -> None:
+        while True:
+            try:
+                message = await send(**kwargs)
+            except RateLimitTooLongError as exc:
+                # hikari gives up when the rate limit is longer than its maximum wait,
+                # but progress updates should still be sent eventually.
+                await sleep(exc.retry_after)
+                continue
+            except Exception as exc:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+
+            for future in futures:
+                if not future.done():
+                    future.set_result(message)
+            return
@@ -7,12 +7,13 @@ import hikari
 from hikari import Locale, Member, PartialInteraction, Snowflake, User
 
 if TYPE_CHECKING:
-    from asyncio import Future
+    from asyncio import Future, Task, TimerHandle
     from typing import Any, Sequence, Type, TypeVar
 
     from hikari.api import InteractionResponseBuilder
 
     from crescent.client import Client, GatewayTraits, RESTTraits
+    from crescent.context.lazy_message import LazyMessage
 
     ContextT = TypeVar("ContextT", bound="InteractionContext")
 
@@ -48,6 +49,8 @@ class InteractionContext:
         "_has_created_response",
         "_has_deferred_response",
         "_rest_interaction_future",
+        "_auto_defer",
+        "_response_message",
     )
 
     interaction: PartialInteraction
@@ -107,6 +110,14 @@ class InteractionContext:
 
     _rest_interaction_future: Future[InteractionResponseBuilder] | None
 
+    _auto_defer: TimerHandle | Task[None] | None
+    """
+    The timer that defers this interaction if no response is created in time, or the
+    task that is deferring it once the timer has fired.
+    """
+
+    _response_message: LazyMessage | None
+
     @property
     def _unset_future(self) -> Future[InteractionResponseBuilder] | None:
         """Returns the future for the response, if it exists and hasn't already been set.
@@ -147,4 +158,6 @@ class InteractionContext:
             _has_created_response=self._has_created_response,
             _has_deferred_response=self._has_deferred_response,
             _rest_interaction_future=self._rest_interaction_future,
+            _auto_defer=self._auto_defer,
+            _response_message=self._response_message,
         )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from asyncio import shield
+from typing import TYPE_CHECKING
+
+from crescent.utils import create_task
+
+if TYPE_CHECKING:
+    from asyncio import Task
+    from typing import Any, Awaitable, Callable, Generator, Sequence
+
+    from hikari import Message
+
+__all__: Sequence[str] = ("LazyMessage",)
+
+
+class LazyMessage:
+    """
+    A handle to the initial response message of an interaction. The message is only
+    fetched when the handle is awaited, and the result is reused afterwards.
+
+    When the message is already known, for example because the response was edited,
+    awaiting the handle does not make any requests. Awaiting the handle from several
+    tasks at once only fetches the message once.
+
+    ### Example
+    ```python
+    @client.include
+    @crescent.command
+    async def command(ctx: crescent.Context):
+        await ctx.respond("hello")
+
+        message = await ctx.response_message
+        print(message.id)
+    ```
+    """
+
+    __slots__ = ("_fetch", "_message", "_pending")
+
+    def __init__(self, fetch: Callable[[], Awaitable[Message]]) -> None:
+        self._fetch = fetch
+        self._message: Message | None = None
+        self._pending: Task[Message] | None = None
+
+    @property
+    def resolved(self) -> Message | None:
+        """The message, if it is already known."""
+        return self._message
+
+    def set(self, message: Message) -> None:
+        """Store a message that is already known so it does not need to be fetched."""
+        self._message = message
+
+    def invalidate(self) -> None:
+        """Forget the stored message, so the next await fetches it again."""
+        self._message = None
+
+    async def get(self) -> Message:
+        """Return the message, fetching it if it is not known."""
+        if self._message is not None:
+            return self._message
+
+        if self._pending is None:
+            self._pending = create_task(self._run_fetch())
+        return await shield(self._pending)
+
+    async def _run_fetch(self) -> Message:
+        try:
+            self._message = await self._fetch()
+            return self._message
+        finally:
+            self._pending = None
+
+    def __await__(self) -> Generator[Any, None, Message]:
+        return self.get().__await__()
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from hikari import UNDEFINED, MessageFlag, ResponseType
+from hikari.api import ComponentBuilder
+from hikari.impl import InteractionMessageBuilder
+
+if TYPE_CHECKING:
+    from typing import Sequence
+
+    from hikari import (
+        ComponentType,
+        Embed,
+        PartialRole,
+        PartialUser,
+        SnowflakeishSequence,
+        UndefinedOr,
+        UndefinedType,
+    )
+    from hikari.api import EntityFactory
+    from hikari.files import Resource
+
+__all__: Sequence[str] = ("ResponseTemplate",)
+
+
+class _PrebuiltComponent(ComponentBuilder):
+    """A component that is built once and reused for every response."""
+
+    __slots__ = ("_builder", "_built")
+
+    def __init__(self, builder: ComponentBuilder) -> None:
+        self._builder = builder
+        self._built: Any = builder.build()
+
+    @property
+    def type(self) -> int | ComponentType:
+        return self._builder.type
+
+    @property
+    def id(self) -> UndefinedOr[int]:
+        return getattr(self._builder, "id", UNDEFINED)
+
+    def build(self) -> Any:
+        return self._built
+
+
+class _TemplateMessageBuilder(InteractionMessageBuilder):
+    """
+    A message builder that copies the template's serialized payload and only sets the
+    content, instead of serializing every field.
+    """
+
+    __slots__ = ("_template",)
+
+    _template: ResponseTemplate
+
+    def build(self, entity_factory: EntityFactory, /) -> Any:
+        payload, attachments = self._template._build_static(entity_factory)
+        data = dict(payload["data"])
+        if self.content is not UNDEFINED:
+            data["content"] = self.content
+        return {"type": payload["type"], "data": data}, attachments
+
+
+class ResponseTemplate:
+    """
+    A response whose static parts are built once and reused. Components are built when
+    the template is created, and with a REST bot the whole response payload is
+    serialized the first time the template is used. Each response only fills in the
+    content.
+
+    ### Example
+    ```python
+    import crescent
+    import hikari
+
+    HELP = crescent.ResponseTemplate(
+        embed=hikari.Embed(title="Help", description="..."),
+        components=[...],
+        ephemeral=True,
+    )
+
+    @client.include
+    @crescent.command
+    async def help(ctx: crescent.Context):
+        await ctx.respond_with_template(HELP, f"Hello {ctx.user.mention}!")
+    ```
+
+    Args:
+        content:
+            The content to send if none is passed when responding.
+        ephemeral:
+            Send the initial response as ephemeral if set to true.
+        flags:
+            Message flags to send with the initial response.
+        tts:
+            If true, send a text to speech message.
+        component:
+            A single component to send.
+        components:
+            A list of components to send.
+        embed:
+            A single embed to send.
+        embeds:
+            A list of embeds to send.
+        mentions_everyone:
+            Allow `@everyone` and `@here` to ping users if set to `True`.
+        user_mentions:
+            If `True`, all mentioned users will be sent a notification. If
+            a list of users is provided, only those users will be mentioned.
+        role_mentions:
+            If `True`, all mentioned roles will be sent a notification. If
+            a list of roles is provided, only those roles will be mentioned.
+    """
+
+    __slots__ = ("content", "flags", "tts", "_message_kwargs", "_create_kwargs", "_static")
+
+    def __init__(
+        self,
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        ephemeral: bool = False,
+        flags: int | MessageFlag | UndefinedType = UNDEFINED,
+        tts: UndefinedOr[bool] = UNDEFINED,
+        component: UndefinedOr[ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[ComponentBuilder]] = UNDEFINED,
+        embed: UndefinedOr[Embed] = UNDEFINED,
+        embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+        mentions_everyone: UndefinedOr[bool] = UNDEFINED,
+        user_mentions: UndefinedOr[SnowflakeishSequence[PartialUser] | bool] = UNDEFINED,
+        role_mentions: UndefinedOr[SnowflakeishSequence[PartialRole] | bool] = UNDEFINED,
+    ) -> None:
+        if ephemeral:
+            if flags is UNDEFINED:
+                flags = MessageFlag.EPHEMERAL
+            else:
+                flags |= MessageFlag.EPHEMERAL
+
+        all_components = [*(components or ()), *([component] if component else ())]
+        all_embeds = [*(embeds or ()), *([embed] if embed else ())]
+
+        self.content: UndefinedOr[Any] = content
+        self.flags: int | MessageFlag | UndefinedType = flags
+        self.tts: UndefinedOr[bool] = tts
+
+        self._message_kwargs: dict[str, Any] = dict(
+            components=[_PrebuiltComponent(c) for c in all_components] or UNDEFINED,
+            embeds=all_embeds or UNDEFINED,
+            mentions_everyone=mentions_everyone,
+            user_mentions=user_mentions,
+            role_mentions=role_mentions,
+        )
+        """The kwargs used for edits and followups."""
+        self._create_kwargs: dict[str, Any] = dict(self._message_kwargs, flags=flags, tts=tts)
+        """The kwargs used to create the initial response."""
+
+        self._static: tuple[EntityFactory, dict[str, Any], Sequence[Resource[Any]]] | None = None
+
+    def _build_static(
+        self, entity_factory: EntityFactory
+    ) -> tuple[dict[str, Any], Sequence[Resource[Any]]]:
+        if self._static is None or self._static[0] is not entity_factory:
+            builder = InteractionMessageBuilder(
+                ResponseType.MESSAGE_CREATE,
+                flags=self.flags,
+                is_tts=self.tts,
+                mentions_everyone=self._message_kwargs["mentions_everyone"],
+                user_mentions=self._message_kwargs["user_mentions"],
+                role_mentions=self._message_kwargs["role_mentions"],
+            )
+            for c in self._message_kwargs["components"] or ():
+                builder.add_component(c)
+            for e in self._message_kwargs["embeds"] or ():
+                builder.add_embed(e)
+
+            payload, attachments = builder.build(entity_factory)
+            self._static = (entity_factory, dict(payload), attachments)
+
+        return self._static[1], self._static[2]
+
+    def _builder(self, content: UndefinedOr[Any]) -> InteractionMessageBuilder:
+        """Returns a builder for a REST bot's initial response."""
+        builder = _TemplateMessageBuilder(ResponseType.MESSAGE_CREATE, content)
+        builder._template = self
+        return builder
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from functools import partial
 from inspect import iscoroutinefunction
 from typing import TYPE_CHECKING, Generic, TypeVar, get_type_hints, overload
@@ -11,6 +11,7 @@ from crescent.internal.includable import Includable
 from crescent.typedefs import EventHookCallbackT
 from crescent.utils import add_hooks
 from crescent.utils.options import unwrap
+from crescent.watchdog import watch
 
 if TYPE_CHECKING:
     from typing import Any, Callable, Coroutine, Sequence
@@ -23,16 +24,18 @@ EventT = TypeVar("EventT", bound="Event", contravariant=True)
 __all__: Sequence[str] = ("event",)
 
 
-@dataclass
+@dataclass(slots=True)
 class EventMeta(Generic[EventT]):
     callback: CallbackT[EventT]
-    hooks: list[EventHookCallbackT[EventT]] = field(default_factory=list)  # pyright: ignore[reportUnknownVariableType]
-    after_hooks: list[EventHookCallbackT[EventT]] = field(default_factory=list)  # pyright: ignore[reportUnknownVariableType]
+    hooks: Sequence[EventHookCallbackT[EventT]] = ()
+    after_hooks: Sequence[EventHookCallbackT[EventT]] = ()
 
     def add_hooks(
         self, hooks: Sequence[EventHookCallbackT[Any]], prepend: bool = False, *, after: bool
     ) -> None:
-        add_hooks(self.hooks, self.after_hooks, hooks, prepend=prepend, after=after)
+        self.hooks, self.after_hooks = add_hooks(
+            self.hooks, self.after_hooks, hooks, prepend=prepend, after=after
+        )
 
 
 @overload
@@ -112,18 +115,19 @@ def _event_callback(
     self: Includable[EventMeta[Any]],
 ) -> Callable[[Event], Coroutine[None, None, None]]:
     async def func(event: Event) -> None:
-        try:
-            for callback in self.metadata.hooks:
-                res = await callback(event)
-                if res and res.exit is True:
-                    return
-            await self.metadata.callback(event)
-            for callback in self.metadata.after_hooks:
-                res = await callback(event)
-                if res and res.exit is True:
-                    return
-        except Exception as exc:
-            handled = await self.client._event_error_handler.try_handle(exc, [exc, event])
-            await self.client.on_crescent_event_error(exc, event, handled)
+        with watch(self.client.watchdog, type(event)):
+            try:
+                for callback in self.metadata.hooks:
+                    res = await callback(event)
+                    if res and res.exit is True:
+                        return
+                await self.metadata.callback(event)
+                for callback in self.metadata.after_hooks:
+                    res = await callback(event)
+                    if res and res.exit is True:
+                        return
+            except Exception as exc:
+                handled = await self.client._event_error_handler.try_handle(exc, [exc, event])
+                await self.client.on_crescent_event_error(exc, event, handled)
 
     return func
@@ -1,17 +1,50 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, Awaitable, Callable, Optional
+from itertools import count
+from typing import Any, Awaitable, Callable, Hashable, Optional
 
 from hikari import Snowflake
 
 from crescent import Context, HookResult
-
-__all__ = ("CooldownCallbackT", "BucketCallbackT", "cooldown")
+from crescent.ext.cooldowns.kv import (
+    KVBackend,
+    KVStorage,
+    LeaseBucket,
+    LeaseGrant,
+    LeaseRequest,
+    MemoryKVBackend,
+)
+from crescent.ext.cooldowns.mapping import CooldownMapping, CooldownStats
+from crescent.ext.cooldowns.shared import SharedMemoryStorage
+from crescent.ext.cooldowns.storage import Bucket, CooldownStorage, MemoryStorage
+
+__all__ = (
+    "CooldownCallbackT",
+    "BucketCallbackT",
+    "cooldown",
+    "composite_cooldown",
+    "Limit",
+    "Bucket",
+    "CooldownMapping",
+    "CooldownStats",
+    "CooldownStorage",
+    "MemoryStorage",
+    "SharedMemoryStorage",
+    "KVStorage",
+    "KVBackend",
+    "LeaseBucket",
+    "LeaseRequest",
+    "LeaseGrant",
+    "MemoryKVBackend",
+)
 
 CooldownCallbackT = Callable[[Context, timedelta], Awaitable[Optional[HookResult]]]
 BucketCallbackT = Callable[[Context], Any]
 
+_cooldown_ids = count()
+
 
 def _default_bucket(ctx: Context) -> Snowflake:
     return ctx.user.id
@@ -28,12 +61,34 @@ async def _default_callback(ctx: Context, retry: timedelta) -> None:
     )
 
 
+@dataclass(frozen=True)
+class Limit:
+    """
+    One dimension of a `composite_cooldown`.
+
+    Args:
+        capacity:
+            The amount of times the command can be used within the period.
+        period:
+            The period of time between cooldown resets.
+        bucket:
+            Callback that returns a key for a bucket.
+    """
+
+    capacity: int
+    period: timedelta
+    bucket: BucketCallbackT = _default_bucket
+
+
 def cooldown(
     capacity: int,
     period: timedelta,
     *,
     callback: CooldownCallbackT = _default_callback,
     bucket: BucketCallbackT = _default_bucket,
+    max_buckets: int | None = None,
+    storage: CooldownStorage | None = None,
+    name: Hashable | None = None,
 ) -> Callable[[Context], Awaitable[HookResult | None]]:
     """
     Ratelimit implementation using a sliding window.
@@ -47,21 +102,98 @@ def cooldown(
             Callback for when a user is ratelimited.
         bucket:
             Callback that returns a key for a bucket.
+        max_buckets:
+            The maximum amount of buckets to keep in memory. When this is reached,
+            the least recently used bucket is dropped. If `None`, the amount of
+            buckets is not limited. Idle buckets are always removed. Only used
+            when `storage` is not provided.
+        storage:
+            Where to store the buckets. Defaults to a `MemoryStorage` that is only
+            used by this cooldown. Use `SharedMemoryStorage` or `KVStorage` to share
+            cooldowns between processes.
+        name:
+            A name that separates this cooldown's buckets from other cooldowns that
+            use the same storage. If not provided, a name is generated from the order
+            cooldowns are created in, which is only the same in every process if every
+            process creates its cooldowns in the same order.
     """
+    return composite_cooldown(
+        Limit(capacity, period, bucket),
+        callback=callback,
+        max_buckets=max_buckets,
+        storage=storage,
+        name=name,
+    )
+
 
-    try:
-        from floodgate import FixedMapping
-    except ImportError:
-        raise ModuleNotFoundError(
-            "`hikari-crescent[cooldowns]` must be installed to use `crescent.ext.cooldowns`."
+def composite_cooldown(
+    *limits: Limit,
+    callback: CooldownCallbackT = _default_callback,
+    max_buckets: int | None = None,
+    storage: CooldownStorage | None = None,
+    name: Hashable | None = None,
+) -> Callable[[Context], Awaitable[HookResult | None]]:
+    """
+    Check several cooldowns at once. The command is only used up in a bucket if
+    every limit allows it, and the callback receives the longest time to wait.
+
+    Stacking `cooldown` hooks instead would use up the earlier buckets even when a
+    later one rejects the command.
+
+    ### Example
+    ```python
+    from crescent.ext import cooldowns
+
+    @client.include
+    @crescent.hook(
+        cooldowns.composite_cooldown(
+            # Each user can use the command 3 times in 20 seconds...
+            cooldowns.Limit(3, datetime.timedelta(seconds=20)),
+            # ...and each guild can use it 20 times a minute.
+            cooldowns.Limit(
+                20, datetime.timedelta(minutes=1), bucket=lambda ctx: ctx.guild_id
+            ),
         )
+    )
+    @crescent.command
+    async def my_command(ctx: crescent.Context) -> None:
+        await ctx.respond("Hello!")
+    ```
+
+    Args:
+        limits:
+            The limits to check.
+        callback:
+            Callback for when a user is ratelimited.
+        max_buckets:
+            See `cooldown`.
+        storage:
+            See `cooldown`. Every limit is checked in the same storage.
+        name:
+            See `cooldown`.
+    """
+    if not limits:
+        raise ValueError("At least one `Limit` must be provided.")
 
-    cooldown: FixedMapping[Any] = FixedMapping(period=period, capacity=capacity)
+    if storage is None:
+        storage = MemoryStorage(max_buckets=max_buckets)
+    elif max_buckets is not None:
+        raise ValueError("`max_buckets` can not be used with a custom `storage`.")
+
+    if name is None:
+        name = f"cooldown-{next(_cooldown_ids)}"
+
+    scopes = [(name, index, limit) for index, limit in enumerate(limits)]
 
     async def inner(ctx: Context) -> HookResult | None:
-        retry_after = cooldown.trigger(bucket(ctx))
+        retry_after = await storage.trigger_all(
+            [
+                Bucket((scope, index, limit.bucket(ctx)), limit.capacity, limit.period)
+                for scope, index, limit in scopes
+            ]
+        )
 
-        if not retry_after:
+        if retry_after is None:
             return None
 
         await callback(ctx, retry_after)
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from asyncio import Future, get_running_loop
+from dataclasses import dataclass
+from datetime import timedelta
+from math import floor
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from crescent.ext.cooldowns.storage import Bucket, CooldownStorage, _stable_key
+from crescent.utils import create_task
+
+if TYPE_CHECKING:
+    from typing import Sequence
+
+__all__: Sequence[str] = (
+    "KVStorage",
+    "KVBackend",
+    "LeaseBucket",
+    "LeaseRequest",
+    "LeaseGrant",
+    "MemoryKVBackend",
+)
+
+
+@dataclass(frozen=True)
+class LeaseBucket:
+    """A bucket stored by a `KVBackend`."""
+
+    key: str
+    """The key of the bucket."""
+    capacity: int
+    """The amount of times the bucket can be triggered within the period."""
+    period: float
+    """The length of the sliding window, in seconds."""
+
+
+@dataclass(frozen=True)
+class LeaseRequest:
+    """
+    A request for triggers from a group of buckets stored by a `KVBackend`. Every
+    token granted is one trigger of every bucket in the group.
+    """
+
+    buckets: Sequence[LeaseBucket]
+    """The buckets to trigger together."""
+    tokens: int
+    """The maximum amount of triggers to take from the buckets."""
+
+
+@dataclass(frozen=True)
+class LeaseGrant:
+    """The result of a `LeaseRequest`."""
+
+    tokens: int
+    """The amount of triggers that were taken from every bucket. This may be `0`."""
+    retry_after: float
+    """If no triggers were taken, how long until every bucket can be triggered, in seconds."""
+
+
+class KVBackend(ABC):
+    """
+    A connection to a key-value store, such as Redis, that stores buckets for
+    `KVStorage`.
+
+    `acquire` must be atomic for each request: a request takes the same amount of
+    triggers from every one of its buckets. With Redis, this would normally be a Lua
+    script that runs the generic cell rate algorithm for every request in a single
+    `EVALSHA` call. `MemoryKVBackend` can be used as a reference implementation.
+    """
+
+    @abstractmethod
+    async def acquire(self, requests: Sequence[LeaseRequest]) -> Sequence[LeaseGrant]:
+        """
+        Take triggers from buckets. All of the requests are sent in one round trip.
+
+        Returns:
+            A grant for each request, in the same order as `requests`.
+        """
+
+
+class MemoryKVBackend(KVBackend):
+    """
+    A `KVBackend` that stores buckets in memory. This is useful for testing and as a
+    reference for implementing `KVBackend`.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: dict[str, float] = {}
+        self.round_trips: int = 0
+        """The amount of times `acquire` was called."""
+
+    async def acquire(self, requests: Sequence[LeaseRequest]) -> Sequence[LeaseGrant]:
+        self.round_trips += 1
+        now = monotonic()
+        grants: list[LeaseGrant] = []
+
+        for request in requests:
+            tokens = request.tokens
+            retry_after = 0.0
+
+            for bucket in request.buckets:
+                emission = bucket.period / bucket.capacity
+                tat = max(self.buckets.get(bucket.key, now), now)
+
+                available = floor((now + bucket.period - tat) / emission + 1e-9)
+                tokens = min(tokens, available)
+                retry_after = max(retry_after, tat + emission - bucket.period - now)
+
+            if tokens <= 0:
+                grants.append(LeaseGrant(0, retry_after))
+                continue
+
+            for bucket in request.buckets:
+                tat = max(self.buckets.get(bucket.key, now), now)
+                self.buckets[bucket.key] = tat + tokens * bucket.period / bucket.capacity
+            grants.append(LeaseGrant(tokens, 0))
+
+        return grants
+
+
+class _Lease:
+    __slots__ = ("tokens", "expires", "blocked_until")
+
+    def __init__(self, tokens: int, expires: float, blocked_until: float) -> None:
+        self.tokens = tokens
+        self.expires = expires
+        self.blocked_until = blocked_until
+
+
+class KVStorage(CooldownStorage):
+    """
+    Stores buckets in a key-value store so cooldowns are enforced across every
+    process and host that uses the same store.
+
+    To avoid a round trip for every command:
+
+    - Every trigger requested in the same event loop iteration is sent to the store
+    in one `KVBackend.acquire` call.
+    - Up to `lease_size` triggers are taken from a bucket at once and used locally
+    until `lease_ttl` has passed. Unused triggers are discarded, so a lease can make
+    a cooldown stricter but never more lenient than configured.
+    - When a bucket is rate limited, the retry time is cached locally so further
+    triggers are rejected without contacting the store.
+
+    Args:
+        backend:
+            The connection to the key-value store.
+        lease_size:
+            The maximum amount of triggers to take from the store at once.
+        lease_ttl:
+            How long leased triggers can be used for.
+        prefix:
+            A string added to the start of every key.
+    """
+
+    def __init__(
+        self,
+        backend: KVBackend,
+        *,
+        lease_size: int = 1,
+        lease_ttl: timedelta = timedelta(seconds=1),
+        prefix: str = "crescent:cooldown:",
+    ) -> None:
+        if lease_size < 1:
+            raise ValueError("`lease_size` must be at least 1.")
+
+        self.backend: KVBackend = backend
+        self.lease_size: int = lease_size
+        self.lease_ttl: float = lease_ttl.total_seconds()
+        self.prefix: str = prefix
+
+        self._leases: dict[tuple[LeaseBucket, ...], _Lease] = {}
+        self._pending: dict[tuple[LeaseBucket, ...], list[Future[timedelta | None]]] = {}
+        self._flush_scheduled: bool = False
+        self._next_prune: float = 0.0
+
+    async def trigger_all(self, buckets: Sequence[Bucket]) -> timedelta | None:
+        group = tuple(
+            LeaseBucket(
+                key=self.prefix + _stable_key(bucket).hex(),
+                capacity=bucket.capacity,
+                period=bucket.period.total_seconds(),
+            )
+            for bucket in buckets
+        )
+        now = monotonic()
+
+        if lease := self._leases.get(group):
+            if lease.blocked_until > now:
+                return timedelta(seconds=lease.blocked_until - now)
+            if lease.tokens > 0 and lease.expires > now:
+                lease.tokens -= 1
+                return None
+            del self._leases[group]
+
+        future: Future[timedelta | None] = get_running_loop().create_future()
+        self._pending.setdefault(group, []).append(future)
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            get_running_loop().call_soon(self._schedule_flush)
+
+        return await future
+
+    def _schedule_flush(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        create_task(self._flush(pending))
+
+    async def _flush(
+        self, pending: dict[tuple[LeaseBucket, ...], list[Future[timedelta | None]]]
+    ) -> None:
+        groups = list(pending)
+        requests = [
+            LeaseRequest(buckets=group, tokens=len(pending[group]) + self.lease_size - 1)
+            for group in groups
+        ]
+
+        try:
+            grants = await self.backend.acquire(requests)
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        now = monotonic()
+        if now >= self._next_prune:
+            self._prune(now)
+
+        for group, grant in zip(groups, grants):
+            futures = pending[group]
+            tokens = grant.tokens
+            # If the grant did not cover every waiter a bucket is empty, so the next
+            # trigger will be available in at most one emission interval.
+            retry_after = grant.retry_after or max(
+                bucket.period / bucket.capacity for bucket in group
+            )
+
+            for future in futures:
+                if future.done():
+                    continue
+                if tokens > 0:
+                    tokens -= 1
+                    future.set_result(None)
+                else:
+                    future.set_result(timedelta(seconds=retry_after))
+
+            if grant.tokens < len(futures):
+                self._leases[group] = _Lease(0, 0, now + retry_after)
+            elif tokens > 0:
+                self._leases[group] = _Lease(tokens, now + self.lease_ttl, 0)
+
+    def _prune(self, now: float) -> None:
+        """Remove the leases that expired. This runs at most once every `lease_ttl`."""
+        self._next_prune = now + self.lease_ttl
+        self._leases = {
+            group: lease
+            for group, lease in self._leases.items()
+            if lease.expires > now or lease.blocked_until > now
+        }
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from math import floor
+from time import monotonic
+from typing import Generic, Hashable, Sequence, TypeVar
+
+__all__: Sequence[str] = ("CooldownMapping", "CooldownStats")
+
+K = TypeVar("K", bound=Hashable)
+
+
+@dataclass
+class CooldownStats:
+    """Counters describing the work a `CooldownMapping` has done."""
+
+    triggers: int = 0
+    """The amount of triggers that were allowed."""
+    rejections: int = 0
+    """The amount of triggers that were rate limited."""
+    evictions: int = 0
+    """The amount of buckets removed because `max_buckets` was reached."""
+    swept: int = 0
+    """The amount of idle buckets removed by sweeping."""
+
+
+class _BucketTable(Generic[K]):
+    """
+    Stores the theoretical arrival time of every bucket. Buckets are kept in least
+    recently used order so the oldest bucket can be evicted when `max_buckets` is
+    reached.
+    """
+
+    __slots__ = ("max_buckets", "stats", "_sweep_interval", "_next_sweep", "_buckets")
+
+    def __init__(self, *, max_buckets: int | None, sweep_interval: timedelta) -> None:
+        if max_buckets is not None and max_buckets < 1:
+            raise ValueError("`max_buckets` must be at least 1.")
+
+        self.max_buckets: int | None = max_buckets
+        self.stats: CooldownStats = CooldownStats()
+
+        self._sweep_interval: float = sweep_interval.total_seconds()
+        self._next_sweep: float = monotonic() + self._sweep_interval
+        self._buckets: OrderedDict[K, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _insert(self, key: K, tat: float) -> None:
+        buckets = self._buckets
+        if key not in buckets:
+            if self.max_buckets is not None and len(buckets) >= self.max_buckets:
+                buckets.popitem(last=False)
+                self.stats.evictions += 1
+        else:
+            buckets.move_to_end(key)
+        buckets[key] = tat
+
+    def acquire(self, requests: Sequence[tuple[K, float, float]]) -> float | None:
+        """
+        Trigger several buckets at once. Either every bucket is triggered or none of
+        them are.
+
+        Args:
+            requests:
+                A sequence of `(key, emission interval, period)` tuples, with the
+                emission interval and period in seconds.
+
+        Returns:
+            `None` if every bucket was triggered, otherwise the longest time to wait,
+            in seconds.
+        """
+        now = monotonic()
+        if now >= self._next_sweep:
+            self.sweep(now)
+
+        buckets = self._buckets
+        new_tats: dict[K, float] = {}
+        longest_wait = 0.0
+
+        for key, emission, period in requests:
+            tat = new_tats.get(key)
+            if tat is None:
+                tat = buckets.get(key, now)
+            if tat < now:
+                tat = now
+            tat += emission
+
+            wait = tat - period - now
+            if wait > longest_wait:
+                longest_wait = wait
+            new_tats[key] = tat
+
+        if longest_wait > 0:
+            for key in new_tats:
+                if key in buckets:
+                    buckets.move_to_end(key)
+            self.stats.rejections += 1
+            return longest_wait
+
+        for key, tat in new_tats.items():
+            self._insert(key, tat)
+        self.stats.triggers += 1
+        return None
+
+    def reset(self, key: K) -> None:
+        """Reset a bucket so all of its triggers are available."""
+        self._buckets.pop(key, None)
+
+    def sweep(self, now: float | None = None) -> int:
+        """
+        Remove every bucket that has all of its triggers available. This is done
+        automatically every `sweep_interval`.
+
+        Returns:
+            The amount of buckets that were removed.
+        """
+        if now is None:
+            now = monotonic()
+
+        idle = [key for key, tat in self._buckets.items() if tat <= now]
+        for key in idle:
+            del self._buckets[key]
+
+        self._next_sweep = now + self._sweep_interval
+        self.stats.swept += len(idle)
+        return len(idle)
+
+
+class CooldownMapping(_BucketTable[K]):
+    """
+    A key-based sliding window cooldown implemented with the generic cell rate
+    algorithm (GCRA).
+
+    Each bucket is stored as a single float, the "theoretical arrival time" of
+    the next trigger. A bucket whose theoretical arrival time is in the past has
+    all of its triggers available, so it can be removed without changing any
+    results. These idle buckets are swept every `sweep_interval`.
+
+    ### Example
+    ```python
+    from datetime import timedelta
+    from crescent.ext.cooldowns import CooldownMapping
+
+    mapping = CooldownMapping(capacity=2, period=timedelta(seconds=10))
+
+    assert mapping.trigger("key") is None
+    assert mapping.trigger("key") is None
+    assert mapping.trigger("key") is not None  # Retry after ~5 seconds.
+    ```
+
+    Args:
+        capacity:
+            The amount of times a bucket can be triggered within the period.
+        period:
+            The length of the sliding window.
+        max_buckets:
+            The maximum amount of buckets to store. When this is reached the least
+            recently used bucket is removed. If `None`, the amount of buckets is not
+            limited.
+        sweep_interval:
+            How often idle buckets are removed. Defaults to `period`.
+    """
+
+    __slots__ = ("capacity", "period", "_emission", "_period")
+
+    def __init__(
+        self,
+        capacity: int,
+        period: timedelta,
+        *,
+        max_buckets: int | None = None,
+        sweep_interval: timedelta | None = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("`capacity` must be at least 1.")
+        if period <= timedelta():
+            raise ValueError("`period` must be longer than 0 seconds.")
+
+        super().__init__(max_buckets=max_buckets, sweep_interval=sweep_interval or period)
+
+        self.capacity: int = capacity
+        self.period: timedelta = period
+
+        self._period: float = period.total_seconds()
+        self._emission: float = self._period / capacity
+
+    def trigger(self, key: K) -> timedelta | None:
+        """
+        Trigger the cooldown for a bucket.
+
+        Returns:
+            `None` if the trigger was allowed, otherwise how long to wait until the
+            bucket can be triggered again.
+        """
+        now = monotonic()
+        if now >= self._next_sweep:
+            self.sweep(now)
+
+        buckets = self._buckets
+        tat = buckets.get(key)
+
+        if tat is None:
+            if self.max_buckets is not None and len(buckets) >= self.max_buckets:
+                buckets.popitem(last=False)
+                self.stats.evictions += 1
+            buckets[key] = now + self._emission
+            self.stats.triggers += 1
+            return None
+
+        if tat < now:
+            tat = now
+        tat += self._emission
+        wait = tat - self._period - now
+
+        buckets.move_to_end(key)
+        if wait > 0:
+            self.stats.rejections += 1
+            return timedelta(seconds=wait)
+
+        buckets[key] = tat
+        self.stats.triggers += 1
+        return None
+
+    def retry_after(self, key: K) -> timedelta | None:
+        """
+        Returns how long to wait until a bucket can be triggered, or `None` if it can
+        be triggered now. This does not trigger the bucket.
+        """
+        tat = self._buckets.get(key)
+        if tat is None:
+            return None
+
+        wait = tat + self._emission - self._period - monotonic()
+        if wait <= 0:
+            return None
+        return timedelta(seconds=wait)
+
+    def tokens(self, key: K) -> int:
+        """Returns the amount of times a bucket can be triggered right now."""
+        tat = self._buckets.get(key)
+        if tat is None:
+            return self.capacity
+
+        now = monotonic()
+        return min(self.capacity, floor((now + self._period - max(tat, now)) / self._emission))
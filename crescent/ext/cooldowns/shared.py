@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+from asyncio import sleep
+from datetime import timedelta
+from mmap import mmap
+from struct import Struct
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from crescent.ext.cooldowns.storage import Bucket, CooldownStorage, _stable_key
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Sequence
+
+__all__: Sequence[str] = ("SharedMemoryStorage",)
+
+# A slot is the 8 byte digest of a bucket key followed by the bucket's theoretical
+# arrival time. A digest of all zeros marks an empty slot.
+_SLOT = Struct("<8sd")
+_EMPTY = bytes(8)
+
+_LOCK_RETRY_DELAY = 0.0005
+"""The first delay before retrying to lock the file, in seconds. Doubles every try."""
+_LOCK_MAX_RETRY_DELAY = 0.01
+
+
+class SharedMemoryStorage(CooldownStorage):
+    """
+    Stores buckets in a memory mapped file so every process on the same host shares
+    the same cooldowns. This is useful when a bot is split into multiple processes,
+    for example one per group of shards.
+
+    The file is a fixed size hash table. When every slot a key can be stored in is
+    in use, the slot that will become idle soonest is reused.
+
+    > ⚠️ This storage is only available on platforms with `fcntl`, which is used to
+    > lock the file between processes.
+
+    ### Example
+    ```python
+    from crescent.ext import cooldowns
+
+    storage = cooldowns.SharedMemoryStorage("/tmp/my-bot-cooldowns")
+
+    @client.include
+    @crescent.hook(
+        cooldowns.cooldown(3, datetime.timedelta(seconds=20), storage=storage, name="ping")
+    )
+    @crescent.command
+    async def ping(ctx: crescent.Context):
+        await ctx.respond("Pong")
+    ```
+
+    Args:
+        path:
+            The file to store the buckets in. Every process must use the same path.
+        slots:
+            The amount of buckets the file can hold. Every process must use the same
+            amount of slots.
+        max_probe:
+            The amount of slots to check when looking up a key.
+    """
+
+    def __init__(self, path: str | Path, *, slots: int = 65536, max_probe: int = 16) -> None:
+        try:
+            import fcntl
+        except ImportError:
+            raise ModuleNotFoundError("`SharedMemoryStorage` is not supported on this platform.")
+
+        if slots < 1:
+            raise ValueError("`slots` must be at least 1.")
+
+        self._fcntl = fcntl
+        self.slots: int = slots
+        self.max_probe: int = min(max_probe, slots)
+
+        size = slots * _SLOT.size
+        self._fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map: mmap = mmap(self._fd, size)
+
+    def close(self) -> None:
+        """Close the memory map. The file is not deleted."""
+        self._map.close()
+        os.close(self._fd)
+
+    def _find_slot(
+        self, digest: bytes, now: float, claimed: dict[int, bytes]
+    ) -> tuple[int, float | None]:
+        """
+        Returns the offset of the slot for `digest` and the slot's theoretical arrival
+        time, or `None` if the key is not stored. Slots in `claimed` are reserved for
+        other keys in the same operation.
+        """
+        start = int.from_bytes(digest, "little") % self.slots
+        free: int | None = None
+        oldest: tuple[float, int] | None = None
+
+        for i in range(self.max_probe):
+            offset = ((start + i) % self.slots) * _SLOT.size
+            slot_digest, tat = _SLOT.unpack_from(self._map, offset)
+
+            if slot_digest == digest or claimed.get(offset) == digest:
+                return offset, tat
+            if offset in claimed:
+                continue
+            if slot_digest == _EMPTY or tat <= now:
+                if free is None:
+                    free = offset
+            elif oldest is None or tat < oldest[0]:
+                oldest = (tat, offset)
+
+        if free is not None:
+            return free, None
+        if oldest is not None:
+            return oldest[1], None
+        raise ValueError("Too many buckets were triggered at once for `max_probe`.")
+
+    async def _lock(self) -> None:
+        """Lock the file without blocking the event loop while another process holds it."""
+        delay = _LOCK_RETRY_DELAY
+        while True:
+            try:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_EX | self._fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                await sleep(delay)
+                delay = min(delay * 2, _LOCK_MAX_RETRY_DELAY)
+
+    async def trigger_all(self, buckets: Sequence[Bucket]) -> timedelta | None:
+        await self._lock()
+        try:
+            now = monotonic()
+            claimed: dict[int, bytes] = {}
+            new_tats: dict[int, float] = {}
+            longest_wait = 0.0
+
+            for bucket in buckets:
+                digest = _stable_key(bucket)
+                if digest == _EMPTY:
+                    digest = b"\x01" + digest[1:]
+
+                period = bucket.period.total_seconds()
+                offset, tat = self._find_slot(digest, now, claimed)
+                tat = new_tats.get(offset, tat)
+
+                if tat is None or tat < now:
+                    tat = now
+                tat += period / bucket.capacity
+
+                longest_wait = max(longest_wait, tat - period - now)
+                claimed[offset] = digest
+                new_tats[offset] = tat
+
+            if longest_wait > 0:
+                return timedelta(seconds=longest_wait)
+
+            for offset, digest in claimed.items():
+                _SLOT.pack_into(self._map, offset, digest, new_tats[offset])
+            return None
+        finally:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
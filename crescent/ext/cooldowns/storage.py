@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any, Hashable, NamedTuple
+
+from crescent.ext.cooldowns.mapping import CooldownStats, _BucketTable
+
+if TYPE_CHECKING:
+    from typing import Sequence
+
+__all__: Sequence[str] = ("Bucket", "CooldownStorage", "MemoryStorage")
+
+
+class Bucket(NamedTuple):
+    """A bucket to trigger and the limit it is checked against."""
+
+    key: Hashable
+    """The key for the bucket. This includes the name of the cooldown."""
+    capacity: int
+    """The amount of times the bucket can be triggered within the period."""
+    period: timedelta
+    """The length of the sliding window."""
+
+
+def _stable_key(bucket: Bucket) -> bytes:
+    """
+    Returns a digest of a bucket that is the same in every process. `hash()` can not
+    be used because it is salted for strings.
+    """
+    return blake2b(
+        f"{bucket.capacity}:{bucket.period.total_seconds()}:{bucket.key!r}".encode(),
+        digest_size=8,
+    ).digest()
+
+
+class CooldownStorage(ABC):
+    """
+    The interface used by `cooldown` and `composite_cooldown` to store buckets.
+    Implement this class to store cooldowns somewhere other than the process's memory.
+    """
+
+    @abstractmethod
+    async def trigger_all(self, buckets: Sequence[Bucket]) -> timedelta | None:
+        """
+        Trigger several buckets at once. Either every bucket is triggered or none of
+        them are, so a bucket is never used up by a command that another bucket
+        rejected.
+
+        Returns:
+            `None` if every bucket was triggered, otherwise the longest time to wait
+            until every bucket can be triggered.
+        """
+
+    async def trigger(self, key: Hashable, capacity: int, period: timedelta) -> timedelta | None:
+        """
+        Trigger the cooldown for a single bucket.
+
+        Returns:
+            `None` if the trigger was allowed, otherwise how long to wait until the
+            bucket can be triggered again.
+        """
+        return await self.trigger_all((Bucket(key, capacity, period),))
+
+
+class MemoryStorage(CooldownStorage):
+    """
+    Stores buckets in the memory of the current process. This is the default storage.
+
+    Every bucket is kept in one table regardless of its limit, so checking several
+    buckets at once is a single pass over the table.
+
+    Args:
+        max_buckets:
+            The maximum amount of buckets to store. When this is reached the least
+            recently used bucket is removed. If `None`, the amount of buckets is not
+            limited.
+        sweep_interval:
+            How often buckets that have all of their triggers available are removed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_buckets: int | None = None,
+        sweep_interval: timedelta = timedelta(minutes=1),
+    ) -> None:
+        self._table: _BucketTable[Any] = _BucketTable(
+            max_buckets=max_buckets, sweep_interval=sweep_interval
+        )
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    @property
+    def stats(self) -> CooldownStats:
+        """Counters describing the work this storage has done."""
+        return self._table.stats
+
+    async def trigger_all(self, buckets: Sequence[Bucket]) -> timedelta | None:
+        wait = self._table.acquire(
+            [
+                (
+                    bucket,
+                    bucket.period.total_seconds() / bucket.capacity,
+                    bucket.period.total_seconds(),
+                )
+                for bucket in buckets
+            ]
+        )
+        if wait is None:
+            return None
+        return timedelta(seconds=wait)
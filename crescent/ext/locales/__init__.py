@@ -6,6 +6,7 @@ from typing import Sequence
 import hikari
 
 from crescent import LocaleBuilder
+from crescent.ext.locales.table import *
 
 try:
     import i18n as i18n_  # type: ignore
@@ -13,7 +14,7 @@ except ImportError:
     i18n_ = None
 
 
-__all__: Sequence[str] = ("i18n", "LocaleMap")
+__all__: Sequence[str] = ("i18n", "LocaleMap", "TranslationTable", "TableLocale")
 
 
 def _translate(key: str, *, locale: str | None = None) -> str:
@@ -24,7 +25,8 @@ class i18n(LocaleBuilder):
     """
     An implementation of `crescent.LocaleBuilder` that uses `python-i18n`.
 
-    > ⚠️ Translations must be loaded before any commands.
+    > ⚠️ Translations must be loaded before commands are registered. For bots with
+    > many translations, `TranslationTable` loads translation files directly.
 
     ```python
     import crescent
@@ -45,9 +47,16 @@ class i18n(LocaleBuilder):
             raise ModuleNotFoundError("`hikari-crescent[i18n]` must be installed to use i18n.")
 
         self._fallback = fallback
-        self.translations: dict[str, str] = {
-            locale: _translate(self._fallback, locale=locale) for locale in hikari.Locale
-        }
+        self._translations: dict[str, str] | None = None
+
+    @property
+    def translations(self) -> dict[str, str]:
+        """The translations for every locale. These are looked up the first time they are used."""
+        if self._translations is None:
+            self._translations = {
+                locale: _translate(self._fallback, locale=locale) for locale in hikari.Locale
+            }
+        return self._translations
 
     def build(self) -> dict[str, str]:
         return self.translations
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+from os import fspath
+from pathlib import Path
+from sys import intern
+from typing import TYPE_CHECKING
+
+import hikari
+
+from crescent import LocaleBuilder
+
+try:
+    import yaml  # type: ignore
+except ImportError:
+    yaml = None
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from typing import Any, Mapping, Sequence
+
+__all__: Sequence[str] = ("TranslationTable", "TableLocale")
+
+_LOCALES: frozenset[str] = frozenset(locale.value for locale in hikari.Locale)
+_SUFFIXES: frozenset[str] = frozenset((".json", ".yml", ".yaml"))
+
+
+def _flatten(data: Mapping[str, Any], prefix: str, out: dict[str, str]) -> None:
+    for key, value in data.items():
+        if isinstance(value, dict):
+            _flatten(value, f"{prefix}{key}.", out)  # pyright: ignore[reportUnknownArgumentType]
+        else:
+            out[intern(f"{prefix}{key}")] = str(value)
+
+
+def _read_file(path: Path) -> dict[str, str]:
+    with path.open(encoding="utf-8") as f:
+        if path.suffix == ".json":
+            data = json.load(f)
+        elif yaml is None:
+            raise ModuleNotFoundError(
+                "`hikari-crescent[yaml]` must be installed to load YAML translations."
+            )
+        else:
+            data = yaml.safe_load(f) or {}
+
+    out: dict[str, str] = {}
+    _flatten(data, "", out)
+    return out
+
+
+class TableLocale(LocaleBuilder):
+    """
+    A `crescent.LocaleBuilder` that reads its locales from a `TranslationTable`.
+    Create these with `TranslationTable.__call__`.
+    """
+
+    def __init__(self, table: TranslationTable, key: str) -> None:
+        self.table: TranslationTable = table
+        self.key: str = key
+
+    def build(self) -> Mapping[str, str]:
+        return self.table._row(self.key)
+
+    @property
+    def fallback(self) -> str:
+        return self.table._fallback(self.key)
+
+
+class TranslationTable:
+    """
+    Loads translation files once into a table of keys and locales. Builders created
+    from the table only read it when the command is built, so translations can be
+    loaded after commands are defined.
+
+    Every file is named after the locale it contains, for example `en-US.json` or
+    `fr.yaml`. Nested keys are joined with a `.`. YAML files require `pyyaml`.
+
+    For example, `locales/fr.json` could contain:
+
+    ```json
+    {"ping": {"name": "ping", "description": "Envoyer un ping au bot"}}
+    ```
+
+    ```python
+    import crescent
+    from crescent.ext import locales
+
+    translations = locales.TranslationTable("locales", fallback_locale="en-US")
+
+    @bot.include
+    @crescent.command(
+        name=translations("ping.name"), description=translations("ping.description")
+    )
+    async def ping(ctx: crescent.Context):
+        ...
+    ```
+
+    Calling `TranslationTable.load` again reloads the files. The localizations of
+    every command that uses the table are updated in place, so calling
+    `client.commands.register_commands()` afterwards only republishes the commands
+    of the guilds where something changed. The fallback names are not reloaded.
+
+    Args:
+        *paths:
+            Translation files, or directories to load every translation file from.
+        fallback_locale:
+            The locale used for the name when a user's locale is not translated. If
+            this is `None` or the key is not translated for this locale, the key is
+            used.
+    """
+
+    __slots__ = ("paths", "fallback_locale", "_rows")
+
+    def __init__(self, *paths: str | PathLike[str], fallback_locale: str | None = None) -> None:
+        self.paths: Sequence[Path] = tuple(Path(fspath(path)) for path in paths)
+        self.fallback_locale: str | None = fallback_locale
+
+        self._rows: dict[str, dict[str, str]] = {}
+        """A map of keys to a map of locales to translations."""
+
+        self.load()
+
+    def __call__(self, key: str) -> TableLocale:
+        """Return a `crescent.LocaleBuilder` for `key`."""
+        return TableLocale(self, key)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def get(self, key: str, locale: str | hikari.Locale) -> str | None:
+        """Return the translation of `key` for `locale`, or `None` if there is none."""
+        return self._rows.get(key, {}).get(str(locale))
+
+    def load(self) -> set[str]:
+        """
+        Load or reload every translation file.
+
+        Returns:
+            The keys whose translations changed.
+        """
+        new_rows: dict[str, dict[str, str]] = {}
+
+        for path in self.paths:
+            files = sorted(path.iterdir()) if path.is_dir() else [path]
+
+            for file in files:
+                if file.suffix not in _SUFFIXES:
+                    continue
+
+                locale = file.stem.replace("_", "-")
+                if locale not in _LOCALES:
+                    raise ValueError(f"`{file}` is not named after a locale Discord supports.")
+
+                locale = intern(locale)
+                for key, value in _read_file(file).items():
+                    new_rows.setdefault(key, {})[locale] = value
+
+        changed: set[str] = set()
+        for key in self._rows.keys() | new_rows.keys():
+            old = self._rows.get(key)
+            new = new_rows.get(key, {})
+
+            if old is None:
+                self._rows[key] = new
+                changed.add(key)
+            elif old != new:
+                # Rows are updated in place because built commands keep a reference to
+                # them.
+                old.clear()
+                old.update(new)
+                changed.add(key)
+
+        return changed
+
+    def _row(self, key: str) -> dict[str, str]:
+        return self._rows.setdefault(key, {})
+
+    def _fallback(self, key: str) -> str:
+        if self.fallback_locale:
+            return self._row(key).get(self.fallback_locale, key)
+        return key
@@ -2,14 +2,20 @@ from typing import Sequence
 
 from crescent.ext.tasks.cron import *
 from crescent.ext.tasks.loop import *
+from crescent.ext.tasks.scheduler import *
 from crescent.ext.tasks.task import *
 
 __all__: Sequence[str] = (
     "cronjob",
     "loop",
+    "get_scheduler",
+    "TaskScheduler",
     "TaskCallbackT",
+    "TaskErrorCallbackT",
+    "OverlapPolicy",
     "Cronjob",
     "Loop",
     "Task",
     "TaskError",
+    "TaskStats",
 )
@@ -1,14 +1,59 @@
+from __future__ import annotations
+
 from datetime import datetime
-from typing import Callable, Sequence
+from datetime import timedelta as _timedelta
+from typing import TYPE_CHECKING, Callable, Sequence
 
-from crescent.ext.tasks.task import Task, TaskCallbackT
+from crescent.ext.tasks.task import OverlapPolicy, Task, TaskCallbackT, TaskErrorCallbackT
 from crescent.internal import Includable
 
+if TYPE_CHECKING:
+    from croniter import croniter
+
 __all__: Sequence[str] = ("cronjob", "Cronjob")
 
 
+class _CronSchedule:
+    """
+    The fire times of a cron expression. The last fire time is cached, so it is only
+    computed once per tick.
+    """
+
+    __slots__ = ("cron", "_after", "_next")
+
+    def __init__(self, cron: croniter) -> None:
+        self.cron = cron
+        self._after: datetime | None = None
+        self._next: datetime | None = None
+
+    def next_after(self, after: datetime) -> datetime:
+        """Returns the first fire time after `after`."""
+        if (
+            self._after is not None
+            and self._next is not None
+            and self._after <= after < self._next
+        ):
+            return self._next
+
+        self.cron.set_current(after, force=True)
+        self._after = after
+        self._next = self.cron.get_next(datetime)
+        return self._next
+
+
 class Cronjob(Task):
-    def __init__(self, cron: str, callback: TaskCallbackT, *, first_loop: bool) -> None:
+    def __init__(
+        self,
+        cron: str,
+        callback: TaskCallbackT,
+        *,
+        first_loop: bool,
+        jitter: float = 0,
+        overlap: OverlapPolicy = "allow_concurrent",
+        max_concurrent: int | None = None,
+        timeout: float | None = None,
+        on_error: TaskErrorCallbackT | None = None,
+    ) -> None:
         try:
             from croniter import croniter
         except ImportError:
@@ -16,18 +61,30 @@ class Cronjob(Task):
                 "`hikari-crescent[cron]` must be installed to use `cooldowns.cronjob`."
             )
 
-        self.cron: croniter = croniter(cron, datetime.now())
+        self._schedule: _CronSchedule = _CronSchedule(croniter(cron, datetime.now()))
+        self.cron: croniter = self._schedule.cron
         self.first_loop: bool = first_loop
+        self._last_fire: datetime | None = None
 
-        super().__init__(callback)
+        super().__init__(
+            callback,
+            jitter=jitter,
+            overlap=overlap,
+            max_concurrent=max_concurrent,
+            timeout=timeout,
+            on_error=on_error,
+        )
 
     def _next_iteration(self) -> float:
         if self.first_loop:
             return 0
 
-        call_next_at: datetime = self.cron.get_next(datetime)
-        time_to_next = call_next_at - datetime.now()
-        return time_to_next.total_seconds()
+        now = datetime.now()
+        # The scheduler may run a task slightly early, so never schedule the same fire
+        # time twice.
+        after = max(now, self._last_fire) if self._last_fire else now
+        self._last_fire = self._schedule.next_after(after)
+        return (self._last_fire - now).total_seconds()
 
     def _call_next(self) -> None:
         super()._call_next()
@@ -35,7 +92,14 @@ class Cronjob(Task):
 
 
 def cronjob(
-    cron: str, /, on_startup: bool = False
+    cron: str,
+    /,
+    on_startup: bool = False,
+    jitter: _timedelta | None = None,
+    overlap: OverlapPolicy = "allow_concurrent",
+    max_concurrent: int | None = None,
+    timeout: _timedelta | None = None,
+    on_error: TaskErrorCallbackT | None = None,
 ) -> Callable[[TaskCallbackT], Includable[Cronjob]]:
     """
     Run a task at the time specified by the cron schedule expression.
@@ -46,10 +110,36 @@ def cronjob(
             for parsing cron expressions.
         on_startup:
             If `True`, run the callback when this task is started.
+        jitter:
+            If provided, each run is delayed by a random amount of time up to `jitter`.
+            This spreads out cronjobs that would otherwise all run at once.
+        overlap:
+            What to do when the cronjob is due while the callback is still running.
+            See `OverlapPolicy`.
+        max_concurrent:
+            The maximum amount of concurrent runs when `overlap` is
+            `"allow_concurrent"`. If `None`, the amount is not limited.
+        timeout:
+            If provided, a run is cancelled if it takes longer than `timeout`.
+        on_error:
+            Called with a `TaskError` when a run raises an exception or times out.
     """
+    jitter_seconds = jitter.total_seconds() if jitter else 0
+    timeout_seconds = timeout.total_seconds() if timeout else None
 
     def inner(callback: TaskCallbackT) -> Includable[Cronjob]:
-        includable = Includable(Cronjob(cron, callback, first_loop=on_startup))
+        includable = Includable(
+            Cronjob(
+                cron,
+                callback,
+                first_loop=on_startup,
+                jitter=jitter_seconds,
+                overlap=overlap,
+                max_concurrent=max_concurrent,
+                timeout=timeout_seconds,
+                on_error=on_error,
+            )
+        )
         Cronjob._link(includable)
         return includable
 
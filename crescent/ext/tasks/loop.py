@@ -3,18 +3,35 @@ from __future__ import annotations
 from datetime import timedelta as _timedelta
 from typing import Callable, Sequence, overload
 
-from crescent.ext.tasks.task import Task, TaskCallbackT
+from crescent.ext.tasks.task import OverlapPolicy, Task, TaskCallbackT, TaskErrorCallbackT
 from crescent.internal import Includable
 
 __all__: Sequence[str] = ("loop", "Loop")
 
 
 class Loop(Task):
-    def __init__(self, callback: TaskCallbackT, delay_seconds: float) -> None:
+    def __init__(
+        self,
+        callback: TaskCallbackT,
+        delay_seconds: float,
+        *,
+        jitter: float = 0,
+        overlap: OverlapPolicy = "allow_concurrent",
+        max_concurrent: int | None = None,
+        timeout: float | None = None,
+        on_error: TaskErrorCallbackT | None = None,
+    ) -> None:
         self.delay_seconds: float = delay_seconds
         self.first_loop: bool = True
 
-        super().__init__(callback)
+        super().__init__(
+            callback,
+            jitter=jitter,
+            overlap=overlap,
+            max_concurrent=max_concurrent,
+            timeout=timeout,
+            on_error=on_error,
+        )
 
     def _next_iteration(self) -> float:
         """
@@ -84,24 +101,79 @@ retT = Callable[[TaskCallbackT], Includable[Loop]]
 
 
 @overload
-def loop(*, hours: int = ..., minutes: int = ..., seconds: int = ...) -> retT: ...
+def loop(
+    *,
+    hours: int = ...,
+    minutes: int = ...,
+    seconds: int = ...,
+    jitter: _timedelta | None = ...,
+    overlap: OverlapPolicy = ...,
+    max_concurrent: int | None = ...,
+    timeout: _timedelta | None = ...,
+    on_error: TaskErrorCallbackT | None = ...,
+) -> retT: ...
 
 
 @overload
-def loop(timedelta: _timedelta, /) -> retT: ...
+def loop(
+    timedelta: _timedelta,
+    /,
+    *,
+    jitter: _timedelta | None = ...,
+    overlap: OverlapPolicy = ...,
+    max_concurrent: int | None = ...,
+    timeout: _timedelta | None = ...,
+    on_error: TaskErrorCallbackT | None = ...,
+) -> retT: ...
 
 
 def loop(
-    timedelta: _timedelta | None = None, *, hours: int = 0, minutes: int = 0, seconds: int = 0
+    timedelta: _timedelta | None = None,
+    *,
+    hours: int = 0,
+    minutes: int = 0,
+    seconds: int = 0,
+    jitter: _timedelta | None = None,
+    overlap: OverlapPolicy = "allow_concurrent",
+    max_concurrent: int | None = None,
+    timeout: _timedelta | None = None,
+    on_error: TaskErrorCallbackT | None = None,
 ) -> retT:
     """
     Run a callback when the bot is started and every time the specified
     time interval has passed.
+
+    Args:
+        jitter:
+            If provided, each iteration is delayed by a random amount of time up to
+            `jitter`. This spreads out loops that would otherwise all run at once.
+        overlap:
+            What to do when the loop is due while the callback is still running.
+            See `OverlapPolicy`.
+        max_concurrent:
+            The maximum amount of concurrent runs when `overlap` is
+            `"allow_concurrent"`. If `None`, the amount is not limited.
+        timeout:
+            If provided, a run is cancelled if it takes longer than `timeout`.
+        on_error:
+            Called with a `TaskError` when a run raises an exception or times out.
     """
     timedelta = timedelta or _timedelta(hours=hours, minutes=minutes, seconds=seconds)
+    jitter_seconds = jitter.total_seconds() if jitter else 0
+    timeout_seconds = timeout.total_seconds() if timeout else None
 
     def inner(callback: TaskCallbackT) -> Includable[Loop]:
-        includable = Includable(Loop(callback, timedelta.total_seconds()))
+        includable = Includable(
+            Loop(
+                callback,
+                timedelta.total_seconds(),
+                jitter=jitter_seconds,
+                overlap=overlap,
+                max_concurrent=max_concurrent,
+                timeout=timeout_seconds,
+                on_error=on_error,
+            )
+        )
         Loop._link(includable)
         return includable
 
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from asyncio import get_running_loop
+from datetime import timedelta
+from heapq import heappop, heappush
+from random import uniform
+from typing import TYPE_CHECKING, Sequence
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, TimerHandle
+
+    from crescent.client import Client
+    from crescent.ext.tasks.task import Task
+
+__all__: Sequence[str] = ("TaskScheduler", "get_scheduler")
+
+
+class _Entry:
+    __slots__ = ("when", "task", "done")
+
+    def __init__(self, when: float, task: Task) -> None:
+        self.when = when
+        self.task = task
+        self.done = False
+
+    def __lt__(self, other: _Entry) -> bool:
+        return self.when < other.when
+
+
+class TaskScheduler:
+    """
+    Runs every `Loop` and `Cronjob` for a client from one heap and a single timer
+    handle, instead of a timer handle for every task.
+
+    Tasks that are due within `resolution` of each other are run in the same wakeup.
+    Use `get_scheduler` to get the scheduler for a client.
+
+    Args:
+        resolution:
+            Tasks due within this amount of time of each other are run together.
+    """
+
+    def __init__(self, *, resolution: timedelta = timedelta(milliseconds=10)) -> None:
+        self.resolution: float = resolution.total_seconds()
+        self.wakeups: int = 0
+        """The amount of times the timer has fired."""
+
+        self._loop: AbstractEventLoop | None = None
+        self._heap: list[_Entry] = []
+        self._scheduled: int = 0
+        self._handle: TimerHandle | None = None
+        self._armed_at: float = 0
+
+    def __len__(self) -> int:
+        """The amount of tasks that are scheduled."""
+        return self._scheduled
+
+    def time(self) -> float:
+        """The current time of the scheduler's clock."""
+        if self._loop is None:
+            self._loop = get_running_loop()
+        return self._loop.time()
+
+    def schedule(self, task: Task, delay: float) -> _Entry:
+        """
+        Schedule `task` to fire after `delay` seconds, plus up to `task.jitter` seconds.
+        The returned entry is passed to `cancel` to unschedule the task.
+        """
+        if task.jitter:
+            delay += uniform(0, task.jitter)
+
+        entry = _Entry(self.time() + delay, task)
+        heappush(self._heap, entry)
+        self._scheduled += 1
+        self._arm()
+        return entry
+
+    def cancel(self, entry: _Entry) -> None:
+        """Unschedule an entry returned by `schedule`."""
+        if entry.done:
+            return
+        entry.done = True
+        self._scheduled -= 1
+
+        heap = self._heap
+        while heap and heap[0].done:
+            heappop(heap)
+        if not heap and self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+    def _reset(self) -> None:
+        """
+        Unschedule every task and forget the event loop, so the scheduler can be used
+        again if the client is started on a new event loop.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        for entry in self._heap:
+            entry.done = True
+        self._heap.clear()
+        self._scheduled = 0
+        self._armed_at = 0
+        self._loop = None
+
+    async def _on_stop(self) -> None:
+        self._reset()
+
+    def _arm(self) -> None:
+        if not self._heap:
+            return
+
+        when = self._heap[0].when
+        if self._handle is not None:
+            if self._armed_at <= when:
+                return
+            self._handle.cancel()
+
+        assert self._loop
+        self._handle = self._loop.call_at(when, self._fire_due)
+        self._armed_at = when
+
+    def _fire_due(self) -> None:
+        self._handle = None
+        self.wakeups += 1
+
+        heap = self._heap
+        deadline = self.time() + self.resolution
+        due: list[Task] = []
+
+        while heap and heap[0].when <= deadline:
+            entry = heappop(heap)
+            if entry.done:
+                continue
+            entry.done = True
+            self._scheduled -= 1
+            due.append(entry.task)
+
+        for task in due:
+            task._fire()
+
+        self._arm()
+
+
+_schedulers: WeakKeyDictionary[Client, TaskScheduler] = WeakKeyDictionary()
+
+
+def get_scheduler(client: Client) -> TaskScheduler:
+    """Returns the scheduler that runs the tasks included in `client`."""
+    scheduler = _schedulers.get(client)
+    if scheduler is None:
+        scheduler = _schedulers[client] = TaskScheduler()
+        client._add_shutdown_callback(scheduler._on_stop)
+    return scheduler
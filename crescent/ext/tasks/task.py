@@ -1,62 +1,262 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from asyncio import TimerHandle, get_running_loop
-from typing import TYPE_CHECKING, Awaitable, Callable, Sequence, TypeVar
+from asyncio import TimeoutError, get_running_loop, wait_for
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import TYPE_CHECKING, Awaitable, Callable, Literal, Sequence, TypeVar
 
 from crescent.client import Client
 from crescent.exceptions import CrescentException
+from crescent.ext.tasks.scheduler import get_scheduler
 from crescent.internal.includable import Includable
 from crescent.utils import create_task
+from crescent.watchdog import watch
 
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
 
+    from crescent.ext.tasks.scheduler import TaskScheduler, _Entry
+
 TaskCallbackT = Callable[[], Awaitable[None]]
+TaskErrorCallbackT = Callable[["TaskError"], Awaitable[None]]
+OverlapPolicy = Literal["allow_concurrent", "skip_if_running", "queue_one", "fixed_delay"]
+"""
+What to do when a task is due while its callback is still running.
+
+- `"allow_concurrent"`: Run the callback again. `max_concurrent` limits how many runs
+can happen at once, and runs past the limit are skipped.
+- `"skip_if_running"`: Skip the run.
+- `"queue_one"`: Run the callback again once the current run finishes. At most one run
+is queued.
+- `"fixed_delay"`: Wait for the callback to finish before scheduling the next run, so
+the delay is measured from when the previous run finished.
+"""
 
-__all__: Sequence[str] = ("TaskCallbackT", "Task", "TaskError")
+__all__: Sequence[str] = (
+    "TaskCallbackT",
+    "TaskErrorCallbackT",
+    "OverlapPolicy",
+    "Task",
+    "TaskError",
+    "TaskStats",
+)
 
 
 class TaskError(CrescentException): ...
 
 
+class _CallbackTimeoutError(Exception):
+    """
+    Wraps a `TimeoutError` raised by a task's callback so it is not counted as the
+    task timing out.
+    """
+
+
+@dataclass
+class TaskStats:
+    """Counters describing the runs of a task."""
+
+    runs: int = 0
+    """The amount of times the callback finished, including failed runs."""
+    failures: int = 0
+    """The amount of runs that raised an exception or timed out."""
+    timeouts: int = 0
+    """The amount of runs that were cancelled because they took longer than the timeout."""
+    missed: int = 0
+    """The amount of runs that were skipped because of the overlap policy."""
+    total_duration: timedelta = timedelta()
+    """The total amount of time spent running the callback."""
+    max_duration: timedelta = timedelta()
+    """The longest time a single run took."""
+
+
 class Task(ABC):
-    def __init__(self, callback: TaskCallbackT) -> None:
+    def __init__(
+        self,
+        callback: TaskCallbackT,
+        *,
+        jitter: float = 0,
+        overlap: OverlapPolicy = "allow_concurrent",
+        max_concurrent: int | None = None,
+        timeout: float | None = None,
+        on_error: TaskErrorCallbackT | None = None,
+    ) -> None:
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("`max_concurrent` must be at least 1.")
+
         self.event_loop: AbstractEventLoop | None = None
         self.callback = callback
-        self.timer_handle: TimerHandle | None = None
         self.client: Client | None = None
+        self.jitter: float = jitter
+        """The maximum amount of seconds to randomly delay each iteration by."""
+        self.overlap: OverlapPolicy = overlap
+        self.max_concurrent: int | None = max_concurrent
+        """The maximum amount of concurrent runs when `overlap` is `"allow_concurrent"`."""
+        self.timeout: float | None = timeout
+        """The maximum amount of seconds a run can take before it is cancelled."""
+        self.on_error: TaskErrorCallbackT | None = on_error
+        """
+        Called with a `TaskError` when a run raises an exception or times out. The
+        original exception is the `TaskError`'s `__cause__`. If `None`, the `TaskError`
+        is raised.
+        """
+        self.last_run: datetime | None = None
+        """When the callback was last run."""
+        self.last_duration: timedelta | None = None
+        """How long the callback took to run the last time it finished."""
+        self.stats: TaskStats = TaskStats()
+
+        self._scheduler: TaskScheduler | None = None
+        self._entry: _Entry | None = None
+        self._started: bool = False
+        self._generation: int = 0
+        self._active: int = 0
+        self._queued: bool = False
 
     def start(self) -> None:
         if self.running:
             raise TaskError("Task is already running.")
 
         assert self.client
+        self._started = True
         self.client._run_future(self._start_inner())
 
     async def _start_inner(self) -> None:
         assert self.client is not None
 
+        self._started = True
+        self._generation += 1
         self.event_loop = get_running_loop()
+        self._scheduler = get_scheduler(self.client)
         self._call_next()
 
     def stop(self) -> None:
-        if self.timer_handle:
-            self.timer_handle.cancel()
+        self._started = False
+        if self._entry is not None and self._scheduler is not None:
+            self._scheduler.cancel(self._entry)
+        self._entry = None
 
     @property
     def running(self) -> bool:
-        if not self.timer_handle:
-            return False
-        return not self.timer_handle.cancelled()
+        return self._started
 
-    def _call_async(self) -> None:
-        create_task(self.callback())
-        self._call_next()
+    @property
+    def next_run(self) -> datetime | None:
+        """
+        When the task will run next, or `None` if the task is not running or is waiting
+        for a run to finish.
+        """
+        if self._entry is None or self._entry.done:
+            return None
+        assert self._scheduler is not None
+        return datetime.now() + timedelta(seconds=self._entry.when - self._scheduler.time())
+
+    def _fire(self) -> None:
+        """Called by the scheduler when the task is due."""
+        if self.overlap != "fixed_delay":
+            self._call_next()
+
+        if self.overlap == "allow_concurrent":
+            limit = self.max_concurrent
+        else:
+            limit = 1
+
+        if limit is not None and self._active >= limit:
+            if self.overlap == "queue_one" and not self._queued:
+                self._queued = True
+            else:
+                self.stats.missed += 1
+            return
+
+        self._active += 1
+        create_task(self._run_callback(self._generation))
+
+    async def _run_callback(self, generation: int) -> None:
+        error: Exception | None = None
+        try:
+            while True:
+                try:
+                    await self._run_once()
+                except Exception as exc:
+                    # Run the queued run before raising.
+                    error = exc
+                if not (self._queued and self._started):
+                    break
+                self._queued = False
+        finally:
+            self._active -= 1
+            if self._queued:
+                # The task was stopped or cancelled before the queued run started.
+                self._queued = False
+                self.stats.missed += 1
+            if self.overlap == "fixed_delay" and self._started and generation == self._generation:
+                self._call_next()
+
+        if error is not None:
+            raise error
+
+    async def _run_once(self) -> None:
+        self.last_run = datetime.now()
+        start = monotonic()
+        error: BaseException | None = None
+        timed_out = False
+
+        try:
+            if self.timeout is None:
+                await self._call()
+            else:
+                await wait_for(self._call_with_timeout(), self.timeout)
+        except TimeoutError as exc:
+            timed_out = True
+            self.stats.timeouts += 1
+            error = exc
+        except _CallbackTimeoutError as exc:
+            error = exc.__cause__
+        except Exception as exc:
+            error = exc
+        finally:
+            duration = timedelta(seconds=monotonic() - start)
+            self.last_duration = duration
+            self.stats.runs += 1
+            self.stats.total_duration += duration
+            self.stats.max_duration = max(self.stats.max_duration, duration)
+
+        if error is None:
+            return
+
+        self.stats.failures += 1
+        name = getattr(self.callback, "__name__", repr(self.callback))
+        if timed_out:
+            task_error = TaskError(f"Task `{name}` timed out after {self.timeout} seconds.")
+        else:
+            task_error = TaskError(f"Task `{name}` raised an exception.")
+        task_error.__cause__ = error
+
+        if self.on_error is None:
+            raise task_error
+        await self.on_error(task_error)
+
+    async def _call_with_timeout(self) -> None:
+        """Call the callback inside `wait_for`."""
+        try:
+            await self._call()
+        except TimeoutError as exc:
+            raise _CallbackTimeoutError from exc
+
+    async def _call(self) -> None:
+        watchdog = self.client.watchdog if self.client else None
+        if watchdog is None:
+            await self.callback()
+            return
+
+        with watch(watchdog, f"task `{getattr(self.callback, '__name__', self.callback)}`"):
+            await self.callback()
 
     def _call_next(self) -> None:
-        assert self.event_loop
-        self.timer_handle = self.event_loop.call_later(self._next_iteration(), self._call_async)
+        assert self._scheduler is not None
+        self._entry = self._scheduler.schedule(self, self._next_iteration())
 
     @abstractmethod
     def _next_iteration(self) -> float:
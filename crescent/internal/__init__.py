@@ -4,6 +4,7 @@ from .app_command import *
 from .handle_resp import *
 from .includable import *
 from .registry import *
+from .snapshot import *
 
 __all__: Sequence[str] = (
     "AppCommandMeta",
@@ -12,4 +13,5 @@ __all__: Sequence[str] = (
     "Includable",
     "register_command",
     "CommandHandler",
+    "CommandSnapshot",
 )
@@ -7,6 +7,7 @@ from hikari import (
     UNDEFINED,
     ApplicationContextType,
     CommandOption,
+    CommandType,
     PartialCommand,
     Permissions,
     SlashCommand,
@@ -18,18 +19,21 @@ from crescent.locale import LocaleBuilder, str_or_build_locale
 from crescent.utils import add_hooks
 
 if TYPE_CHECKING:
-    from typing import Any, Sequence, Type
+    from typing import Any, Hashable, Mapping, Sequence, Type
 
-    from hikari import CommandType, Snowflake, UndefinedOr, UndefinedType
+    from datetime import timedelta
+
+    from hikari import Snowflake, UndefinedNoneOr, UndefinedOr, UndefinedType
 
     from crescent.commands.groups import Group, SubGroup
     from crescent.internal.includable import Includable
+    from crescent.internal.handle_resp import OptionExtractorT
     from crescent.typedefs import AutocompleteCallbackT, CommandCallbackT, CommandHookCallbackT
 
     Self = TypeVar("Self")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Unique:
     name: str
     type: CommandType
@@ -39,17 +43,7 @@ class Unique:
 
     @classmethod
     def from_meta_struct(cls: Type[Unique], command: Includable[AppCommandMeta]) -> Unique:
-        return cls(
-            name=str_or_build_locale(command.metadata.app_command.name)[0],
-            type=command.metadata.app_command.type,
-            guild_id=command.metadata.app_command.guild_id,
-            group=str_or_build_locale(command.metadata.group.name)[0]
-            if command.metadata.group
-            else None,
-            sub_group=str_or_build_locale(command.metadata.sub_group.name)[0]
-            if command.metadata.sub_group
-            else None,
-        )
+        return command.metadata.unique
 
     @classmethod
     def from_app_command_meta(cls: Type[Unique], command: AppCommandMeta) -> Unique:
@@ -67,7 +61,58 @@ class Unique:
 __all__: Sequence[str] = ("AppCommandMeta", "AppCommand")
 
 
-@dataclass
+def _localizations_key(localizations: Mapping[str, str] | None) -> Hashable:
+    return None if localizations is None else frozenset(localizations.items())
+
+
+def _options_key(options: Sequence[CommandOption] | None) -> Hashable:
+    """
+    Returns a hashable key for a list of options. Two lists are equal if their keys are
+    equal. Unlike `CommandOption.__eq__`, the localizations are part of the key.
+    """
+    if options is None:
+        return None
+
+    return tuple(
+        (
+            option.type,
+            option.name,
+            _localizations_key(option.name_localizations),
+            option.description,
+            _localizations_key(option.description_localizations),
+            option.is_required,
+            None
+            if option.choices is None
+            else tuple(
+                (choice.name, _localizations_key(choice.name_localizations), choice.value)
+                for choice in option.choices
+            ),
+            _options_key(option.options),
+            None if option.channel_types is None else tuple(option.channel_types),
+            option.autocomplete,
+            option.min_value,
+            option.max_value,
+            option.min_length,
+            option.max_length,
+        )
+        for option in options
+    )
+
+
+def partial_command_key(command: PartialCommand) -> Hashable:
+    """
+    Returns a hashable key for a command fetched from Discord. A local command can only
+    be equal to the fetched command if `AppCommand.structural_key` returns the same key.
+    """
+    return (
+        command.type,
+        command.name,
+        _localizations_key(command.name_localizations),
+        frozenset(command.context_types),
+    )
+
+
+@dataclass(slots=True)
 class AppCommand:
     """Local representation of an Application Command"""
 
@@ -95,7 +140,7 @@ class AppCommand:
             if any(
                 (
                     description != other.description,
-                    (self.options or None) != (other.options or None),
+                    not self._options_equal(other.options),
                     description_localizations != other.description_localizations,
                 )
             ):
@@ -115,6 +160,33 @@ class AppCommand:
             )
         )
 
+    def structural_key(self) -> Hashable:
+        """
+        Returns a hashable key for this command. This command can only be equal to a
+        fetched command if `partial_command_key` returns the same key for it.
+        """
+        name, name_localizations = str_or_build_locale(self.name)
+
+        return (
+            self.type,
+            name,
+            _localizations_key(name_localizations),
+            frozenset(self.context_types) if self.context_types is not UNDEFINED else frozenset(),
+        )
+
+    def _options_equal(self, other: Sequence[CommandOption] | None) -> bool:
+        """
+        Compare the options by their structural keys first, so different option trees
+        do not need to be compared deeply. Equal keys are confirmed with `==`. Only the
+        keys compare localizations.
+
+        The keys are built from the current options every time, because localizations
+        can be updated in place when translations are reloaded.
+        """
+        if _options_key(self.options or None) != _options_key(other or None):
+            return False
+        return (self.options or None) == (other or None)
+
     def build_default_member_perms(self) -> Permissions | None:
         if self.default_member_permissions is UNDEFINED:
             return None
@@ -148,7 +220,7 @@ class AppCommand:
         return out
 
 
-@dataclass
+@dataclass(slots=True)
 class AppCommandMeta:
     app_command: AppCommand
     owner: Any
@@ -157,20 +229,43 @@ class AppCommandMeta:
     autocomplete: dict[str, AutocompleteCallbackT[Any]] = field(default_factory=dict)  # pyright: ignore[reportUnknownVariableType]
     group: Group | None = None
     sub_group: SubGroup | None = None
-    hooks: list[CommandHookCallbackT] = field(default_factory=list)  # pyright: ignore[reportUnknownVariableType]
-    after_hooks: list[CommandHookCallbackT] = field(default_factory=list)  # pyright: ignore[reportUnknownVariableType]
+    hooks: Sequence[CommandHookCallbackT] = ()
+    after_hooks: Sequence[CommandHookCallbackT] = ()
+    auto_defer_after: UndefinedNoneOr[timedelta] = UNDEFINED
+    """
+    How long to wait before automatically deferring the interaction. If `UNDEFINED`,
+    `Client.auto_defer_after` is used.
+    """
+    auto_defer_ephemeral: UndefinedOr[bool] = UNDEFINED
+    """
+    Whether the automatic deferral is ephemeral. If `UNDEFINED`,
+    `Client.auto_defer_ephemeral` is used.
+    """
+    _unique: Unique | None = field(default=None, init=False, repr=False, compare=False)
+    _option_plan: dict[str, OptionExtractorT | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """
+    A map of option names to the function used to read each option's value. Built the
+    first time the command is used.
+    """
 
     def add_hooks(
         self, hooks: Sequence[CommandHookCallbackT], prepend: bool = False, *, after: bool
     ) -> None:
-        add_hooks(self.hooks, self.after_hooks, hooks, prepend=prepend, after=after)
+        self.hooks, self.after_hooks = add_hooks(
+            self.hooks, self.after_hooks, hooks, prepend=prepend, after=after
+        )
 
     @property
     def unique(self) -> Unique:
-        return Unique(
-            str_or_build_locale(self.app_command.name)[0],
-            self.app_command.type,
-            self.app_command.guild_id,
-            str_or_build_locale(self.group.name)[0] if self.group else None,
-            str_or_build_locale(self.sub_group.name)[0] if self.sub_group else None,
-        )
+        unique = self._unique
+        # The guild ID is set when the command is registered, so it may have changed.
+        if unique is None or unique.guild_id != self.app_command.guild_id:
+            unique = self._unique = Unique.from_app_command_meta(self)
+        return unique
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("app_command", "group", "sub_group"):
+            object.__setattr__(self, "_unique", None)
+        object.__setattr__(self, name, value)
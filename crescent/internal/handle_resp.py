@@ -3,9 +3,10 @@ from __future__ import annotations
 from asyncio import Future
 from contextlib import suppress
 from logging import getLogger
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
 from hikari import (
+    UNDEFINED,
     AutocompleteInteraction,
     AutocompleteInteractionOption,
     CommandInteraction,
@@ -20,16 +21,26 @@ from hikari.impl import AutocompleteChoiceBuilder
 
 from crescent.context import AutocompleteContext, Context
 from crescent.internal.app_command import Unique
+from crescent.locale import str_or_build_locale
 from crescent.mentionable import Mentionable
+from crescent.tracing import span
+from crescent.watchdog import watch
 from crescent.utils import unwrap
 
 if TYPE_CHECKING:
-    from typing import Any, Sequence
-
-    from hikari import CommandInteractionOption, Message, PartialInteraction, User
+    from typing import Sequence
+
+    from hikari import (
+        CommandInteractionOption,
+        Message,
+        PartialInteraction,
+        ResolvedOptionData,
+        User,
+    )
 
     from crescent.client import Client
     from crescent.internal import AppCommandMeta, Includable
+    from crescent.tracing import Tracer
     from crescent.typedefs import CommandHookCallbackT
 
 
@@ -60,7 +71,40 @@ async def handle_resp(
             )
         return
 
-    ctx = _context_from_interaction_resp(client, interaction)
+    tracer = client.tracer
+    if tracer is None:
+        await _run_command(client, interaction, command, future)
+        return
+
+    attributes: dict[str, Any] = {
+        "crescent.interaction.id": int(interaction.id),
+        "crescent.command": " ".join(filter(None, (group, sub_group, command_name))),
+    }
+    if interaction.guild_id:
+        attributes["crescent.guild.id"] = int(interaction.guild_id)
+
+    with tracer.span("crescent.interaction", attributes):
+        await _run_command(client, interaction, command, future)
+
+
+async def _run_command(
+    client: Client,
+    interaction: CommandInteraction | AutocompleteInteraction,
+    command: Includable[AppCommandMeta],
+    future: Future[InteractionResponseBuilder] | None,
+) -> None:
+    with watch(client.watchdog, command.metadata.unique):
+        await _dispatch(client, interaction, command, future)
+
+
+async def _dispatch(
+    client: Client,
+    interaction: CommandInteraction | AutocompleteInteraction,
+    command: Includable[AppCommandMeta],
+    future: Future[InteractionResponseBuilder] | None,
+) -> None:
+    with span(client.tracer, "crescent.context"):
+        ctx = _context_from_interaction_resp(client, interaction, command)
     ctx._rest_interaction_future = future
 
     if interaction.type is InteractionType.AUTOCOMPLETE:
@@ -71,26 +115,57 @@ async def handle_resp(
 
 async def _handle_hooks(hooks: Sequence[CommandHookCallbackT], ctx: Context) -> bool:
     """Returns `False` if the command should not be run."""
+    tracer = ctx.client.tracer
+
     for hook in hooks:
-        hook_res = await hook(ctx)
+        if tracer is None:
+            hook_res = await hook(ctx)
+        else:
+            with tracer.span("crescent.hook", {"crescent.hook": _hook_name(hook)}):
+                hook_res = await hook(ctx)
 
         if hook_res and hook_res.exit:
             return True
     return False
 
 
-async def _handle_slash_resp(command: Includable[AppCommandMeta], ctx: Context) -> None:
-    should_exit = await _handle_hooks(command.metadata.hooks, ctx)
+def _hook_name(hook: CommandHookCallbackT) -> str:
+    return getattr(hook, "__qualname__", None) or repr(hook)
 
-    if should_exit:
-        return
 
+async def _handle_slash_resp(command: Includable[AppCommandMeta], ctx: Context) -> None:
+    auto_defer_after = command.metadata.auto_defer_after
+    if auto_defer_after is UNDEFINED:
+        auto_defer_after = command.client.auto_defer_after
+    if auto_defer_after is not None:
+        ephemeral = command.metadata.auto_defer_ephemeral
+        if ephemeral is UNDEFINED:
+            ephemeral = command.client.auto_defer_ephemeral
+        ctx._arm_auto_defer(auto_defer_after.total_seconds(), ephemeral)
+
+    tracer = command.client.tracer
     try:
-        await command.metadata.callback(ctx, **ctx.options)
-        _ = await _handle_hooks(command.metadata.after_hooks, ctx)
-    except Exception as exc:
-        handled = await command.client._command_error_handler.try_handle(exc, [exc, ctx])
-        await command.client.on_crescent_command_error(exc, ctx.into(Context), handled)
+        should_exit = await _handle_hooks(command.metadata.hooks, ctx)
+
+        if should_exit:
+            return
+
+        try:
+            with span(tracer, "crescent.callback"):
+                await command.metadata.callback(ctx, **ctx.options)
+            _ = await _handle_hooks(command.metadata.after_hooks, ctx)
+        except Exception as exc:
+            with span(tracer, "crescent.error_handler", _exception_attributes(tracer, exc)):
+                handled = await command.client._command_error_handler.try_handle(exc, [exc, ctx])
+                await command.client.on_crescent_command_error(exc, ctx.into(Context), handled)
+    finally:
+        ctx._cancel_auto_defer()
+
+
+def _exception_attributes(tracer: Tracer | None, exc: Exception) -> dict[str, Any] | None:
+    if tracer is None:
+        return None
+    return {"crescent.exception": type(exc).__qualname__}
 
 
 async def _handle_autocomplete_resp(
@@ -104,20 +179,23 @@ async def _handle_autocomplete_resp(
         return
     autocomplete = command.metadata.autocomplete[option.name]
 
+    tracer = command.client.tracer
     try:
-        res = await autocomplete(ctx, option)
+        with span(tracer, "crescent.callback"):
+            res = await autocomplete(ctx, option)
         choices = [AutocompleteChoiceBuilder(name, value) for name, value in res]
         if future := ctx._unset_future:
             future.set_result(ctx.interaction.build_response(choices))
         else:
             await ctx.interaction.create_response(choices)
     except Exception as exc:
-        handled = await command.client._autocomplete_error_handler.try_handle(
-            exc, [exc, ctx, option]
-        )
-        await command.client.on_crescent_autocomplete_error(
-            exc, ctx.into(AutocompleteContext), option, handled
-        )
+        with span(tracer, "crescent.error_handler", _exception_attributes(tracer, exc)):
+            handled = await command.client._autocomplete_error_handler.try_handle(
+                exc, [exc, ctx, option]
+            )
+            await command.client.on_crescent_autocomplete_error(
+                exc, ctx.into(AutocompleteContext), option, handled
+            )
 
 
 def _get_option_recursive(
@@ -150,12 +228,24 @@ def _get_command(
     return None
 
 
-_VALUE_TYPE_LINK: dict[OptionType | int, Sequence[str]] = {
-    OptionType.ROLE: ("roles",),
-    OptionType.USER: ("members", "users"),
-    OptionType.CHANNEL: ("channels",),
-    OptionType.ATTACHMENT: ("attachments",),
+OptionExtractorT = Callable[["ResolvedOptionData", Any], Any]
+"""Returns the value of an option from the interaction's resolved data and the raw value."""
+
+
+def _extract_member_or_user(resolved: ResolvedOptionData, value: Any) -> Any:
+    return resolved.members.get(value) or resolved.users[value]
+
+
+_EXTRACTORS: dict[OptionType | int, OptionExtractorT] = {
+    OptionType.ROLE: lambda resolved, value: resolved.roles[value],
+    OptionType.USER: _extract_member_or_user,
+    OptionType.CHANNEL: lambda resolved, value: resolved.channels[value],
+    OptionType.ATTACHMENT: lambda resolved, value: resolved.attachments[value],
+    OptionType.MENTIONABLE: Mentionable._from_resolved,
 }
+"""
+The extractor for every option type that is resolved. Other options use the raw value.
+"""
 
 
 class CrescentCommandData(NamedTuple):
@@ -194,12 +284,15 @@ def _get_crescent_command_data(
 
 
 def _context_from_interaction_resp(
-    client: Client, interaction: CommandInteraction | AutocompleteInteraction
+    client: Client,
+    interaction: CommandInteraction | AutocompleteInteraction,
+    command: Includable[AppCommandMeta] | None = None,
 ) -> Context:
     command_name, group, sub_group, options = _get_crescent_command_data(interaction)
 
     if interaction.command_type is CommandType.SLASH:
-        callback_options = _options_to_kwargs(interaction, options)
+        plan = _get_option_plan(command) if command else None
+        callback_options = _options_to_kwargs(interaction, options, plan)
     else:
         # This will never be `AutocompleteInteraction` because message and user
         # commands don't have autocomplete.
@@ -230,56 +323,62 @@ def _context_from_interaction_resp(
         _has_created_response=False,
         _has_deferred_response=False,
         _rest_interaction_future=None,
+        _auto_defer=None,
+        _response_message=None,
     )
 
 
+def _get_option_plan(command: Includable[AppCommandMeta]) -> dict[str, OptionExtractorT | None]:
+    """
+    Returns a map of option names to the extractor for each option of a command. The
+    plan is built once from the command's options and stored on its metadata.
+    """
+    metadata = command.metadata
+    if metadata._option_plan is None:
+        metadata._option_plan = {
+            str_or_build_locale(option.name)[0]: _EXTRACTORS.get(option.type)
+            for option in metadata.app_command.options or ()
+        }
+    return metadata._option_plan
+
+
 def _options_to_kwargs(
     interaction: CommandInteraction | AutocompleteInteraction,
     options: Sequence[CommandInteractionOption] | None,
+    plan: dict[str, OptionExtractorT | None] | None = None,
 ) -> dict[str, Any]:
     if not options:
         return {}
 
-    return {option.name: _extract_value(option, interaction) for option in options}
-
-
-def _get_resolved(interaction: CommandInteraction, option_type: int) -> Any | None:
-    attrs: Sequence[str] | None = _VALUE_TYPE_LINK.get(option_type)
-
-    if attrs is None:
-        return None
-
-    for resolved_type in attrs:
-        if data := getattr(interaction.resolved, resolved_type, None):
-            return data
-
-    return None
-
-
-def _extract_value(
-    option: CommandInteractionOption, interaction: CommandInteraction | AutocompleteInteraction
-) -> Any:
-    # `option.value` is guaranteed to have a value because this is not a command group.
-    assert option.value is not None
-
-    if isinstance(interaction, AutocompleteInteraction):
-        return option.value
-
-    if option.type is OptionType.MENTIONABLE:
-        return Mentionable._from_interaction(interaction)
+    # Autocomplete interactions always use the raw values.
+    resolved = interaction.resolved if isinstance(interaction, CommandInteraction) else None
+    if resolved is None:
+        return {option.name: option.value for option in options}
 
-    resolved = _get_resolved(interaction, option.type)
+    kwargs: dict[str, Any] = {}
+    for option in options:
+        if plan is not None and option.name in plan:
+            extract = plan[option.name]
+        else:
+            # The option is not known locally, so the extractor is found by its type.
+            extract = _EXTRACTORS.get(option.type)
 
-    if resolved is None:
-        return option.value
+        kwargs[option.name] = option.value if extract is None else extract(resolved, option.value)
 
-    return resolved[option.value]
+    return kwargs
 
 
 def _resolved_data_to_kwargs(interaction: CommandInteraction) -> dict[str, Message | User]:
     if not interaction.resolved:
         raise ValueError("interaction.resolved should be defined when running this function")
 
+    if (target_id := interaction.target_id) is not None:
+        if interaction.command_type is CommandType.MESSAGE:
+            return {"message": interaction.resolved.messages[target_id]}
+        if member := interaction.resolved.members.get(target_id):
+            return {"user": member}
+        return {"user": interaction.resolved.users[target_id]}
+
     if interaction.resolved.messages:
         return {"message": next(iter(interaction.resolved.messages.values()))}
     if interaction.resolved.members:
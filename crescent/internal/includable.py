@@ -15,7 +15,7 @@ T = TypeVar("T", contravariant=True)
 __all__: Sequence[str] = ("Includable",)
 
 
-@dataclass
+@dataclass(slots=True)
 class Includable(Generic[T]):
     metadata: T
 
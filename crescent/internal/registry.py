@@ -21,17 +21,19 @@ from hikari import (
 from hikari.traits import CacheAware
 
 from crescent.exceptions import AlreadyRegisteredError
-from crescent.internal.app_command import AppCommand, AppCommandMeta, Unique
+from crescent.internal.app_command import AppCommand, AppCommandMeta, Unique, partial_command_key
 from crescent.internal.includable import Includable
 from crescent.locale import LocaleBuilder, str_or_build_locale
-from crescent.utils import gather_iter, unwrap
+from crescent.utils import gather_iter
 
 if TYPE_CHECKING:
-    from typing import Any, Awaitable, Callable, DefaultDict, Iterable, Sequence
+    from datetime import timedelta
+    from typing import Any, Awaitable, Callable, DefaultDict, Hashable, Iterable, Sequence
 
-    from hikari import PartialGuild, Snowflakeish, SnowflakeishOr
+    from hikari import PartialCommand, PartialGuild, Snowflakeish, SnowflakeishOr, UndefinedNoneOr
 
     from crescent.client import Client
+    from crescent.commands.dynamic import DynamicCommand
     from crescent.typedefs import AutocompleteCallbackT, CommandCallbackT
 
     T = TypeVar("T", bound="Callable[..., Awaitable[Any]]")
@@ -59,6 +61,8 @@ def register_command(
     context_types: UndefinedOr[Iterable[ApplicationContextType]] = UNDEFINED,
     autocomplete: dict[str, AutocompleteCallbackT[Any]] = {},
     nsfw: bool | None = None,
+    auto_defer_after: UndefinedNoneOr[timedelta] = UNDEFINED,
+    auto_defer_ephemeral: UndefinedOr[bool] = UNDEFINED,
 ) -> Includable[AppCommandMeta]:
     if not iscoroutinefunction(callback):
         raise ValueError(f"`{callback.__name__}` must be an async function.")
@@ -70,6 +74,8 @@ def register_command(
             owner=owner,
             callback=callback,
             autocomplete=autocomplete,
+            auto_defer_after=auto_defer_after,
+            auto_defer_ephemeral=auto_defer_ephemeral,
             app_command=AppCommand(
                 type=command_type,
                 description=description,
@@ -131,7 +137,16 @@ class ErrorHandler(Generic[_E]):
 
 
 class CommandHandler:
-    __slots__: Sequence[str] = ("_client", "_guilds", "_application_id", "_registry")
+    __slots__: Sequence[str] = (
+        "_client",
+        "_guilds",
+        "_application_id",
+        "_registry",
+        "_built_commands",
+        "_built_guild_commands",
+        "_guild_commands",
+        "_dirty_guilds",
+    )
 
     def __init__(self, client: Client, guilds: Sequence[Snowflakeish]) -> None:
         self._client: Client = client
@@ -139,166 +154,144 @@ class CommandHandler:
         self._application_id: Snowflake | None = None
 
         self._registry: dict[Unique, Includable[AppCommandMeta]] = {}
+        self._built_commands: Sequence[AppCommand] | None = None
+        """The command tree sent to Discord. Built again when the registry changes."""
+        self._built_guild_commands: dict[Snowflakeish, list[AppCommand]] | None = None
+        """The guild commands in `_built_commands`, by guild."""
+
+        self._guild_commands: dict[Snowflake, dict[str, tuple[AppCommand, DynamicCommand]]] = {}
+        """The dynamic commands in every guild, by name."""
+        self._dirty_guilds: set[Snowflake] = set()
+        """Guilds whose dynamic commands changed since they were last synced."""
 
     def _register(self, command: Includable[AppCommandMeta]) -> Includable[AppCommandMeta]:
         command.metadata.app_command.guild_id = (
             command.metadata.app_command.guild_id or self._client.default_guild
         )
         self._registry[command.metadata.unique] = command
+        self._built_commands = None
+        self._built_guild_commands = None
         return command
 
     def _remove(self, command: Includable[AppCommandMeta]) -> None:
         self._registry.pop(command.metadata.unique)
+        self._built_commands = None
+        self._built_guild_commands = None
 
     def _get(self, unique: Unique) -> Includable[AppCommandMeta]:
-        return self._registry[unique]
-
-    def __build_commands(self) -> Sequence[AppCommand]:
+        if command := self._registry.get(unique):
+            return command
+
+        if (
+            unique.guild_id is not None
+            and unique.group is None
+            and unique.type == CommandType.SLASH
+            and (guild_commands := self._guild_commands.get(Snowflake(unique.guild_id)))
+            and (dynamic := guild_commands.get(unique.name))
+        ):
+            app_command, dynamic_command = dynamic
+            return dynamic_command._to_includable(app_command, self._client)
+
+        raise KeyError(unique)
+
+    def _build_commands(self) -> Sequence[AppCommand]:
+        if self._built_commands is None:
+            self._built_commands = self.__build_command_tree(self._registry.values())
+        return self._built_commands
+
+    def _build_guild_commands(self) -> dict[Snowflakeish, list[AppCommand]]:
+        if self._built_guild_commands is None:
+            built_guild_commands: dict[Snowflakeish, list[AppCommand]] = {}
+            for command in self._build_commands():
+                if command.guild_id:
+                    built_guild_commands.setdefault(command.guild_id, []).append(command)
+            self._built_guild_commands = built_guild_commands
+        return self._built_guild_commands
+
+    def __build_command_tree(
+        self, commands: Iterable[Includable[AppCommandMeta]]
+    ) -> Sequence[AppCommand]:
         built_commands: dict[Unique, AppCommand] = {}
+        sub_command_groups: dict[tuple[Unique, str, str], CommandOption] = {}
+        # {(top-level command, name, description): subcommand group}
 
-        for command in self._registry.values():
-            if command.metadata.sub_group:
-                # If a command has a sub_group, it must be nested 2 levels deep.
-                #
-                # command
-                #     subcommand-group
-                #         subcommand
-                #
-                # The children of the subcommand-group object are being set to include
-                # `command` If that subcommand-group object does not exist, it will be
-                # created here. The same goes for the top-level command.
-                #
-                # First make sure the command exists. This command will hold the
-                # subcommand-group for `command`.
-
-                # `key` represents the unique value for the top-level command that will
-                # hold the subcommand.
-                key = Unique(
-                    name=str_or_build_locale(unwrap(command.metadata.group).name)[0],
-                    type=command.metadata.app_command.type,
-                    guild_id=command.metadata.app_command.guild_id,
-                    group=None,
-                    sub_group=None,
-                )
-
-                if key not in built_commands:
-                    built_commands[key] = AppCommand(
-                        name=unwrap(command.metadata.group).name,
-                        description=unwrap(command.metadata.group).description or "No Description",
-                        type=command.metadata.app_command.type,
-                        guild_id=command.metadata.app_command.guild_id,
-                        options=[],
-                        default_member_permissions=(
-                            unwrap(command.metadata.group).default_member_permissions
-                        ),
-                    )
-
-                # The top-level command now exists. A subcommand group now if placed
-                # inside the top-level command. This subcommand group will hold `command`.
-
-                children = cast("list[CommandOption]", unwrap(built_commands[key].options))
-
-                name, name_localizations = str_or_build_locale(
-                    unwrap(command.metadata.sub_group).name
-                )
-                description, description_localizations = str_or_build_locale(
-                    unwrap(command.metadata.sub_group).description or "No Description"
-                )
+        for command in commands:
+            metadata = command.metadata
+            app_command = metadata.app_command
+
+            if not metadata.group:
+                built_commands[metadata.unique] = app_command
+                continue
+
+            # Any command at this point is nested in a top-level command, which is
+            # created here if it does not exist yet.
+            #
+            # command
+            #     subcommand-group (only if the command has a sub_group)
+            #         subcommand
+
+            group = metadata.group
+
+            # `key` represents the unique value for the top-level command that will
+            # hold the subcommand.
+            key = Unique(
+                name=str_or_build_locale(group.name)[0],
+                type=app_command.type,
+                guild_id=app_command.guild_id,
+                group=None,
+                sub_group=None,
+            )
 
-                sub_command_group = CommandOption(
-                    name=name,
-                    name_localizations=name_localizations,
-                    description=description,
-                    description_localizations=description_localizations,
-                    type=OptionType.SUB_COMMAND_GROUP,
+            top_level = built_commands.get(key)
+            if top_level is None:
+                top_level = built_commands[key] = AppCommand(
+                    name=group.name,
+                    description=group.description or "No Description",
+                    type=app_command.type,
+                    guild_id=app_command.guild_id,
                     options=[],
-                    is_required=False,
+                    default_member_permissions=group.default_member_permissions,
                 )
 
-                # This for-else makes sure that sub_command_group will hold a reference
-                # to the subcommand group that we want to modify to hold `command`
-                for cmd_in_children in children:
-                    if (
-                        cmd_in_children.name == sub_command_group.name
-                        and cmd_in_children.description == sub_command_group.description
-                        and cmd_in_children.type == sub_command_group.type
-                    ):
-                        sub_command_group = cmd_in_children
-                        break
-                else:
-                    children.append(sub_command_group)
+            children = cast("list[CommandOption]", top_level.options)
 
-                name, name_localizations = str_or_build_locale(command.metadata.app_command.name)
-                assert command.metadata.app_command.description
+            if sub_group := metadata.sub_group:
+                name, name_localizations = str_or_build_locale(sub_group.name)
                 description, description_localizations = str_or_build_locale(
-                    command.metadata.app_command.description
+                    sub_group.description or "No Description"
                 )
 
-                cast("list[CommandOption]", sub_command_group.options).append(
-                    CommandOption(
+                group_key = (key, name, description)
+                sub_command_group = sub_command_groups.get(group_key)
+                if sub_command_group is None:
+                    sub_command_group = sub_command_groups[group_key] = CommandOption(
                         name=name,
                         name_localizations=name_localizations,
                         description=description,
                         description_localizations=description_localizations,
-                        type=OptionType.SUB_COMMAND,
-                        options=command.metadata.app_command.options,
+                        type=OptionType.SUB_COMMAND_GROUP,
+                        options=[],
                         is_required=False,
                     )
-                )
-
-            elif command.metadata.group:
-                # Any command at this point will only have one level of nesting.
-                #
-                # Command
-                #    subcommand
-                #
-                # A subcommand object is what is being generated here. If there is no
-                # top level command, it will be created here.
-
-                # `key` represents the unique value for the top-level command that will
-                # hold the subcommand.
-                key = Unique(
-                    name=str_or_build_locale(command.metadata.group.name)[0],
-                    type=command.metadata.app_command.type,
-                    guild_id=command.metadata.app_command.guild_id,
-                    group=None,
-                    sub_group=None,
-                )
+                    children.append(sub_command_group)
 
-                if key not in built_commands:
-                    built_commands[key] = AppCommand(
-                        name=command.metadata.group.name,
-                        description=unwrap(command.metadata.group).description or "No Description",
-                        type=command.metadata.app_command.type,
-                        guild_id=command.metadata.app_command.guild_id,
-                        options=[],
-                        default_member_permissions=(
-                            command.metadata.group.default_member_permissions
-                        ),
-                    )
+                children = cast("list[CommandOption]", sub_command_group.options)
 
-                # No checking has to be done before appending `command` since it is the
-                # lowest level.
-                name, name_localizations = str_or_build_locale(command.metadata.app_command.name)
-                assert command.metadata.app_command.description
-                description, description_localizations = str_or_build_locale(
-                    command.metadata.app_command.description
-                )
+            name, name_localizations = str_or_build_locale(app_command.name)
+            assert app_command.description
+            description, description_localizations = str_or_build_locale(app_command.description)
 
-                cast("list[CommandOption]", built_commands[key].options).append(
-                    CommandOption(
-                        name=name,
-                        name_localizations=name_localizations,
-                        description=description,
-                        description_localizations=description_localizations,
-                        type=command.metadata.app_command.type,
-                        options=command.metadata.app_command.options,
-                        is_required=False,
-                    )
+            children.append(
+                CommandOption(
+                    name=name,
+                    name_localizations=name_localizations,
+                    description=description,
+                    description_localizations=description_localizations,
+                    type=OptionType.SUB_COMMAND,
+                    options=app_command.options,
+                    is_required=False,
                 )
-
-            else:
-                built_commands[Unique.from_meta_struct(command)] = command.metadata.app_command
+            )
 
         return tuple(built_commands.values())
 
@@ -313,8 +306,17 @@ class CommandHandler:
                 application=self._application_id
             )
 
+            # Commands can only be equal if their structural keys are equal, so only
+            # commands with the same key need to be compared.
+            existing_by_key: DefaultDict[Hashable, list[PartialCommand]] = defaultdict(list)
+            for existing in existing_commands:
+                existing_by_key[partial_command_key(existing)].append(existing)
+
             def exists(command: AppCommand) -> bool:
-                return any(command.eq_partial_command(existing) for existing in existing_commands)
+                return any(
+                    command.eq_partial_command(existing)
+                    for existing in existing_by_key.get(command.structural_key(), ())
+                )
 
             all_exists = True
             missing: list[str] = []
@@ -400,10 +402,134 @@ class CommandHandler:
         for guild in guilds_to_purge:
             await self._client.app.rest.set_application_commands(self._application_id, (), guild)
 
+    def set_guild_commands(
+        self, guild: SnowflakeishOr[PartialGuild], commands: Iterable[DynamicCommand]
+    ) -> None:
+        """
+        Replace the dynamic commands in a guild. The guild is updated on Discord the next
+        time `CommandHandler.sync_guild_commands` is called.
+
+        ### Example
+        ```python
+        for guild_id, tags in await load_tags():
+            client.commands.set_guild_commands(
+                guild_id, [crescent.DynamicCommand(tag.name, tag_callback) for tag in tags]
+            )
+        await client.commands.sync_guild_commands()
+        ```
+        """
+        self.remove_guild_commands(guild)
+        self.add_guild_commands(guild, commands)
+
+    def add_guild_commands(
+        self, guild: SnowflakeishOr[PartialGuild], commands: Iterable[DynamicCommand]
+    ) -> None:
+        """
+        Add dynamic commands to a guild. Dynamic commands with the same name are
+        replaced.
+
+        Raises:
+            AlreadyRegisteredError: A command that isn't dynamic has the same name.
+        """
+        guild_id = Snowflake(guild)
+        guild_commands = self._guild_commands.setdefault(guild_id, {})
+
+        for command in commands:
+            app_command = command._build(guild_id)
+            name = str_or_build_locale(app_command.name)[0]
+
+            if name not in guild_commands and (
+                Unique(name, CommandType.SLASH, guild_id, None, None) in self._registry
+            ):
+                raise AlreadyRegisteredError(
+                    f"Command `{name}` is already registered in guild {guild_id}."
+                )
+
+            guild_commands[name] = (app_command, command)
+
+        self._dirty_guilds.add(guild_id)
+
+    def remove_guild_commands(self, guild: SnowflakeishOr[PartialGuild], *names: str) -> None:
+        """
+        Remove dynamic commands from a guild. If no names are passed, every dynamic
+        command in the guild is removed.
+        """
+        guild_id = Snowflake(guild)
+        guild_commands = self._guild_commands.get(guild_id)
+        if not guild_commands:
+            return
+
+        if names:
+            for name in names:
+                guild_commands.pop(name, None)
+        else:
+            guild_commands.clear()
+
+        if not guild_commands:
+            del self._guild_commands[guild_id]
+        self._dirty_guilds.add(guild_id)
+
+    def guild_commands(self, guild: SnowflakeishOr[PartialGuild]) -> Sequence[str]:
+        """Return the names of the dynamic commands in a guild."""
+        return tuple(self._guild_commands.get(Snowflake(guild), ()))
+
+    async def sync_guild_commands(self, *, batch_size: int = 10) -> None:
+        """
+        Publish the commands of every guild whose dynamic commands changed since it was
+        last synced. Other guilds are not fetched or updated.
+
+        Args:
+            batch_size:
+                How many guilds are updated at the same time.
+        """
+        guilds, self._dirty_guilds = self._dirty_guilds, set()
+        if not guilds:
+            return
+
+        if not self._application_id:
+            me = await self._client.app.rest.fetch_application()
+            self._application_id = me.id
+
+        static_commands = self._build_guild_commands()
+        items = [(guild, self.__guild_commands(guild, static_commands)) for guild in guilds]
+        for i in range(0, len(items), batch_size):
+            await gather_iter(
+                self.__set_guild_commands(guild, commands)
+                for guild, commands in items[i : i + batch_size]
+            )
+
+    def __guild_commands(
+        self, guild: Snowflakeish, static_commands: dict[Snowflakeish, list[AppCommand]]
+    ) -> list[AppCommand]:
+        """The static and dynamic commands of a guild."""
+        dynamic_commands = self._guild_commands.get(Snowflake(guild), {})
+        return [
+            *static_commands.get(guild, ()),
+            *(app_command for app_command, _ in dynamic_commands.values()),
+        ]
+
+    async def __set_guild_commands(
+        self, guild: Snowflakeish, commands: Sequence[AppCommand]
+    ) -> None:
+        assert self._application_id
+        try:
+            await self._client.app.rest.set_application_commands(
+                application=self._application_id,
+                # The only method that is called has been implemented.
+                commands=commands,  # type: ignore
+                guild=guild,
+            )
+        except ForbiddenError:
+            _log.warning("Cannot post application commands to guild %s.", guild)
+            return
+        _log.info("Updated %s application commands for guild %s.", len(commands), guild)
+
     async def register_commands(self) -> None:
         guilds = list(self._guilds)
+        # Every guild is published here, so no guild needs to be synced again.
+        self._dirty_guilds.clear()
 
-        commands = self.__build_commands()
+        commands = self._build_commands()
 
         command_guilds: DefaultDict[Snowflakeish, list[AppCommand]] = defaultdict(list)
         global_commands: list[AppCommand] = []
@@ -416,6 +542,15 @@ class CommandHandler:
             else:
                 global_commands.append(command)
 
+        for guild, dynamic_commands in self._guild_commands.items():
+            if not dynamic_commands:
+                continue
+            command_guilds[guild].extend(
+                app_command for app_command, _ in dynamic_commands.values()
+            )
+            if guild in guilds:
+                guilds.remove(guild)
+
         if not self._application_id:
             me = await self._client.app.rest.fetch_application()
             self._application_id = me.id
@@ -440,11 +575,16 @@ class CommandHandler:
         Returns the information crescent stores for all the commands registered
         to the bot.
         """
-        return (command.metadata for command in self._registry.values())
+        yield from (command.metadata for command in self._registry.values())
+        for guild_commands in self._guild_commands.values():
+            for app_command, command in guild_commands.values():
+                yield command._to_includable(app_command, self._client).metadata
 
     @property
     def app_commands(self) -> Iterable[AppCommand]:
         """
         Returns the app commands registered to this bot.
         """
-        return (command.metadata.app_command for command in self._registry.values())
+        yield from (command.metadata.app_command for command in self._registry.values())
+        for guild_commands in self._guild_commands.values():
+            yield from (app_command for app_command, _ in guild_commands.values())
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import json
+import os
+from asyncio import sleep
+from hashlib import sha256
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hikari import UNDEFINED
+
+from crescent.internal.app_command import _options_key
+from crescent.locale import str_or_build_locale
+
+if TYPE_CHECKING:
+    from typing import Any, Sequence
+
+    from crescent.commands.groups import Group, SubGroup
+    from crescent.internal.app_command import AppCommandMeta, Unique
+    from crescent.internal.registry import CommandHandler
+    from crescent.locale import LocaleBuilder
+
+__all__: Sequence[str] = ("CommandSnapshot",)
+
+_log = getLogger(__name__)
+
+_VERSION = 2
+
+
+def _locale_key(value: str | LocaleBuilder | None) -> Any:
+    return None if value is None else str_or_build_locale(value)
+
+
+def _group_key(group: Group | SubGroup | None) -> Any:
+    if group is None:
+        return None
+    return (
+        _locale_key(group.name),
+        _locale_key(group.description),
+        getattr(group, "default_member_permissions", None),
+        getattr(group, "context_types", None),
+    )
+
+
+def _command_key(metadata: AppCommandMeta) -> Any:
+    app_command = metadata.app_command
+    return (
+        app_command.type,
+        _locale_key(app_command.name),
+        _locale_key(app_command.description),
+        _options_key(app_command.options or None),
+        app_command.build_default_member_perms(),
+        app_command.context_types,
+        app_command.nsfw,
+        _group_key(metadata.group),
+        _group_key(metadata.sub_group),
+    )
+
+
+def _json_default(value: Any) -> Any:
+    if value is UNDEFINED:
+        return None
+    if isinstance(value, (frozenset, set)):
+        return sorted(value)
+    return str(value)
+
+
+def _command_path(unique: Unique) -> str:
+    path = "/".join(
+        str(part)
+        for part in (unique.guild_id, unique.group, unique.sub_group, unique.name)
+        if part is not None
+    )
+    return f"{int(unique.type)}:{path}"
+
+
+class CommandSnapshot:
+    """
+    Lets several processes running the same bot share one command sync.
+
+    The first process to start takes a lock, publishes the commands and writes a
+    snapshot of the command tree. Every other process fingerprints its registered
+    commands, and if the fingerprint matches the snapshot, skips building, fetching,
+    comparing and publishing commands. If a process's commands differ from the
+    snapshot, for example during a rolling deploy, that process publishes its
+    commands and replaces the snapshot.
+
+    The snapshot maps every command to the `module:qualname` of the function or class
+    that defines it, and stores the published payloads.
+
+    > ⚠️ This is only available on platforms with `fcntl`, which is used to lock the
+    > snapshot between processes.
+
+    Args:
+        path:
+            The file to store the snapshot in. The lock is stored next to it.
+        poll_interval:
+            How often in seconds to check if the lock was released.
+    """
+
+    __slots__ = ("path", "lock_path", "poll_interval", "_fcntl", "_lock_fd")
+
+    def __init__(self, path: str | os.PathLike[str], *, poll_interval: float = 0.5) -> None:
+        try:
+            import fcntl
+        except ImportError:
+            raise ModuleNotFoundError("`CommandSnapshot` is not supported on this platform.")
+
+        self._fcntl = fcntl
+        self.path: Path = Path(path)
+        self.lock_path: Path = self.path.with_name(self.path.name + ".lock")
+        self.poll_interval: float = poll_interval
+        self._lock_fd: int | None = None
+
+    def commands(self, handler: CommandHandler) -> dict[str, str]:
+        """
+        Map every command registered to `handler` to the `module:qualname` of the
+        function or class that defines it.
+        """
+        commands: dict[str, str] = {}
+        for unique, command in handler._registry.items():
+            owner = command.metadata.owner
+            commands[_command_path(unique)] = (
+                f"{owner.__module__}:{getattr(owner, '__qualname__', repr(owner))}"
+            )
+        return commands
+
+    def fingerprint(self, handler: CommandHandler) -> str:
+        """
+        Hash the commands registered to `handler` without building them. Two processes
+        with the same fingerprint publish the same commands.
+        """
+        data = json.dumps(
+            {
+                "tracked_guilds": sorted(map(int, handler._guilds)),
+                "owners": self.commands(handler),
+                "commands": {
+                    _command_path(unique): _command_key(command.metadata)
+                    for unique, command in handler._registry.items()
+                },
+            },
+            sort_keys=True,
+            default=_json_default,
+        )
+        return sha256(data.encode()).hexdigest()
+
+    def build(self, handler: CommandHandler) -> dict[str, Any]:
+        """Build the snapshot for the commands registered to `handler`."""
+        entity_factory = handler._client.app.rest.entity_factory
+
+        return {
+            "version": _VERSION,
+            "hash": self.fingerprint(handler),
+            "commands": self.commands(handler),
+            "payloads": [
+                {"guild_id": command.guild_id, "command": command.build(entity_factory)}
+                for command in handler._build_commands()
+            ],
+        }
+
+    def read(self) -> dict[str, Any] | None:
+        """Return the stored snapshot, or `None` if there is no valid snapshot."""
+        try:
+            data: dict[str, Any] = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if data.get("version") != _VERSION:
+            return None
+        return data
+
+    def write(self, snapshot: dict[str, Any]) -> None:
+        """Store a snapshot. Other processes never see a partially written file."""
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(snapshot, default=str), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    async def sync(self, handler: CommandHandler) -> bool:
+        """
+        Publish the commands registered to `handler` unless the stored snapshot already
+        matches them.
+
+        Returns:
+            `True` if this process published the commands.
+        """
+        fingerprint = self.fingerprint(handler)
+
+        while True:
+            stored = self.read()
+            if stored and stored["hash"] == fingerprint:
+                _log.info("Commands match the snapshot in %s. Skipping command sync.", self.path)
+                return False
+
+            if self._acquire():
+                try:
+                    # Another process may have published while this one was waiting.
+                    stored = self.read()
+                    if stored and stored["hash"] == fingerprint:
+                        continue
+                    await handler.register_commands()
+                    self.write(self.build(handler))
+                finally:
+                    self._release()
+                return True
+
+            await sleep(self.poll_interval)
+
+    def _acquire(self) -> bool:
+        """
+        Try to lock the snapshot. The lock is held with `flock`, so it is released by
+        the operating system if the process holding it dies.
+        """
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._fcntl.flock(fd, self._fcntl.LOCK_EX | self._fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._lock_fd = fd
+        return True
+
+    def _release(self) -> None:
+        if self._lock_fd is None:
+            return
+        self._fcntl.flock(self._lock_fd, self._fcntl.LOCK_UN)
+        os.close(self._lock_fd)
+        self._lock_fd = None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from sys import intern
 from typing import Mapping, Sequence
 
 __all__: Sequence[str] = ("LocaleBuilder", "str_or_build_locale")
@@ -10,8 +11,14 @@ class LocaleBuilder(ABC):
     """
     A class that can be inherited from to created APIs to use locales in your
     code.
+
+    A builder is only built once. The fallback and the locales are stored on the
+    builder the first time they are used, so changes made to a builder after it was
+    used by a command are ignored.
     """
 
+    _crescent_localized: tuple[str, Mapping[str, str]]
+
     @abstractmethod
     def build(self) -> Mapping[str, str]:
         """
@@ -26,9 +33,16 @@ class LocaleBuilder(ABC):
     def fallback(self) -> str:
         """Return the name used when there is no localization for a language."""
 
+    def _localize(self) -> tuple[str, Mapping[str, str]]:
+        """Return the fallback and the locales, building them if this is the first call."""
+        built: tuple[str, Mapping[str, str]] | None = getattr(self, "_crescent_localized", None)
+        if built is None:
+            built = self._crescent_localized = (intern(self.fallback), self.build())
+        return built
+
 
 def str_or_build_locale(string_or_locale: str | LocaleBuilder) -> tuple[str, Mapping[str, str]]:
     if isinstance(string_or_locale, LocaleBuilder):
-        return (string_or_locale.fallback, string_or_locale.build())
+        return string_or_locale._localize()
     else:
         return (string_or_locale, {})
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import Sequence
 
-    from hikari import CommandInteraction, Role, User
+    from hikari import ResolvedOptionData, Role, Snowflake, User
 
 __all__: Sequence[str] = ("Mentionable",)
 
@@ -35,14 +35,13 @@ class Mentionable:
     role: Role | None
 
     @classmethod
-    def _from_interaction(cls: type[Mentionable], interaction: CommandInteraction) -> Mentionable:
-        if not interaction.resolved:
-            raise ValueError("Interaction.resolved should not be None")
+    def _from_resolved(
+        cls: type[Mentionable], resolved: ResolvedOptionData, id: Snowflake
+    ) -> Mentionable:
+        if user := resolved.users.get(id):
+            return cls(user=user, role=None)
 
-        if interaction.resolved.users:
-            return cls(user=next(iter(interaction.resolved.users.values())), role=None)
-
-        return cls(user=None, role=next(iter(interaction.resolved.roles.values())))
+        return cls(user=None, role=resolved.roles[id])
 
     @property
     def is_user(self) -> bool:
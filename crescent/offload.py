@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from asyncio import Semaphore
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING, Literal, Union
+
+if TYPE_CHECKING:
+    from typing import Hashable, Sequence
+
+__all__: Sequence[str] = ("OffloadPools", "ExecutorT")
+
+ExecutorT = Union[Literal["thread", "process"], Executor]
+"""Where `Context.offload` runs a function: `"thread"`, `"process"` or any `Executor`."""
+
+
+class OffloadPools:
+    """
+    The thread and process pools that `Context.offload` runs functions in. The pools
+    are created the first time they are used.
+
+    ### Example
+    ```python
+    client = crescent.Client(
+        bot, offload_pools=crescent.OffloadPools(max_threads=4, max_processes=2)
+    )
+    ```
+
+    Args:
+        max_threads:
+            The size of the thread pool. Defaults to the `ThreadPoolExecutor` default.
+        max_processes:
+            The size of the process pool. Defaults to the number of CPUs.
+        defer_after:
+            Defer the interaction if the offloaded function has not finished after this
+            amount of time. If `None`, interactions are not deferred by
+            `Context.offload`.
+    """
+
+    __slots__ = (
+        "max_threads",
+        "max_processes",
+        "defer_after",
+        "_thread_pool",
+        "_process_pool",
+        "_limits",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_threads: int | None = None,
+        max_processes: int | None = None,
+        defer_after: timedelta | None = timedelta(seconds=2),
+    ) -> None:
+        self.max_threads: int | None = max_threads
+        self.max_processes: int | None = max_processes
+        self.defer_after: timedelta | None = defer_after
+
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._limits: dict[tuple[Hashable, int], Semaphore] = {}
+        """A semaphore for every `(command, limit)` pair."""
+
+    def executor(self, executor: ExecutorT) -> Executor:
+        """Get the pool for `"thread"` or `"process"`. Other executors are returned as is."""
+        if executor == "thread":
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    self.max_threads, thread_name_prefix="crescent-offload"
+                )
+            return self._thread_pool
+        if executor == "process":
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(self.max_processes)
+            return self._process_pool
+
+        assert isinstance(executor, Executor)
+        return executor
+
+    def _limit(self, key: Hashable, limit: int) -> Semaphore:
+        semaphore = self._limits.get((key, limit))
+        if semaphore is None:
+            semaphore = self._limits[(key, limit)] = Semaphore(limit)
+        return semaphore
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the pools. They are created again if they are used after this."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait)
+            self._process_pool = None
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from collections import deque
+from datetime import timedelta
+from logging import getLogger
+from time import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from hikari import AutocompleteInteraction
+
+from crescent.internal.handle_resp import handle_resp
+from crescent.utils import create_task
+
+if TYPE_CHECKING:
+    from asyncio import Future
+    from typing import Callable, Mapping, Sequence
+
+    from hikari import PartialInteraction, Snowflakeish
+    from hikari.api import InteractionResponseBuilder
+
+    from crescent.client import Client
+
+__all__: Sequence[str] = ("FairScheduler",)
+
+_log = getLogger(__name__)
+
+
+def _is_autocomplete(interaction: PartialInteraction) -> bool:
+    return isinstance(interaction, AutocompleteInteraction)
+
+
+class _Item(NamedTuple):
+    client: Client
+    interaction: PartialInteraction
+    future: Future[InteractionResponseBuilder] | None
+    deadline: float
+    """The `time.time` timestamp the interaction must be answered by."""
+    low_priority: bool
+
+
+class _GuildQueue:
+    __slots__ = ("users", "deficit", "size")
+
+    def __init__(self) -> None:
+        self.users: dict[Snowflakeish, deque[_Item]] = {}
+        """The queue of every user. The user served next is first."""
+        self.deficit: float = 0.0
+        self.size: int = 0
+
+    def pop(self) -> _Item:
+        user = next(iter(self.users))
+        queue = self.users.pop(user)
+        item = queue.popleft()
+        if queue:
+            # Move the user to the back so every user in the guild gets a turn.
+            self.users[user] = queue
+        self.size -= 1
+        return item
+
+
+class FairScheduler:
+    """
+    Share the bot between guilds and users so one busy guild can not make
+    every other guild's commands time out.
+
+    Interactions are queued per user inside per-guild queues. Guilds are served with
+    deficit round robin, so a guild with weight `2` gets twice the share of a guild
+    with weight `1` when both have queued interactions. Users in a guild take turns.
+    DMs share one queue.
+
+    Interactions that can no longer be answered within Discord's 3 second deadline are
+    dropped. The deadline is measured from when the interaction was created, so the
+    system clock must be accurate.
+
+    ### Example
+    ```python
+    client = crescent.Client(
+        bot, scheduler=crescent.FairScheduler(max_running=32, guild_weights={MY_GUILD: 4})
+    )
+    ```
+
+    Args:
+        max_running:
+            The most interactions that are handled at the same time.
+        guild_weights:
+            The share of every guild. Weights must be greater than `0`. Guilds that
+            are not in this mapping have a weight of `1`.
+        max_guild_queue:
+            The most queued interactions for a guild. New interactions are dropped
+            while the queue is full. Must be at least `1`. If `None`, there is no
+            limit.
+        max_user_queue:
+            The most queued interactions for a user in a guild. If `None`, there is
+            no limit.
+        deadline:
+            How long after an interaction is created that it must be answered by.
+        min_time_left:
+            Low priority interactions are dropped when less than this amount of time
+            is left before the deadline. Other interactions are dropped when the
+            deadline has passed.
+        is_low_priority:
+            Return `True` for interactions that can be dropped early. Defaults to
+            autocomplete interactions.
+    """
+
+    __slots__ = (
+        "max_running",
+        "guild_weights",
+        "max_guild_queue",
+        "max_user_queue",
+        "deadline",
+        "min_time_left",
+        "is_low_priority",
+        "dropped",
+        "_guilds",
+        "_active",
+        "_running",
+        "_size",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_running: int = 64,
+        guild_weights: Mapping[Snowflakeish, float] | None = None,
+        max_guild_queue: int | None = 100,
+        max_user_queue: int | None = 10,
+        deadline: timedelta = timedelta(seconds=3),
+        min_time_left: timedelta = timedelta(milliseconds=500),
+        is_low_priority: Callable[[PartialInteraction], bool] = _is_autocomplete,
+    ) -> None:
+        if max_guild_queue is not None and max_guild_queue < 1:
+            raise ValueError("`max_guild_queue` must be at least 1.")
+        if guild_weights and any(weight <= 0 for weight in guild_weights.values()):
+            raise ValueError("Guild weights must be greater than 0.")
+
+        self.max_running: int = max_running
+        self.guild_weights: Mapping[Snowflakeish, float] = guild_weights or {}
+        self.max_guild_queue: int | None = max_guild_queue
+        self.max_user_queue: int | None = max_user_queue
+        self.deadline: timedelta = deadline
+        self.min_time_left: timedelta = min_time_left
+        self.is_low_priority: Callable[[PartialInteraction], bool] = is_low_priority
+        self.dropped: int = 0
+        """How many interactions were dropped."""
+
+        self._guilds: dict[Snowflakeish | None, _GuildQueue] = {}
+        self._active: deque[Snowflakeish | None] = deque()
+        """The guilds with queued interactions. The guild served next is first."""
+        self._running: int = 0
+        self._size: int = 0
+
+    @property
+    def queued(self) -> int:
+        """How many interactions are waiting to be handled."""
+        return self._size
+
+    @property
+    def running(self) -> int:
+        """How many interactions are being handled."""
+        return self._running
+
+    def _submit(
+        self,
+        client: Client,
+        interaction: PartialInteraction,
+        future: Future[InteractionResponseBuilder] | None,
+    ) -> None:
+        item = _Item(
+            client,
+            interaction,
+            future,
+            interaction.id.created_at.timestamp() + self.deadline.total_seconds(),
+            self.is_low_priority(interaction),
+        )
+
+        guild = interaction.guild_id
+        user = interaction.user.id
+        queue = self._guilds.get(guild)
+        if queue is None:
+            queue = self._guilds[guild] = _GuildQueue()
+            self._active.append(guild)
+
+        user_queue = queue.users.get(user)
+        if (self.max_guild_queue is not None and queue.size >= self.max_guild_queue) or (
+            user_queue is not None
+            and self.max_user_queue is not None
+            and len(user_queue) >= self.max_user_queue
+        ):
+            self._drop(item, "the queue is full")
+            return
+
+        if user_queue is None:
+            user_queue = queue.users[user] = deque()
+        user_queue.append(item)
+        queue.size += 1
+        self._size += 1
+
+        self._pump()
+
+    def _next(self) -> _Item | None:
+        """Pop the next interaction with deficit round robin."""
+        while self._active:
+            guild = self._active[0]
+            queue = self._guilds[guild]
+
+            if queue.deficit < 1:
+                queue.deficit += 1 if guild is None else self.guild_weights.get(guild, 1)
+                if queue.deficit < 1:
+                    self._active.rotate(-1)
+                    continue
+
+            item = queue.pop()
+            self._size -= 1
+
+            time_left = item.deadline - time()
+            expired = time_left <= 0 or (
+                item.low_priority and time_left < self.min_time_left.total_seconds()
+            )
+            if expired:
+                self._drop(item, "the deadline can not be met")
+            else:
+                queue.deficit -= 1
+
+            if not queue.size:
+                del self._guilds[guild]
+                self._active.popleft()
+            elif queue.deficit < 1:
+                self._active.rotate(-1)
+
+            if not expired:
+                return item
+        return None
+
+    def _drop(self, item: _Item, reason: str) -> None:
+        self.dropped += 1
+        _log.debug("Dropped interaction %s because %s.", item.interaction.id, reason)
+        if item.future is not None and not item.future.done():
+            item.future.cancel()
+
+    def _pump(self) -> None:
+        while self._running < self.max_running:
+            item = self._next()
+            if item is None:
+                return
+            self._running += 1
+            create_task(self._run(item))
+
+    async def _run(self, item: _Item) -> None:
+        try:
+            await handle_resp(item.client, item.interaction, item.future)
+        finally:
+            self._running -= 1
+            self._pump()
@@ -0,0 +1,459 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+from asyncio import FIRST_COMPLETED, Semaphore, gather, get_running_loop, sleep, wait
+from dataclasses import dataclass
+from itertools import count, cycle
+from os import fspath
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from hikari import InteractionType
+from hikari.impl import EntityFactoryImpl, HTTPSettings, ProxySettings
+
+from crescent.internal.handle_resp import handle_resp
+from crescent.utils import create_task
+
+if TYPE_CHECKING:
+    from asyncio import Task
+    from os import PathLike
+    from typing import IO, Any, Awaitable, Callable, Iterable, Mapping, Sequence
+
+    from hikari import PartialInteraction, ShardPayloadEvent, Snowflakeish
+
+    from crescent.client import Client
+
+__all__: Sequence[str] = (
+    "InteractionRecorder",
+    "load_payloads",
+    "generate_payload",
+    "StubBot",
+    "StubREST",
+    "LoadDriver",
+    "LoadReport",
+)
+
+_OPTION_TYPES: dict[type, int] = {bool: 5, int: 4, float: 10, str: 3}
+"""The Discord option type for every value type `generate_payload` supports."""
+
+
+class InteractionRecorder:
+    """
+    Writes the payload of every command and autocomplete interaction a bot receives to
+    a JSONL file, so the traffic can be replayed with `LoadDriver`. Pass this to
+    `crescent.Client` with the `interaction_recorder` kwarg. Only gateway bots can
+    record interactions.
+
+    Interaction tokens are not recorded.
+
+    Args:
+        path:
+            The file to append payloads to.
+        max_records:
+            Stop recording after this many payloads. If `None`, every payload is
+            recorded.
+    """
+
+    __slots__ = ("path", "max_records", "records", "_file")
+
+    def __init__(self, path: str | PathLike[str], *, max_records: int | None = None) -> None:
+        self.path: str = fspath(path)
+        self.max_records: int | None = max_records
+        self.records: int = 0
+        """How many payloads were recorded."""
+        self._file: IO[str] | None = None
+
+    def record(self, payload: Mapping[str, Any]) -> None:
+        """Append an interaction payload to the file."""
+        if self.max_records is not None and self.records >= self.max_records:
+            return
+
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+
+        self._file.write(json.dumps({**payload, "token": "recorded"}) + "\n")
+        self.records += 1
+
+    def close(self) -> None:
+        """Close the file. It is opened again if another payload is recorded."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def _on_payload(self, event: ShardPayloadEvent) -> None:
+        if event.name == "INTERACTION_CREATE" and event.payload.get("type") in (
+            InteractionType.APPLICATION_COMMAND,
+            InteractionType.AUTOCOMPLETE,
+        ):
+            self.record(event.payload)
+
+
+def load_payloads(path: str | PathLike[str]) -> list[dict[str, Any]]:
+    """Read the payloads written by an `InteractionRecorder`."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+_ids = count(1)
+
+
+def generate_payload(
+    name: str,
+    options: Mapping[str, str | int | float | bool] | None = None,
+    *,
+    group: str | None = None,
+    sub_group: str | None = None,
+    guild_id: Snowflakeish | None = None,
+    user_id: Snowflakeish = 1,
+) -> dict[str, Any]:
+    """
+    Create the payload of a slash command interaction.
+
+    ### Example
+    ```python
+    payloads = [generate_payload("roll", {"sides": n}) for n in range(1, 100)]
+    ```
+
+    Args:
+        name:
+            The name of the command.
+        options:
+            The value of every option.
+        group:
+            The group the command is in.
+        sub_group:
+            The sub group the command is in.
+        guild_id:
+            The guild the command is used in. If `None`, the command is used in DMs.
+        user_id:
+            The user that used the command.
+    """
+    command_options: list[dict[str, Any]] = [
+        {"name": key, "type": _OPTION_TYPES[type(value)], "value": value}
+        for key, value in (options or {}).items()
+    ]
+    command_name = name
+
+    if group:
+        command_name = group
+        command_options = [{"name": name, "type": 1, "options": command_options}]
+        if sub_group:
+            command_options = [{"name": sub_group, "type": 2, "options": command_options}]
+
+    interaction_id = next(_ids)
+    payload: dict[str, Any] = {
+        "id": str(interaction_id),
+        "application_id": "1",
+        "type": int(InteractionType.APPLICATION_COMMAND),
+        "token": "generated",
+        "version": 1,
+        "locale": "en-US",
+        "app_permissions": "0",
+        "authorizing_integration_owners": {},
+        "context": 0 if guild_id else 1,
+        "channel": {"id": "1", "type": 0 if guild_id else 1},
+        "user": {
+            "id": str(user_id),
+            "username": "user",
+            "discriminator": "0",
+            "avatar": None,
+            "global_name": None,
+        },
+        "data": {"id": "1", "name": command_name, "type": 1, "options": command_options},
+    }
+    if guild_id:
+        payload["guild_id"] = str(guild_id)
+    return payload
+
+
+class StubREST:
+    """
+    A stand-in for the REST client of a `StubBot`. Every method waits for the
+    latency and returns `None`.
+    """
+
+    __slots__ = ("latency", "calls")
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency: float = latency
+        self.calls: dict[str, int] = {}
+        """How many times every REST method was called."""
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[None]]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def request(*args: Any, **kwargs: Any) -> None:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if self.latency:
+                await sleep(self.latency)
+
+        return request
+
+
+class StubBot:
+    """
+    A bot that never connects to Discord, for use with `LoadDriver`. Responses are
+    sent to a `StubREST`.
+
+    Args:
+        rest_latency:
+            How long every REST request takes in seconds.
+    """
+
+    def __init__(self, *, rest_latency: float = 0.0) -> None:
+        self.rest: Any = StubREST(rest_latency)
+        self.entity_factory: EntityFactoryImpl = EntityFactoryImpl(self)  # type: ignore
+        self.interaction_server: Any = _StubInteractionServer()
+        self.executor: None = None
+        self.http_settings: HTTPSettings = HTTPSettings()
+        self.proxy_settings: ProxySettings = ProxySettings()
+
+
+class _StubInteractionServer:
+    def set_listener(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+@dataclass
+class LoadReport:
+    """The results of `LoadDriver.run`. Times are in seconds."""
+
+    requests: int
+    """How many interactions were handled."""
+    errors: int
+    """How many interactions raised an exception that crescent did not handle."""
+    duration: float
+    throughput: float
+    """Interactions handled every second."""
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+    loop_lag_mean: float
+    """How late the event loop ran callbacks on average."""
+    loop_lag_max: float
+    memory_growth: int | None
+    """
+    How much more memory Python had allocated at the end of the run than at the start,
+    in bytes. `None` unless `LoadDriver.trace_memory` is `True`.
+    """
+    memory_peak: int | None
+    """
+    The most memory Python had allocated during the run above what was allocated at the
+    start, in bytes. `None` unless `LoadDriver.trace_memory` is `True`.
+    """
+    rest_calls: Mapping[str, int]
+    """How many times every REST method was called."""
+
+    def summary(self) -> str:
+        """Return the report as text."""
+        lines = [
+            f"requests:   {self.requests} ({self.errors} errors) in {self.duration:.2f}s",
+            f"throughput: {self.throughput:.1f}/s",
+            "latency:    p50 {:.2f}ms, p90 {:.2f}ms, p99 {:.2f}ms, max {:.2f}ms".format(
+                *(
+                    t * 1000
+                    for t in (
+                        self.latency_p50,
+                        self.latency_p90,
+                        self.latency_p99,
+                        self.latency_max,
+                    )
+                )
+            ),
+            f"loop lag:   mean {self.loop_lag_mean * 1000:.2f}ms,"
+            f" max {self.loop_lag_max * 1000:.2f}ms",
+        ]
+        if self.memory_growth is not None and self.memory_peak is not None:
+            lines.append(
+                f"memory:     {self.memory_growth / 1024:+.0f}KiB,"
+                f" peak +{self.memory_peak / 1024:.0f}KiB"
+            )
+        return "\n".join(lines)
+
+
+class LoadDriver:
+    """
+    Replays interaction payloads through a client to measure how much traffic it can
+    handle. Payloads are used in order and repeated until the run is over.
+
+    The client should use a `StubBot`, so no requests are sent to Discord.
+
+    ### Example
+    ```python
+    from crescent.testing import LoadDriver, StubBot, load_payloads
+
+    client = crescent.Client(StubBot(rest_latency=0.05), update_commands=False)
+    client.plugins.load_folder("bot.plugins")
+
+    driver = LoadDriver(client, load_payloads("traffic.jsonl"), concurrency=50, duration=60)
+    print((await driver.run()).summary())
+    ```
+
+    Args:
+        client:
+            The client to send interactions to.
+        payloads:
+            Interaction payloads, from `load_payloads` or `generate_payload`.
+        concurrency:
+            The most interactions handled at the same time.
+        rate:
+            How many interactions are started every second. If `None`, interactions
+            are started as fast as possible.
+        duration:
+            Stop starting interactions after this many seconds.
+        requests:
+            Stop after this many interactions. If this and `duration` are `None`,
+            every payload is used once.
+        lag_interval:
+            How often to measure the event loop lag in seconds.
+        trace_memory:
+            Measure memory allocations with `tracemalloc`. This makes the run slower,
+            so latencies are higher than without it.
+    """
+
+    __slots__ = (
+        "client",
+        "payloads",
+        "concurrency",
+        "rate",
+        "duration",
+        "requests",
+        "lag_interval",
+        "trace_memory",
+    )
+
+    def __init__(
+        self,
+        client: Client,
+        payloads: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 10,
+        rate: float | None = None,
+        duration: float | None = None,
+        requests: int | None = None,
+        lag_interval: float = 0.01,
+        trace_memory: bool = False,
+    ) -> None:
+        self.client: Client = client
+        self.payloads: Sequence[Mapping[str, Any]] = tuple(payloads)
+        self.concurrency: int = concurrency
+        self.rate: float | None = rate
+        self.duration: float | None = duration
+        self.requests: int | None = requests
+        self.lag_interval: float = lag_interval
+        self.trace_memory: bool = trace_memory
+
+        if not self.payloads:
+            raise ValueError("At least one payload is required.")
+        if duration is None and requests is None:
+            self.requests = len(self.payloads)
+
+    def _deserialize(self, payload: Mapping[str, Any]) -> PartialInteraction:
+        entity_factory = self.client.app.entity_factory
+        if payload["type"] == InteractionType.AUTOCOMPLETE:
+            return entity_factory.deserialize_autocomplete_interaction(payload)  # type: ignore
+        return entity_factory.deserialize_command_interaction(payload)  # type: ignore
+
+    async def run(self) -> LoadReport:
+        """Send interactions to the client until the run is over and report the results."""
+        interactions = [self._deserialize(payload) for payload in self.payloads]
+        loop = get_running_loop()
+
+        latencies: list[float] = []
+        lags: list[float] = []
+        errors = 0
+        semaphore = Semaphore(self.concurrency)
+        tasks: set[Task[None]] = set()
+        rest_calls_before = _rest_calls(self.client)
+        memory_before = 0
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            memory_before, _ = tracemalloc.get_traced_memory()
+
+        async def handle(interaction: PartialInteraction) -> None:
+            nonlocal errors
+            await semaphore.acquire()
+            start = perf_counter()
+            try:
+                await handle_resp(self.client, interaction, None)
+            except Exception:
+                errors += 1
+            finally:
+                latencies.append(perf_counter() - start)
+                semaphore.release()
+
+        async def measure_lag() -> None:
+            while True:
+                expected = loop.time() + self.lag_interval
+                await sleep(self.lag_interval)
+                lags.append(max(0.0, loop.time() - expected))
+
+        lag_task = create_task(measure_lag())
+        start = perf_counter()
+
+        for i, interaction in enumerate(cycle(interactions)):
+            if self.requests is not None and i >= self.requests:
+                break
+            if self.duration is not None and perf_counter() - start >= self.duration:
+                break
+            if self.rate is not None:
+                delay = start + i / self.rate - perf_counter()
+                if delay > 0:
+                    await sleep(delay)
+
+            if len(tasks) >= self.concurrency:
+                # Don't start more tasks than can run so memory stays bounded.
+                await wait(tasks, return_when=FIRST_COMPLETED)
+            task = create_task(handle(interaction))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await gather(*tasks)
+
+        elapsed = perf_counter() - start
+        lag_task.cancel()
+
+        latencies.sort()
+        memory_growth: int | None = None
+        memory_peak: int | None = None
+        if self.trace_memory:
+            memory_after, peak = tracemalloc.get_traced_memory()
+            memory_growth = memory_after - memory_before
+            memory_peak = peak - memory_before
+            if started_tracing:
+                tracemalloc.stop()
+        return LoadReport(
+            requests=len(latencies),
+            errors=errors,
+            duration=elapsed,
+            throughput=len(latencies) / elapsed if elapsed else 0.0,
+            latency_p50=_percentile(latencies, 0.5),
+            latency_p90=_percentile(latencies, 0.9),
+            latency_p99=_percentile(latencies, 0.99),
+            latency_max=latencies[-1] if latencies else 0.0,
+            loop_lag_mean=sum(lags) / len(lags) if lags else 0.0,
+            loop_lag_max=max(lags, default=0.0),
+            memory_growth=memory_growth,
+            memory_peak=memory_peak,
+            rest_calls={
+                name: calls - rest_calls_before.get(name, 0)
+                for name, calls in _rest_calls(self.client).items()
+            },
+        )
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(percentile * len(values)))]
+
+
+def _rest_calls(client: Client) -> dict[str, int]:
+    rest = client.app.rest
+    return dict(rest.calls) if isinstance(rest, StubREST) else {}
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+try:
+    from opentelemetry import trace as otel_trace  # type: ignore
+except ImportError:
+    otel_trace = None
+
+if TYPE_CHECKING:
+    from typing import Iterator, Mapping, Sequence
+
+__all__: Sequence[str] = ("Tracer", "MemoryTracer", "RecordedSpan", "OpenTelemetryTracer")
+
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+@runtime_checkable
+class Tracer(Protocol):
+    """
+    Opens spans around the phases of an interaction. Pass a tracer to `crescent.Client`
+    with the `tracer` kwarg.
+
+    Crescent opens these spans. Spans opened while another span is open are nested in
+    it.
+
+    - `crescent.interaction`: Everything crescent does for one interaction. Has the
+        `crescent.interaction.id`, `crescent.command` and `crescent.guild.id`
+        attributes.
+    - `crescent.context`: Creating the context.
+    - `crescent.hook`: Every hook. The name of the hook is the `crescent.hook`
+        attribute.
+    - `crescent.converters`: The converters of a class command.
+    - `crescent.callback`: The command or autocomplete callback.
+    - `crescent.respond`, `crescent.defer`, `crescent.edit`, `crescent.followup` and
+        `crescent.delete`: The REST requests made by `crescent.Context`.
+    - `crescent.error_handler`: Error handlers for an exception raised by the command.
+    """
+
+    def span(
+        self, name: str, attributes: Mapping[str, Any] | None = None
+    ) -> AbstractContextManager[Any]:
+        """Return a context manager that opens a span while it is entered."""
+        ...
+
+
+def span(
+    tracer: Tracer | None, name: str, attributes: Mapping[str, Any] | None = None
+) -> AbstractContextManager[Any]:
+    """Open a span with `tracer`, or do nothing if there is no tracer."""
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, attributes)
+
+
+@dataclass
+class RecordedSpan:
+    """A span recorded by `MemoryTracer`."""
+
+    name: str
+    attributes: Mapping[str, Any]
+    parent: RecordedSpan | None = field(repr=False)
+    start: float
+    """The `time.perf_counter` time the span started at."""
+    end: float | None = None
+    """The `time.perf_counter` time the span ended at, or `None` if it is still open."""
+    exception: BaseException | None = None
+    """The exception that was raised in the span."""
+
+    @property
+    def duration(self) -> float | None:
+        """How long the span was open in seconds."""
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+
+_current_span: ContextVar[RecordedSpan | None] = ContextVar("_current_span", default=None)
+
+
+class MemoryTracer:
+    """
+    A `Tracer` that keeps every span in a list. Useful for tests.
+
+    ### Example
+    ```python
+    tracer = crescent.MemoryTracer()
+    client = crescent.Client(bot, tracer=tracer)
+
+    ...
+
+    for span in tracer.spans:
+        print(span.name, span.duration)
+    ```
+    """
+
+    __slots__ = ("spans",)
+
+    def __init__(self) -> None:
+        self.spans: list[RecordedSpan] = []
+
+    @contextmanager
+    def span(
+        self, name: str, attributes: Mapping[str, Any] | None = None
+    ) -> Iterator[RecordedSpan]:
+        record = RecordedSpan(name, dict(attributes or {}), _current_span.get(), perf_counter())
+        self.spans.append(record)
+
+        token = _current_span.set(record)
+        try:
+            yield record
+        except BaseException as e:
+            record.exception = e
+            raise
+        finally:
+            record.end = perf_counter()
+            _current_span.reset(token)
+
+    def find(self, name: str) -> list[RecordedSpan]:
+        """Return every span with this name."""
+        return [span for span in self.spans if span.name == name]
+
+    def clear(self) -> None:
+        """Remove every recorded span."""
+        self.spans.clear()
+
+
+class OpenTelemetryTracer:
+    """
+    A `Tracer` that creates OpenTelemetry spans. Requires `opentelemetry-api`, which is
+    installed with `hikari-crescent[opentelemetry]`.
+
+    ### Example
+    ```python
+    client = crescent.Client(bot, tracer=crescent.OpenTelemetryTracer())
+    ```
+
+    Args:
+        tracer:
+            The OpenTelemetry tracer to create spans with. If `None`, the tracer for
+            `crescent` from the global tracer provider is used.
+    """
+
+    __slots__ = ("tracer",)
+
+    def __init__(self, tracer: Any = None) -> None:
+        if tracer is None:
+            if otel_trace is None:
+                raise ModuleNotFoundError(
+                    "`hikari-crescent[opentelemetry]` must be installed to use"
+                    " `OpenTelemetryTracer`."
+                )
+            tracer = otel_trace.get_tracer("crescent")
+        self.tracer: Any = tracer
+
+    def span(
+        self, name: str, attributes: Mapping[str, Any] | None = None
+    ) -> AbstractContextManager[Any]:
+        return self.tracer.start_as_current_span(name, attributes=attributes)  # type: ignore
@@ -1,22 +1,89 @@
 from __future__ import annotations
 
-from typing import Sequence, TypeVar
+from typing import Any, Iterator, Sequence, TypeVar, overload
+from weakref import WeakValueDictionary
 
 __all__: Sequence[str] = ("add_hooks",)
 
 T = TypeVar("T")
 
 
+class _HookChain(Sequence[T]):
+    """
+    An immutable sequence of hooks. Unlike a tuple it can be weakly referenced, so
+    equal chains can be shared without keeping unused chains alive.
+    """
+
+    __slots__ = ("_hooks", "__weakref__")
+
+    def __init__(self, hooks: tuple[T, ...]) -> None:
+        self._hooks: tuple[T, ...] = hooks
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[T, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> T | tuple[T, ...]:
+        return self._hooks[index]
+
+    def __len__(self) -> int:
+        return len(self._hooks)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._hooks)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _HookChain):
+            return self._hooks == other._hooks
+        return self._hooks == other
+
+    def __hash__(self) -> int:
+        return hash(self._hooks)
+
+    def __repr__(self) -> str:
+        return repr(self._hooks)
+
+
+_HOOK_CHAINS: WeakValueDictionary[tuple[Any, ...], _HookChain[Any]] = WeakValueDictionary()
+"""
+Every hook chain in use, so equal chains are only stored once. A chain is removed
+when no command or event uses it anymore.
+"""
+
+
+def _intern_hooks(hooks: tuple[T, ...]) -> Sequence[T]:
+    try:
+        chain = _HOOK_CHAINS.get(hooks)
+        if chain is None:
+            chain = _HOOK_CHAINS[hooks] = _HookChain(hooks)
+    except TypeError:
+        # A hook isn't hashable, so this chain can't be shared.
+        return hooks
+    return chain
+
+
 def add_hooks(
-    hooks: list[T], after_hooks: list[T], hooks_to_add: Sequence[T], *, prepend: bool, after: bool
-) -> None:
-    def extend_or_prepend(list_to_edit: list[T]) -> None:
+    hooks: Sequence[T],
+    after_hooks: Sequence[T],
+    hooks_to_add: Sequence[T],
+    *,
+    prepend: bool,
+    after: bool,
+) -> tuple[Sequence[T], Sequence[T]]:
+    """
+    Return `hooks` and `after_hooks` with `hooks_to_add` added to one of them. Equal
+    hook chains are shared between every command and event that uses them.
+    """
+
+    def extend_or_prepend(chain: Sequence[T]) -> Sequence[T]:
+        if not hooks_to_add:
+            return chain
         if prepend:
-            list_to_edit[:0] = hooks_to_add
-        else:
-            list_to_edit.extend(hooks_to_add)
+            return _intern_hooks((*hooks_to_add, *chain))
+        return _intern_hooks((*chain, *hooks_to_add))
 
     if not after:
-        extend_or_prepend(hooks)
-    else:
-        extend_or_prepend(after_hooks)
+        return extend_or_prepend(hooks), after_hooks
+    return hooks, extend_or_prepend(after_hooks)
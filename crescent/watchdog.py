@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import sys
+from asyncio import current_task, get_running_loop
+from collections import deque
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from logging import getLogger
+from threading import Event, Thread, get_ident
+from time import monotonic, time
+from traceback import format_stack
+from typing import TYPE_CHECKING, Any
+
+from crescent.internal.app_command import Unique
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, Task, TimerHandle
+    from typing import Iterator, Sequence
+
+__all__: Sequence[str] = ("LoopWatchdog", "StallReport")
+
+_log = getLogger(__name__)
+
+_NO_WATCH: AbstractContextManager[None] = nullcontext()
+
+
+@dataclass
+class StallReport:
+    """An event loop stall found by `LoopWatchdog`."""
+
+    handler: str
+    """The crescent handler that was running, or `"unknown"`."""
+    duration: float
+    """How long the event loop was blocked in seconds."""
+    samples: Sequence[str]
+    """Stack traces of the event loop's thread taken while it was blocked."""
+    started_at: float
+    """The `time.time` timestamp the stall was found at."""
+
+
+class _Stall:
+    __slots__ = ("beat", "handler", "samples", "started_at")
+
+    def __init__(self, beat: float, handler: str) -> None:
+        self.beat = beat
+        self.handler = handler
+        self.samples: list[str] = []
+        self.started_at = time()
+
+
+class LoopWatchdog:
+    """
+    Finds code that blocks the event loop. A thread checks that the event loop is still
+    running callbacks. When it is blocked for longer than `threshold`, the command,
+    event or task that was running is reported with stack traces of the blocking code.
+
+    Pass this to `crescent.Client` with the `watchdog` kwarg. The watchdog starts when
+    the bot starts.
+
+    ### Example
+    ```python
+    client = crescent.Client(bot, watchdog=crescent.LoopWatchdog(threshold=0.2))
+    ```
+
+    Reports are logged as warnings at most once every `report_interval` seconds for
+    each handler, and the latest reports are kept in `LoopWatchdog.reports`.
+
+    Args:
+        threshold:
+            How long in seconds the event loop must be blocked to be reported.
+        interval:
+            How often in seconds the event loop is checked.
+        report_interval:
+            The shortest time in seconds between two logged reports for the same
+            handler.
+        max_samples:
+            The most stack traces taken during one stall.
+        max_reports:
+            How many reports are kept in `LoopWatchdog.reports`.
+    """
+
+    __slots__ = (
+        "threshold",
+        "interval",
+        "report_interval",
+        "max_samples",
+        "reports",
+        "max_lag",
+        "_handlers",
+        "_loop",
+        "_loop_thread",
+        "_last_beat",
+        "_timer",
+        "_running",
+        "_thread",
+        "_stopped",
+        "_last_logged",
+        "_suppressed",
+    )
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.1,
+        interval: float = 0.02,
+        report_interval: float = 60,
+        max_samples: int = 5,
+        max_reports: int = 100,
+    ) -> None:
+        self.threshold: float = threshold
+        self.interval: float = interval
+        self.report_interval: float = report_interval
+        self.max_samples: int = max_samples
+        self.reports: deque[StallReport] = deque(maxlen=max_reports)
+        """The latest stalls, including the ones that were not logged."""
+        self.max_lag: float = 0.0
+        """The most the event loop was late to run a check, in seconds."""
+
+        self._handlers: dict[Task[Any], object] = {}
+        """The crescent handler that every task is running."""
+        self._loop: AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._last_beat: float = 0.0
+        self._timer: TimerHandle | None = None
+        self._running: bool = False
+        self._thread: Thread | None = None
+        self._stopped: Event = Event()
+        """Set to stop the current watchdog thread."""
+        self._last_logged: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """Start watching the running event loop."""
+        if self._running:
+            return
+
+        self._loop = get_running_loop()
+        self._loop_thread = get_ident()
+        self._running = True
+        self._beat(monotonic())
+
+        # Every thread has its own event, so a thread that is still stopping can not
+        # see the watchdog was started again.
+        self._stopped = Event()
+        self._thread = Thread(
+            target=self._watch, args=(self._stopped,), name="crescent-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching the event loop and wait for the watchdog thread to exit."""
+        self._running = False
+        self._stopped.set()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _beat(self, expected: float) -> None:
+        """Run on the event loop to show it is not blocked."""
+        now = monotonic()
+        self.max_lag = max(self.max_lag, now - expected)
+        self._last_beat = now
+
+        if self._running:
+            assert self._loop
+            self._timer = self._loop.call_later(self.interval, self._beat, now + self.interval)
+
+    def _watch(self, stopped: Event) -> None:
+        """Run in the watchdog thread."""
+        loop = self._loop
+        assert loop
+        stall: _Stall | None = None
+
+        while not loop.is_closed():
+            if stopped.wait(self.interval / 2):
+                return
+            beat = self._last_beat
+
+            if stall is not None and beat != stall.beat:
+                self._report(stall, beat - stall.beat - self.interval)
+                stall = None
+
+            if stall is None and monotonic() - beat - self.interval >= self.threshold:
+                stall = _Stall(beat, self._current_handler(loop))
+            if stall is not None and len(stall.samples) < self.max_samples:
+                if sample := self._sample():
+                    stall.samples.append(sample)
+
+    def _current_handler(self, loop: AbstractEventLoop) -> str:
+        task = current_task(loop)
+        handler = self._handlers.get(task) if task else None
+        return "unknown" if handler is None else _describe(handler)
+
+    def _sample(self) -> str | None:
+        assert self._loop_thread is not None
+        frame = sys._current_frames().get(self._loop_thread)
+        if frame is None:
+            return None
+        return "".join(format_stack(frame))
+
+    def _report(self, stall: _Stall, duration: float) -> None:
+        report = StallReport(stall.handler, duration, tuple(stall.samples), stall.started_at)
+        self.reports.append(report)
+
+        now = monotonic()
+        last_logged = self._last_logged.get(report.handler)
+        if last_logged is not None and now - last_logged < self.report_interval:
+            self._suppressed[report.handler] = self._suppressed.get(report.handler, 0) + 1
+            return
+
+        self._last_logged[report.handler] = now
+        suppressed = self._suppressed.pop(report.handler, 0)
+        _log.warning(
+            "The event loop was blocked for %.3fs by %s.%s\n%s",
+            report.duration,
+            report.handler,
+            f" It was blocked {suppressed} more times since the last report."
+            if suppressed
+            else "",
+            report.samples[0] if report.samples else "No stack trace was taken.",
+        )
+
+    @contextmanager
+    def _watching(self, handler: object) -> Iterator[None]:
+        task = current_task()
+        if task is None:
+            yield
+            return
+
+        previous = self._handlers.get(task)
+        self._handlers[task] = handler
+        try:
+            yield
+        finally:
+            if previous is None:
+                del self._handlers[task]
+            else:
+                self._handlers[task] = previous
+
+
+def watch(watchdog: LoopWatchdog | None, handler: object) -> AbstractContextManager[None]:
+    """
+    Mark `handler` as the crescent handler the current task is running, or do nothing
+    if there is no watchdog. `handler` is only turned into a string when a stall is
+    reported.
+    """
+    if watchdog is None:
+        return _NO_WATCH
+    return watchdog._watching(handler)
+
+
+def _describe(handler: object) -> str:
+    if isinstance(handler, Unique):
+        path = " ".join(filter(None, (handler.group, handler.sub_group, handler.name)))
+        if handler.guild_id:
+            return f"command `{path}` in guild {handler.guild_id}"
+        return f"command `{path}`"
+    if isinstance(handler, type):
+        return f"event `{handler.__name__}`"
+    return str(handler)
@@ -0,0 +1,35 @@
+from asyncio import sleep
+from unittest.mock import Mock
+
+from pytest import mark
+
+from crescent import Context, command, option
+
+
+@mark.asyncio
+async def test_class_command_converters() -> None:
+    calls: list[str] = []
+
+    async def slow_int(value: str) -> int:
+        calls.append(value)
+        await sleep(0)
+        return int(value)
+
+    values: dict[str, object] = {}
+
+    @command
+    class test_command:
+        first = option(str).convert(slow_int)
+        second = option(str).convert(slow_int)
+        renamed = option(str, name="custom-name").convert(int)
+        plain = option(str, default="default")
+
+        async def callback(self, ctx: Context) -> None:
+            values.update(vars(self))
+
+    await test_command.metadata.callback(
+        Mock(client=Mock(tracer=None)), first="1", second="2", **{"custom-name": "3"}
+    )
+
+    assert sorted(calls) == ["1", "2"]
+    assert values == {"first": 1, "second": 2, "renamed": 3, "plain": "default"}
@@ -0,0 +1,143 @@
+from asyncio import Event, gather, sleep
+from datetime import timedelta
+from unittest.mock import Mock
+
+from pytest import mark
+
+from crescent import Context, ConverterCache, command, option
+
+
+def _ctx(guild_id: int | None = None) -> Mock:
+    ctx = Mock()
+    ctx.client.tracer = None
+    ctx.guild_id = guild_id
+    return ctx
+
+
+def test_sync_converter_cached():
+    calls: list[str] = []
+    cache = ConverterCache()
+
+    def conv(value: str) -> int:
+        calls.append(value)
+        return int(value)
+
+    assert cache._convert(conv, "1", None) == 1
+    assert cache._convert(conv, "1", None) == 1
+    assert cache._convert(conv, "2", None) == 2
+
+    assert calls == ["1", "2"]
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+
+def test_max_size_evicts_least_recently_used():
+    cache = ConverterCache(max_size=2)
+
+    cache._convert(int, "1", None)
+    cache._convert(int, "2", None)
+    cache._convert(int, "1", None)
+    cache._convert(int, "3", None)
+
+    assert list(cache._entries) == [(None, "1"), (None, "3")]
+
+
+def test_ttl(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr("crescent.commands.converter_cache.monotonic", lambda: now)
+    cache = ConverterCache(ttl=timedelta(seconds=10))
+
+    cache._convert(int, "1", None)
+    now = 5
+    cache._convert(int, "1", None)
+    now = 11
+    cache._convert(int, "1", None)
+
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_zero_ttl(monkeypatch):
+    monkeypatch.setattr("crescent.commands.converter_cache.monotonic", lambda: 0.0)
+    cache = ConverterCache(ttl=timedelta(0))
+
+    cache._convert(int, "1", None)
+    cache._convert(int, "1", None)
+
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_key_and_per_guild():
+    cache = ConverterCache(key=str.lower, per_guild=True)
+
+    cache._convert(str.upper, "a", 1)
+    cache._convert(str.upper, "A", 1)
+    cache._convert(str.upper, "a", 2)
+
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@mark.asyncio
+async def test_single_flight():
+    release = Event()
+    calls = 0
+
+    async def conv(value: str) -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return int(value)
+
+    cache = ConverterCache()
+    first = cache._convert(conv, "1", None)
+    second = cache._convert(conv, "1", None)
+    release.set()
+
+    assert await gather(first, second) == [1, 1]
+    assert calls == 1
+    assert cache._convert(conv, "1", None) == 1
+
+
+@mark.asyncio
+async def test_errors_not_cached():
+    async def conv(value: str) -> int:
+        await sleep(0)
+        return int(value)
+
+    cache = ConverterCache()
+
+    for _ in range(2):
+        try:
+            await cache._convert(conv, "oops", None)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError
+
+    assert cache.misses == 2
+    assert len(cache) == 0
+
+
+@mark.asyncio
+async def test_class_command_uses_cache():
+    calls = 0
+    values: list[int] = []
+
+    async def conv(value: str) -> int:
+        nonlocal calls
+        calls += 1
+        return int(value)
+
+    cache = ConverterCache()
+
+    @command
+    class test_command:
+        arg = option(str).convert(conv, cache=cache)
+
+        async def callback(self, ctx: Context) -> None:
+            values.append(self.arg)
+
+    await test_command.metadata.callback(_ctx(), arg="1")
+    await test_command.metadata.callback(_ctx(), arg="1")
+
+    assert values == [1, 1]
+    assert calls == 1
+    assert cache.hit_rate == 0.5
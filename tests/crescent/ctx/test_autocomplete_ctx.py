@@ -53,6 +53,8 @@ ctx = AutocompleteContext(
     command=None,
     interaction=interaction,
     _rest_interaction_future=None,
+    _auto_defer=None,
+    _response_message=None,
 )
 
 
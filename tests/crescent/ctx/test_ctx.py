@@ -26,6 +26,8 @@ def test_into():
         _has_created_response=21,
         _has_deferred_response=22,
         _rest_interaction_future=23,
+        _auto_defer=24,
+        _response_message=25,
     )
 
     ctx2 = ctx.into(InteractionContext)
@@ -53,3 +55,5 @@ def test_into():
     assert ctx._has_created_response == ctx2._has_created_response
     assert ctx._has_deferred_response == ctx2._has_deferred_response
     assert ctx._rest_interaction_future == ctx2._rest_interaction_future
+    assert ctx._auto_defer == ctx2._auto_defer
+    assert ctx._response_message == ctx2._response_message
@@ -0,0 +1,46 @@
+from asyncio import sleep
+from unittest.mock import AsyncMock, Mock
+
+from pytest import mark
+
+from crescent import CoalescingEditor
+
+
+def _mock_ctx() -> Mock:
+    ctx = Mock()
+    ctx.edit = AsyncMock(side_effect=lambda **kwargs: kwargs)
+    ctx.followup = AsyncMock(side_effect=lambda **kwargs: kwargs)
+    return ctx
+
+
+@mark.asyncio
+async def test_edits_are_coalesced():
+    ctx = _mock_ctx()
+    editor = CoalescingEditor(ctx, interval=0.05)
+
+    first = editor.edit("0%")
+    await sleep(0)
+    # The first edit is sent right away. The rest are merged into one edit.
+    for i in range(1, 50):
+        last = editor.edit(f"{i}%", embed="embed")
+    editor.edit(embeds=["embeds"])
+
+    await editor.flush()
+
+    assert ctx.edit.await_count == 2
+    assert await first == {"content": "0%"}
+    assert await last == {"content": "49%", "embeds": ["embeds"]}
+
+
+@mark.asyncio
+async def test_followups_are_sent_in_order_and_spaced():
+    ctx = _mock_ctx()
+    editor = CoalescingEditor(ctx, interval=0.02)
+
+    futures = [editor.followup(str(i)) for i in range(3)]
+    await sleep(0.01)
+    assert ctx.followup.await_count == 1
+
+    await editor.flush()
+
+    assert [(await f)["content"] for f in futures] == ["0", "1", "2"]
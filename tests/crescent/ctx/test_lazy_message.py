@@ -0,0 +1,58 @@
+from asyncio import gather, sleep
+from unittest.mock import Mock
+
+from pytest import mark, raises
+
+from crescent import LazyMessage
+
+
+@mark.asyncio
+async def test_concurrent_awaits_fetch_once():
+    message = Mock()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await sleep(0)
+        return message
+
+    lazy = LazyMessage(fetch)
+    assert lazy.resolved is None
+
+    results = await gather(lazy, lazy, lazy.get())
+
+    assert results == [message, message, message]
+    assert calls == 1
+    assert await lazy is message
+    assert calls == 1
+
+
+@mark.asyncio
+async def test_set_skips_fetch():
+    async def fetch():
+        raise AssertionError("The message should not be fetched.")
+
+    message = Mock()
+    lazy = LazyMessage(fetch)
+    lazy.set(message)
+
+    assert await lazy is message
+
+
+@mark.asyncio
+async def test_failed_fetch_is_retried():
+    message = Mock()
+    fail = True
+
+    async def fetch():
+        if fail:
+            raise RuntimeError
+        return message
+
+    lazy = LazyMessage(fetch)
+    with raises(RuntimeError):
+        await lazy
+
+    fail = False
+    assert await lazy is message
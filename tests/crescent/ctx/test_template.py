@@ -0,0 +1,40 @@
+from unittest.mock import Mock
+
+from hikari import Embed, MessageFlag
+from hikari.impl import EntityFactoryImpl, MessageActionRowBuilder
+from pytest import MonkeyPatch
+
+from crescent import ResponseTemplate
+
+
+def test_static_payload_is_built_once(monkeypatch: MonkeyPatch):
+    entity_factory = EntityFactoryImpl(Mock())
+    serialize_embed = Mock(wraps=entity_factory.serialize_embed)
+    monkeypatch.setattr(EntityFactoryImpl, "serialize_embed", serialize_embed)
+
+    row = MessageActionRowBuilder().add_interactive_button(1, "custom-id", label="Click")
+    template = ResponseTemplate(
+        "default", embed=Embed(title="Help"), component=row, ephemeral=True
+    )
+
+    first, _ = template._builder("first").build(entity_factory)
+    second, _ = template._builder(template.content).build(entity_factory)
+
+    assert serialize_embed.call_count == 1
+    assert first["data"]["content"] == "first"
+    assert second["data"]["content"] == "default"
+    assert first["data"]["embeds"] == second["data"]["embeds"]
+    assert first["data"]["flags"] == MessageFlag.EPHEMERAL
+    assert first["data"]["components"] is second["data"]["components"]
+
+
+def test_components_are_built_once():
+    builder = Mock()
+    builder.build.return_value = {"type": 1}
+    template = ResponseTemplate(components=[builder])
+
+    prebuilt = template._message_kwargs["components"][0]
+    prebuilt.build()
+    prebuilt.build()
+
+    builder.build.assert_called_once()
@@ -0,0 +1,213 @@
+from asyncio import create_task, gather, sleep
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+from pytest import MonkeyPatch, fixture, mark
+
+from crescent.ext.cooldowns import (
+    Bucket,
+    CooldownMapping,
+    KVStorage,
+    Limit,
+    MemoryKVBackend,
+    MemoryStorage,
+    SharedMemoryStorage,
+    composite_cooldown,
+)
+from crescent.ext.cooldowns import kv as kv_module
+from crescent.ext.cooldowns import mapping as mapping_module
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@fixture
+def clock(monkeypatch: MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(mapping_module, "monotonic", clock)
+    return clock
+
+
+def test_capacity_and_retry_after(clock: Clock):
+    mapping = CooldownMapping(capacity=2, period=timedelta(seconds=10))
+
+    assert mapping.trigger("a") is None
+    assert mapping.trigger("a") is None
+    assert mapping.trigger("a") == timedelta(seconds=5)
+    assert mapping.trigger("b") is None
+
+    clock.now += 5
+    assert mapping.trigger("a") is None
+    assert mapping.trigger("a") is not None
+
+    assert mapping.stats.triggers == 4
+    assert mapping.stats.rejections == 2
+
+
+def test_tokens_and_reset(clock: Clock):
+    mapping = CooldownMapping(capacity=3, period=timedelta(seconds=30))
+
+    assert mapping.tokens("a") == 3
+    mapping.trigger("a")
+    assert mapping.tokens("a") == 2
+
+    mapping.reset("a")
+    assert mapping.tokens("a") == 3
+    assert mapping.retry_after("a") is None
+
+
+def test_idle_buckets_are_swept(clock: Clock):
+    mapping = CooldownMapping(capacity=1, period=timedelta(seconds=10))
+
+    mapping.trigger("a")
+    mapping.trigger("b")
+    assert len(mapping) == 2
+
+    clock.now += 10
+    mapping.trigger("c")
+
+    assert len(mapping) == 1
+    assert mapping.stats.swept == 2
+
+
+def test_max_buckets_evicts_least_recently_used(clock: Clock):
+    mapping = CooldownMapping(capacity=1, period=timedelta(seconds=10), max_buckets=2)
+
+    mapping.trigger("a")
+    mapping.trigger("b")
+    # "a" is now the most recently used bucket.
+    assert mapping.trigger("a") is not None
+    mapping.trigger("c")
+
+    assert len(mapping) == 2
+    assert mapping.stats.evictions == 1
+    assert mapping.trigger("a") is not None
+    assert mapping.trigger("b") is None
+
+
+@mark.asyncio
+async def test_shared_memory_storage_is_shared(tmp_path: Path):
+    period = timedelta(seconds=10)
+    first = SharedMemoryStorage(tmp_path / "cooldowns", slots=64)
+    second = SharedMemoryStorage(tmp_path / "cooldowns", slots=64)
+
+    assert await first.trigger(("cmd", 1), 2, period) is None
+    assert await second.trigger(("cmd", 1), 2, period) is None
+    assert await first.trigger(("cmd", 1), 2, period) is not None
+    assert await second.trigger(("cmd", 2), 2, period) is None
+
+    first.close()
+    second.close()
+
+
+@mark.asyncio
+async def test_shared_memory_storage_waits_for_lock(tmp_path: Path):
+    import fcntl
+
+    first = SharedMemoryStorage(tmp_path / "cooldowns", slots=64)
+    second = SharedMemoryStorage(tmp_path / "cooldowns", slots=64)
+
+    fcntl.flock(second._fd, fcntl.LOCK_EX)
+    trigger = create_task(first.trigger("key", 1, timedelta(seconds=10)))
+    # The event loop keeps running while the other process holds the lock.
+    await sleep(0.01)
+    assert not trigger.done()
+
+    fcntl.flock(second._fd, fcntl.LOCK_UN)
+    assert await trigger is None
+
+    first.close()
+    second.close()
+
+
+@mark.asyncio
+async def test_kv_storage_batches_requests():
+    backend = MemoryKVBackend()
+    storage = KVStorage(backend)
+    period = timedelta(seconds=10)
+
+    results = await gather(*(storage.trigger(("cmd", i % 2), 2, period) for i in range(6)))
+
+    assert backend.round_trips == 1
+    assert results.count(None) == 4
+    assert all(result is None or result > timedelta() for result in results)
+
+    # The rejection is cached, so the store is not contacted again.
+    assert await storage.trigger(("cmd", 0), 2, period) is not None
+    assert backend.round_trips == 1
+
+
+@mark.asyncio
+async def test_kv_storage_leases():
+    backend = MemoryKVBackend()
+    storage = KVStorage(backend, lease_size=3)
+    period = timedelta(seconds=10)
+
+    for _ in range(3):
+        assert await storage.trigger("key", 5, period) is None
+
+    assert backend.round_trips == 1
+
+
+@mark.asyncio
+async def test_kv_storage_prunes_expired_leases(monkeypatch: MonkeyPatch):
+    clock = Clock()
+    monkeypatch.setattr(kv_module, "monotonic", clock)
+    storage = KVStorage(MemoryKVBackend(), lease_size=3)
+    period = timedelta(seconds=10)
+
+    assert await storage.trigger("one-off", 5, period) is None
+    clock.now += 2
+    assert await storage.trigger("other", 5, period) is None
+
+    assert len(storage._leases) == 1
+
+
+@mark.asyncio
+async def test_trigger_all_is_atomic(tmp_path: Path):
+    strict = Bucket("strict", 1, timedelta(seconds=10))
+    loose = Bucket("loose", 2, timedelta(seconds=10))
+
+    for storage in (
+        MemoryStorage(),
+        SharedMemoryStorage(tmp_path / "cooldowns", slots=64),
+        KVStorage(MemoryKVBackend()),
+    ):
+        assert await storage.trigger_all((strict, loose)) is None
+        retry = await storage.trigger_all((strict, loose))
+        assert retry is not None and timedelta(seconds=9) < retry <= timedelta(seconds=10)
+
+        # The rejected trigger did not use up the loose bucket.
+        assert await storage.trigger(*loose) is None
+        assert await storage.trigger(*loose) is not None
+
+
+@mark.asyncio
+async def test_composite_cooldown_returns_longest_retry():
+    retries: list[timedelta] = []
+
+    async def on_rate_limited(ctx: Any, retry: timedelta) -> None:
+        retries.append(retry)
+
+    hook = composite_cooldown(
+        Limit(1, timedelta(seconds=5), bucket=lambda ctx: ctx.user),
+        Limit(1, timedelta(seconds=20), bucket=lambda ctx: ctx.guild),
+        callback=on_rate_limited,
+    )
+
+    first = Mock(user=1, guild=1)
+    second = Mock(user=2, guild=1)
+
+    assert await hook(first) is None
+    result = await hook(second)
+
+    assert result is not None and result.exit
+    assert len(retries) == 1
+    assert timedelta(seconds=19) < retries[0] <= timedelta(seconds=20)
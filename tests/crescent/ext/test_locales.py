@@ -0,0 +1,95 @@
+import json
+from copy import deepcopy
+
+from hikari import CommandType, Permissions, SlashCommand
+from pytest import raises
+
+from crescent import Context, command, option
+from crescent.ext.locales import TranslationTable
+from crescent.locale import str_or_build_locale
+
+
+def _write(path, data) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_translation_table(tmp_path):
+    _write(tmp_path / "en-US.json", {"ping": {"name": "ping", "description": "Ping the bot"}})
+    _write(tmp_path / "fr.json", {"ping": {"description": "Envoyer un ping"}})
+    (tmp_path / "README.md").write_text("not a translation")
+
+    table = TranslationTable(tmp_path, fallback_locale="en-US")
+
+    assert len(table) == 2
+    assert table.get("ping.description", "fr") == "Envoyer un ping"
+    assert str_or_build_locale(table("ping.description")) == (
+        "Ping the bot",
+        {"en-US": "Ping the bot", "fr": "Envoyer un ping"},
+    )
+    assert str_or_build_locale(table("missing")) == ("missing", {})
+
+
+def test_translation_table_defined_before_load(tmp_path):
+    table = TranslationTable(tmp_path)
+
+    @command(name=table("name"), description="description")
+    async def callback(ctx: Context) -> None: ...
+
+    _write(tmp_path / "de.json", {"name": "befehl"})
+    assert table.load() == {"name"}
+
+    assert callback.metadata.app_command.build(None)["name_localizations"] == {"de": "befehl"}
+
+
+def test_translation_table_reload(tmp_path):
+    _write(tmp_path / "fr.json", {"a": "1", "b": "2"})
+    table = TranslationTable(tmp_path)
+    _, built = str_or_build_locale(table("a"))
+
+    _write(tmp_path / "fr.json", {"a": "3", "b": "2"})
+
+    assert table.load() == {"a"}
+    assert built == {"fr": "3"}
+
+
+def test_translation_table_bad_locale(tmp_path):
+    _write(tmp_path / "english.json", {})
+
+    with raises(ValueError):
+        TranslationTable(tmp_path)
+
+
+def test_translation_table_reload_changes_command(tmp_path):
+    _write(tmp_path / "fr.json", {"arg": "argument"})
+    table = TranslationTable(tmp_path)
+
+    @command(name="ping", description="description")
+    class ping:
+        arg = option(str, table("arg"))
+
+        async def callback(self, ctx: Context) -> None: ...
+
+    app_command = ping.metadata.app_command
+    published = SlashCommand(
+        app=None,
+        id=None,
+        type=CommandType.SLASH,
+        application_id=None,
+        name="ping",
+        default_member_permissions=Permissions(0),
+        is_nsfw=False,
+        guild_id=None,
+        version=None,
+        name_localizations={},
+        description="description",
+        description_localizations={},
+        options=deepcopy(app_command.options),
+        context_types=(),
+        integration_types=(),
+    )
+    assert app_command.eq_partial_command(published)
+
+    _write(tmp_path / "fr.json", {"arg": "autre"})
+    table.load()
+
+    assert not app_command.eq_partial_command(published)
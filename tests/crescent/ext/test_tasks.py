@@ -0,0 +1,222 @@
+from asyncio import Event, TimeoutError, sleep
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from hikari import StoppingEvent
+from pytest import importorskip, mark
+
+from crescent.ext.tasks import Cronjob, Loop, OverlapPolicy, TaskError, get_scheduler
+from tests.utils import MockClient
+
+
+async def _noop() -> None:
+    await sleep(0)
+
+
+async def _start(task: Loop, client: Mock) -> None:
+    client.watchdog = None
+    task.client = client
+    await task._start_inner()
+
+
+def _fire_now(task: Loop) -> None:
+    """Run a task as if the scheduler found it was due."""
+    assert task._entry is not None and task._scheduler is not None
+    task._scheduler.cancel(task._entry)
+    task._fire()
+
+
+@mark.asyncio
+async def test_loops_share_one_timer():
+    client = Mock()
+    scheduler = get_scheduler(client)
+    loops = [Loop(_noop, 0.05) for _ in range(20)]
+
+    for loop in loops:
+        await _start(loop, client)
+    assert len(scheduler) == 20
+
+    await sleep(0.01)
+    # Every loop ran on startup in a single wakeup and is scheduled again.
+    assert scheduler.wakeups == 1
+    assert len(scheduler) == 20
+    assert all(loop.last_duration is not None for loop in loops)
+
+    await sleep(0.06)
+    assert scheduler.wakeups == 2
+
+    for loop in loops:
+        loop.stop()
+    assert len(scheduler) == 0
+    assert not any(loop.running for loop in loops)
+
+
+@mark.asyncio
+async def test_scheduler_is_reset_on_stop():
+    client = MockClient()
+    scheduler = get_scheduler(client)
+    loop = Loop(_noop, 60)
+    await _start(loop, client)
+    assert len(scheduler) == 1
+
+    await client.app.event_manager.dispatch(StoppingEvent(app=client.app), return_tasks=True)
+
+    assert len(scheduler) == 0
+    assert scheduler._loop is None
+    assert scheduler._handle is None
+    assert loop.next_run is None
+
+
+@mark.asyncio
+async def test_next_run_and_jitter():
+    client = Mock()
+    loop = Loop(_noop, 10, jitter=5)
+    loop.first_loop = False
+
+    assert loop.next_run is None
+    await _start(loop, client)
+
+    next_run = loop.next_run
+    assert next_run is not None
+    assert timedelta(seconds=9) < next_run - datetime.now() < timedelta(seconds=15)
+    assert loop.last_run is None
+
+    loop.stop()
+    assert loop.next_run is None
+
+
+def test_cronjobs_have_their_own_schedule():
+    importorskip("croniter")
+
+    first = Cronjob("*/5 * * * *", _noop, first_loop=False)
+    second = Cronjob("*/5 * * * *", _noop, first_loop=False)
+
+    assert first.cron is not second.cron
+    assert abs(first._next_iteration() - second._next_iteration()) < 0.1
+    # A cronjob that fires early does not fire twice for the same time.
+    assert first._next_iteration() > 250
+
+
+@mark.asyncio
+@mark.parametrize(
+    ("overlap", "max_concurrent", "runs", "missed"),
+    [
+        ("skip_if_running", None, 1, 3),
+        ("queue_one", None, 2, 2),
+        ("allow_concurrent", 2, 2, 2),
+        ("allow_concurrent", None, 4, 0),
+    ],
+)
+async def test_overlap_policies(
+    overlap: OverlapPolicy, max_concurrent: int | None, runs: int, missed: int
+):
+    release = Event()
+
+    async def callback() -> None:
+        await release.wait()
+
+    loop = Loop(callback, 60, overlap=overlap, max_concurrent=max_concurrent)
+    loop.first_loop = False
+    await _start(loop, Mock())
+    for _ in range(4):
+        _fire_now(loop)
+
+    await sleep(0)
+    release.set()
+    for _ in range(5):
+        await sleep(0)
+
+    assert loop.stats.runs == runs
+    assert loop.stats.missed == missed
+    loop.stop()
+
+
+@mark.asyncio
+async def test_fixed_delay_waits_for_completion():
+    release = Event()
+
+    async def callback() -> None:
+        await release.wait()
+
+    loop = Loop(callback, 60, overlap="fixed_delay")
+    loop.first_loop = False
+    await _start(loop, Mock())
+    _fire_now(loop)
+
+    assert loop.next_run is None
+    release.set()
+    await sleep(0)
+    await sleep(0)
+
+    next_run = loop.next_run
+    assert next_run is not None
+    assert timedelta(seconds=59) < next_run - datetime.now() <= timedelta(seconds=60)
+    loop.stop()
+
+
+@mark.asyncio
+async def test_timeout_calls_on_error():
+    errors: list[TaskError] = []
+
+    async def callback() -> None:
+        await sleep(1)
+
+    async def on_error(error: TaskError) -> None:
+        errors.append(error)
+
+    loop = Loop(callback, 60, timeout=0.01, on_error=on_error)
+    loop.first_loop = False
+    await _start(loop, Mock())
+    _fire_now(loop)
+    await sleep(0.05)
+
+    assert len(errors) == 1
+    assert isinstance(errors[0].__cause__, TimeoutError)
+    assert loop.stats.timeouts == loop.stats.failures == 1
+    loop.stop()
+
+
+@mark.asyncio
+async def test_callback_timeout_error_is_not_a_timeout():
+    errors: list[TaskError] = []
+
+    async def callback() -> None:
+        raise TimeoutError("from the callback")
+
+    async def on_error(error: TaskError) -> None:
+        errors.append(error)
+
+    loop = Loop(callback, 60, timeout=1, on_error=on_error)
+    loop.first_loop = False
+    await _start(loop, Mock())
+    _fire_now(loop)
+    await sleep(0.01)
+
+    assert str(errors[0].__cause__) == "from the callback"
+    assert loop.stats.timeouts == 0
+    assert loop.stats.failures == 1
+    loop.stop()
+
+
+@mark.asyncio
+async def test_queued_run_after_error():
+    release = Event()
+
+    async def callback() -> None:
+        await release.wait()
+        raise ValueError
+
+    loop = Loop(callback, 60, overlap="queue_one")
+    loop.first_loop = False
+    await _start(loop, Mock())
+    _fire_now(loop)
+    _fire_now(loop)
+
+    await sleep(0)
+    release.set()
+    for _ in range(5):
+        await sleep(0)
+
+    assert loop.stats.runs == loop.stats.failures == 2
+    assert loop.stats.missed == 0
+    loop.stop()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from types import MethodType
 from typing import TYPE_CHECKING, Any
 
@@ -78,12 +80,12 @@ def test_command_hook_order():
 
     client.plugins._add_plugin("", plugin)
 
-    assert c1.metadata.hooks == ["command", "client"]
-    assert c2.metadata.hooks == ["command", "group", "client"]
-    assert c3.metadata.hooks == ["command", "subgroup", "group", "client"]
-    assert c4.metadata.hooks == ["command", "plugin", "client"]
-    assert c5.metadata.hooks == ["command", "group", "plugin", "client"]
-    assert c6.metadata.hooks == ["command", "subgroup", "group", "plugin", "client"]
+    assert c1.metadata.hooks == ("command", "client")
+    assert c2.metadata.hooks == ("command", "group", "client")
+    assert c3.metadata.hooks == ("command", "subgroup", "group", "client")
+    assert c4.metadata.hooks == ("command", "plugin", "client")
+    assert c5.metadata.hooks == ("command", "group", "plugin", "client")
+    assert c6.metadata.hooks == ("command", "subgroup", "group", "plugin", "client")
 
 
 def test_command_after_hook_order():
@@ -128,12 +130,12 @@ def test_command_after_hook_order():
 
     client.plugins._add_plugin("", plugin)
 
-    assert c1.metadata.after_hooks == ["command", "client"]
-    assert c2.metadata.after_hooks == ["command", "group", "client"]
-    assert c3.metadata.after_hooks == ["command", "subgroup", "group", "client"]
-    assert c4.metadata.after_hooks == ["command", "plugin", "client"]
-    assert c5.metadata.after_hooks == ["command", "group", "plugin", "client"]
-    assert c6.metadata.after_hooks == ["command", "subgroup", "group", "plugin", "client"]
+    assert c1.metadata.after_hooks == ("command", "client")
+    assert c2.metadata.after_hooks == ("command", "group", "client")
+    assert c3.metadata.after_hooks == ("command", "subgroup", "group", "client")
+    assert c4.metadata.after_hooks == ("command", "plugin", "client")
+    assert c5.metadata.after_hooks == ("command", "group", "plugin", "client")
+    assert c6.metadata.after_hooks == ("command", "subgroup", "group", "plugin", "client")
 
 
 def test_vargs_hooks():
@@ -166,8 +168,8 @@ def test_event_hook_order():
 
     client.plugins._add_plugin("", plugin)
 
-    assert e1.metadata.hooks == ["command", "client"]
-    assert e2.metadata.hooks == ["command", "plugin", "client"]
+    assert e1.metadata.hooks == ("command", "client")
+    assert e2.metadata.hooks == ("command", "plugin", "client")
 
 
 def test_event_after_hook_order():
@@ -186,5 +188,40 @@ def test_event_after_hook_order():
 
     client.plugins._add_plugin("", plugin)
 
-    assert e1.metadata.after_hooks == ["command", "client"]
-    assert e2.metadata.after_hooks == ["command", "plugin", "client"]
+    assert e1.metadata.after_hooks == ("command", "client")
+    assert e2.metadata.after_hooks == ("command", "plugin", "client")
+
+
+def test_hook_chains_are_shared():
+    async def before(ctx) -> None: ...
+
+    async def after(ctx) -> None: ...
+
+    client = MockClient(command_hooks=[before], command_after_hooks=[after])
+
+    @client.include
+    @command
+    async def command_a(ctx): ...
+
+    @client.include
+    @command
+    async def command_b(ctx): ...
+
+    assert command_a.metadata.hooks == (before,)
+    assert command_a.metadata.after_hooks == (after,)
+    assert command_a.metadata.hooks is command_b.metadata.hooks
+    assert command_a.metadata.after_hooks is command_b.metadata.after_hooks
+
+
+def test_unused_hook_chains_are_dropped():
+    async def before(ctx) -> None: ...
+
+    @hook(before)
+    @command
+    async def command_a(ctx): ...
+
+    chain = weakref.ref(command_a.metadata.hooks)
+    del command_a
+    gc.collect()
+
+    assert chain() is None
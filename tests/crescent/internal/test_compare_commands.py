@@ -1,9 +1,10 @@
-from unittest.mock import Mock
-
-from crescent.internal.app_command import AppCommand
+from crescent.internal.app_command import AppCommand, partial_command_key
 
 from hikari import (
     ApplicationIntegrationType,
+    CommandChoice,
+    CommandOption,
+    OptionType,
     PartialCommand,
     Permissions,
     SlashCommand,
@@ -14,6 +15,15 @@ DEFAULT_CONTEXT = ()
 DEFAULT_INT = (ApplicationIntegrationType.GUILD_INSTALL,)
 
 
+def _option(name: str) -> CommandOption:
+    return CommandOption(
+        type=OptionType.STRING,
+        name=name,
+        description="desc",
+        choices=[CommandChoice(name="choice", value=name)],
+    )
+
+
 def test_compare_commands():
     assert AppCommand(
         type=1,
@@ -70,14 +80,9 @@ def test_compare_commands_no_options():
 
 
 def test_compare_should_succeed_with_options():
-    # Not testing eq for options, because that is implemented by hikari.
-    mock_option_a = Mock()
-    mock_option_b = Mock()
-    mock_option_c = Mock()
-
-    mock_option_a.__eq__ = lambda _: True
-    mock_option_b.__eq__ = lambda _: True
-    mock_option_c.__eq__ = lambda _: True
+    mock_option_a = _option("a")
+    mock_option_b = _option("b")
+    mock_option_c = _option("c")
 
     assert AppCommand(
         type=1,
@@ -101,7 +106,7 @@ def test_compare_should_succeed_with_options():
             name_localizations={},
             description="desc",
             description_localizations={},
-            options=[mock_option_a, mock_option_b, mock_option_c],
+            options=[_option("a"), _option("b"), _option("c")],
             context_types=DEFAULT_CONTEXT,
             integration_types=DEFAULT_INT,
         )
@@ -134,3 +139,55 @@ def test_compare_should_succeed_with_options():
             integration_types=DEFAULT_INT,
         )
     )
+
+
+def test_compare_options_with_different_choices():
+    command = AppCommand(
+        type=1, name="hello", guild_id=None, description="desc", options=[_option("a")]
+    )
+    other = _option("a")
+    other.choices[0].value = "b"
+
+    assert not command._options_equal([other])
+    assert command._options_equal([_option("a")])
+
+
+def test_compare_options_with_different_localizations():
+    command = AppCommand(
+        type=1, name="hello", guild_id=None, description="desc", options=[_option("a")]
+    )
+
+    other = _option("a")
+    other.name_localizations = {"de": "b"}
+    assert not command._options_equal([other])
+
+    other = _option("a")
+    other.description_localizations = {"de": "beschreibung"}
+    assert not command._options_equal([other])
+
+    other = _option("a")
+    other.choices[0].name_localizations = {"de": "wahl"}
+    assert not command._options_equal([other])
+
+
+def test_structural_key():
+    local = AppCommand(type=1, name="hello", guild_id=None, default_member_permissions=0)
+    remote = PartialCommand(
+        app=None,
+        id=None,
+        type=1,
+        application_id=None,
+        name="hello",
+        default_member_permissions=Permissions(0),
+        is_nsfw=False,
+        guild_id=None,
+        version=None,
+        name_localizations={},
+        context_types=DEFAULT_CONTEXT,
+        integration_types=DEFAULT_INT,
+    )
+
+    assert local.structural_key() == partial_command_key(remote)
+    assert AppCommand(type=1, name="other", guild_id=None).structural_key() != (
+        partial_command_key(remote)
+    )
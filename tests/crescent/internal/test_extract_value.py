@@ -1,26 +1,41 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
+from unittest.mock import Mock
 
 import attrs
-from hikari import OptionType, ResolvedOptionData, Snowflake
+from hikari import (
+    AutocompleteInteraction,
+    CommandInteraction,
+    OptionType,
+    ResolvedOptionData,
+    Role,
+    Snowflake,
+)
 
-from crescent.internal.handle_resp import _extract_value
+from crescent import Context, Mentionable, command, option
+from crescent.internal.handle_resp import _get_option_plan, _options_to_kwargs
 
 
-@attrs.define
-class MockInteraction:
-    resolved: Optional[ResolvedOptionData]
+def _interaction(resolved: Optional[ResolvedOptionData]) -> Mock:
+    interaction = Mock(spec=CommandInteraction)
+    interaction.resolved = resolved
+    return interaction
 
 
 @attrs.define
 class MockOption:
     type: OptionType | str
     value: Snowflake | str | int | bool
+    name: str = "option"
+
+
+def _extract_value(option: MockOption, interaction: Mock) -> Any:
+    return _options_to_kwargs(interaction, [option])[option.name]
 
 
 def test_extract_str():
-    command_interaction = MockInteraction(None)
+    command_interaction = _interaction(None)
     option = MockOption(type=OptionType.STRING, value="12345")
 
     assert _extract_value(option, command_interaction) == "12345"
@@ -29,7 +44,7 @@ def test_extract_str():
 def test_extract_user():
     USER = object()
 
-    command_interaction = MockInteraction(
+    command_interaction = _interaction(
         resolved=ResolvedOptionData(
             users={"12345": USER}, members={}, roles={}, channels={}, messages={}, attachments={}
         )
@@ -42,7 +57,7 @@ def test_extract_user():
 def test_extract_channel():
     CHANNEL = object()
 
-    command_interaction = MockInteraction(
+    command_interaction = _interaction(
         resolved=ResolvedOptionData(
             users={},
             members={},
@@ -60,7 +75,7 @@ def test_extract_channel():
 def test_extract_attachment():
     ATTACHMENT = object()
 
-    command_interaction = MockInteraction(
+    command_interaction = _interaction(
         resolved=ResolvedOptionData(
             users={},
             members={},
@@ -76,7 +91,75 @@ def test_extract_attachment():
 
 
 def test_extract_autocomplete_option():
-    command_interaction = MockInteraction(None)
+    command_interaction = Mock(spec=AutocompleteInteraction)
     option = MockOption(type=OptionType.USER, value=Snowflake(12345))
 
     assert _extract_value(option, command_interaction) == Snowflake(12345)
+
+
+def test_extract_member_before_user():
+    USER, MEMBER = object(), object()
+
+    command_interaction = _interaction(
+        resolved=ResolvedOptionData(
+            users={"1": USER, "2": USER},
+            members={"1": MEMBER},
+            roles={},
+            channels={},
+            messages={},
+            attachments={},
+        )
+    )
+
+    assert (
+        _extract_value(MockOption(type=OptionType.USER, value="1"), command_interaction) is MEMBER
+    )
+    assert _extract_value(MockOption(type=OptionType.USER, value="2"), command_interaction) is USER
+
+
+def test_option_plan():
+    ROLE = object()
+
+    @command
+    class test_command:
+        text = option(str)
+        role = option(Role, name="some-role")
+
+        async def callback(self, ctx: Context) -> None: ...
+
+    plan = _get_option_plan(test_command)
+    assert plan.keys() == {"text", "some-role"}
+    assert plan["text"] is None
+    assert _get_option_plan(test_command) is plan
+
+    interaction = Mock(spec=CommandInteraction)
+    interaction.resolved = ResolvedOptionData(
+        users={}, members={}, roles={"1": ROLE}, channels={}, messages={}, attachments={}
+    )
+    options = [
+        MockOption(type=OptionType.STRING, value="hello", name="text"),
+        MockOption(type=OptionType.ROLE, value="1", name="some-role"),
+    ]
+
+    assert _options_to_kwargs(interaction, options, plan) == {"text": "hello", "some-role": ROLE}
+
+
+def test_extract_mentionables():
+    USER, ROLE = object(), object()
+
+    command_interaction = _interaction(
+        resolved=ResolvedOptionData(
+            users={"1": USER},
+            members={},
+            roles={"2": ROLE},
+            channels={},
+            messages={},
+            attachments={},
+        )
+    )
+
+    user = _extract_value(MockOption(type=OptionType.MENTIONABLE, value="1"), command_interaction)
+    role = _extract_value(MockOption(type=OptionType.MENTIONABLE, value="2"), command_interaction)
+
+    assert user == Mentionable(user=USER, role=None)
+    assert role == Mentionable(user=None, role=ROLE)
@@ -1,115 +1,25 @@
-from asyncio import get_event_loop
+from asyncio import get_event_loop, sleep
+from datetime import timedelta
 from typing import List, cast
 from unittest.mock import AsyncMock, Mock
 
 from hikari import (
-    ApplicationContextType,
-    AutocompleteInteraction,
+    UNDEFINED,
     AutocompleteInteractionOption,
     CommandChoice,
-    CommandInteraction,
-    CommandInteractionOption,
-    CommandType,
-    InteractionChannel,
-    InteractionCreateEvent,
-    InteractionType,
-    OptionType,
+    MessageFlag,
+    NotFoundError,
 )
+from hikari.api import InteractionDeferredBuilder, InteractionMessageBuilder
 from hikari.impl import RESTClientImpl
-from pytest import mark
+from pytest import MonkeyPatch, mark
 
 from crescent import Context, catch_autocomplete, catch_command, command, hook
 import crescent
 from crescent.commands.options import option
 from crescent.exceptions import ConverterExceptions
 from crescent.internal.handle_resp import handle_resp
-from tests.utils import MockClient, MockRESTClient
-
-
-def MockChannel(client):
-    return InteractionChannel(
-        app=client.app,
-        id=0,
-        name="channel",
-        type=0,
-        permissions=0,
-        parent_id=None,
-        thread_metadata=None,
-    )
-
-
-def MockEvent(name, client, arg: "str | None" = None):
-    if arg:
-        options = (
-            CommandInteractionOption(name="arg", type=OptionType.STRING, value=arg, options=None),
-        )
-    else:
-        options = None
-
-    return InteractionCreateEvent(
-        shard=None,
-        interaction=CommandInteraction(
-            app=client.app,
-            id=None,
-            context=ApplicationContextType.GUILD,
-            authorizing_integration_owners={},
-            application_id=...,
-            type=InteractionType.APPLICATION_COMMAND,
-            token=None,
-            version=0,
-            guild_id=None,
-            registered_guild_id=None,
-            guild_locale=None,
-            member=None,
-            user=None,
-            channel=MockChannel(client),
-            locale=None,
-            command_id=None,
-            command_name=name,
-            command_type=CommandType.SLASH,
-            resolved=None,
-            options=options,
-            app_permissions=None,
-            entitlements=None,
-        ),
-    )
-
-
-def MockAutocompleteEvent(name, option_name, client):
-    return InteractionCreateEvent(
-        shard=None,
-        interaction=AutocompleteInteraction(
-            app=client.app,
-            app_permissions=0,
-            id=None,
-            context=ApplicationContextType.GUILD,
-            authorizing_integration_owners={},
-            application_id=...,
-            type=InteractionType.AUTOCOMPLETE,
-            token=client.app._token,
-            version=0,
-            guild_id=None,
-            guild_locale=None,
-            member=None,
-            user=None,
-            channel=MockChannel(client),
-            locale=None,
-            command_id=None,
-            command_name=name,
-            command_type=CommandType.SLASH,
-            registered_guild_id=None,
-            entitlements=None,
-            options=[
-                AutocompleteInteractionOption(
-                    name=option_name,
-                    type=OptionType.STRING,
-                    value="abcd",
-                    is_focused=True,
-                    options=None,
-                )
-            ],
-        ),
-    )
+from tests.utils import MockAutocompleteEvent, MockClient, MockEvent, MockRESTClient
 
 
 @mark.asyncio
@@ -424,3 +334,119 @@ async def test_rest_future_is_set():
     await handle_resp(client, MockEvent("test_command", client).interaction, future=mock_future)
 
     set_result.assert_called_once()
+
+
+@mark.asyncio
+async def test_auto_defer_slow_command(monkeypatch: MonkeyPatch):
+    client = MockRESTClient()
+    edit_interaction_response = AsyncMock()
+    monkeypatch.setattr(RESTClientImpl, "edit_interaction_response", edit_interaction_response)
+    future = get_event_loop().create_future()
+
+    @client.include
+    @command(auto_defer_after=timedelta(milliseconds=10))
+    async def test_command(ctx: Context):
+        await sleep(0.05)
+        await ctx.respond("something")
+
+    await handle_resp(client, MockEvent("test_command", client).interaction, future=future)
+
+    assert isinstance(future.result(), InteractionDeferredBuilder)
+    edit_interaction_response.assert_awaited_once()
+
+
+@mark.asyncio
+@mark.parametrize(
+    ("client_ephemeral", "command_ephemeral", "ephemeral"),
+    [
+        (False, UNDEFINED, False),
+        (True, UNDEFINED, True),
+        (False, True, True),
+        (True, False, False),
+    ],
+)
+async def test_auto_defer_ephemeral(
+    monkeypatch: MonkeyPatch, client_ephemeral, command_ephemeral, ephemeral
+):
+    client = MockRESTClient()
+    client.auto_defer_ephemeral = client_ephemeral
+    monkeypatch.setattr(RESTClientImpl, "edit_interaction_response", AsyncMock())
+    future = get_event_loop().create_future()
+
+    @client.include
+    @command(auto_defer_after=timedelta(milliseconds=10), auto_defer_ephemeral=command_ephemeral)
+    async def test_command(ctx: Context):
+        await sleep(0.05)
+        await ctx.respond("something", ephemeral=True)
+
+    await handle_resp(client, MockEvent("test_command", client).interaction, future=future)
+
+    assert (future.result().flags == MessageFlag.EPHEMERAL) is ephemeral
+
+
+@mark.asyncio
+async def test_auto_defer_fast_command():
+    client = MockRESTClient()
+    client.auto_defer_after = timedelta(milliseconds=10)
+    future = get_event_loop().create_future()
+
+    @client.include
+    @command
+    async def test_command(ctx: Context):
+        await ctx.respond("something")
+
+    await handle_resp(client, MockEvent("test_command", client).interaction, future=future)
+    await sleep(0.02)
+
+    assert isinstance(future.result(), InteractionMessageBuilder)
+
+
+@mark.asyncio
+async def test_rest_ensure_message_waits_for_response(monkeypatch: MonkeyPatch):
+    client = MockRESTClient()
+    message = Mock()
+    fetch_interaction_response = AsyncMock(side_effect=[NotFoundError("url", {}, b""), message])
+    monkeypatch.setattr(RESTClientImpl, "fetch_interaction_response", fetch_interaction_response)
+    monkeypatch.setattr("crescent.context.context._REST_FETCH_DELAY", 0)
+
+    responses = []
+
+    @client.include
+    @command
+    async def test_command(ctx: Context):
+        responses.append(await ctx.respond("something", ensure_message=True))
+        responses.append(await ctx.response_message)
+
+    await handle_resp(
+        client,
+        MockEvent("test_command", client).interaction,
+        future=get_event_loop().create_future(),
+    )
+
+    assert responses == [message, message]
+    assert fetch_interaction_response.await_count == 2
+
+
+@mark.asyncio
+async def test_respond_with_template(monkeypatch: MonkeyPatch):
+    client = MockClient()
+    create_interaction_response = AsyncMock()
+    execute_webhook = AsyncMock()
+    monkeypatch.setattr(RESTClientImpl, "create_interaction_response", create_interaction_response)
+    monkeypatch.setattr(RESTClientImpl, "execute_webhook", execute_webhook)
+
+    template = crescent.ResponseTemplate("default", ephemeral=True)
+
+    @client.include
+    @command
+    async def test_command(ctx: Context):
+        await ctx.respond_with_template(template)
+        await ctx.respond_with_template(template, "followup")
+
+    await handle_resp(client, MockEvent("test_command", client).interaction, None)
+
+    create_interaction_response.assert_awaited_once()
+    assert create_interaction_response.await_args.args[3] == "default"
+    assert create_interaction_response.await_args.kwargs["flags"] == MessageFlag.EPHEMERAL
+    execute_webhook.assert_awaited_once()
+    assert execute_webhook.await_args.kwargs["content"] == "followup"
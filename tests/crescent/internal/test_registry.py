@@ -1,13 +1,14 @@
 from collections import defaultdict
 from unittest.mock import AsyncMock, MagicMock
 
-from hikari import Message, User
+from hikari import CommandType, Message, User
 from hikari.impl import CacheImpl, RESTClientImpl
-from pytest import fixture, mark
+from pytest import fixture, mark, raises
 
-from crescent import Context, command
+from crescent import AlreadyRegisteredError, Context, DynamicCommand, Group, command
 from crescent import message_command as _message_command
 from crescent import user_command as _user_command
+from crescent.internal.app_command import Unique
 from tests.utils import MockClient
 
 GUILD_ID = 123456789
@@ -54,3 +55,132 @@ class TestRegistry:
             user_command.metadata.app_command,
             message_command.metadata.app_command,
         ]
+
+    @mark.asyncio
+    async def test_post_grouped_commands(self):
+        client = MockClient(default_guild=GUILD_ID)
+        group = Group("group")
+        sub_group = group.sub_group("sub-group")
+
+        for name in ("a", "b"):
+            client.include(group.child(command(name=name)(_callback)))
+            client.include(sub_group.child(command(name=name)(_callback)))
+
+        await client._post_commands()
+
+        (top_level,) = self.posted_commands[GUILD_ID]
+        assert [option.name for option in top_level.options] == ["a", "sub-group", "b"]
+        assert [option.name for option in top_level.options[1].options] == ["a", "b"]
+
+        await client._post_commands()
+        assert self.posted_commands[GUILD_ID][0] is top_level
+
+        client.include(group.child(command(name="c")(_callback)))
+        await client._post_commands()
+        assert [option.name for option in self.posted_commands[GUILD_ID][0].options] == [
+            "a",
+            "sub-group",
+            "b",
+            "c",
+        ]
+
+
+async def _callback(ctx: Context) -> None:
+    pass
+
+
+class TestDynamicCommands:
+    @fixture(autouse=True)
+    def mock_send(self):
+        self.posted_commands = {}
+
+        def set_application_commands(application, commands, guild=None):
+            self.posted_commands[guild] = commands
+
+        RESTClientImpl.fetch_application = AsyncMock(return_value=MagicMock())
+        RESTClientImpl.set_application_commands = AsyncMock(return_value=None)
+        RESTClientImpl.set_application_commands.side_effect = set_application_commands
+
+    @mark.asyncio
+    async def test_sync_changed_guilds(self):
+        client = MockClient()
+
+        @client.include
+        @command(guild=1)
+        async def static(ctx: Context):
+            pass
+
+        client.commands.set_guild_commands(1, [DynamicCommand("a", _callback)])
+        client.commands.set_guild_commands(
+            2, [DynamicCommand("a", _callback), DynamicCommand("b", _callback)]
+        )
+        await client.commands.sync_guild_commands()
+
+        assert sorted(command.name for command in self.posted_commands[1]) == ["a", "static"]
+        assert [command.name for command in self.posted_commands[2]] == ["a", "b"]
+        assert client.commands._get(Unique("b", CommandType.SLASH, 2, None, None))
+
+        self.posted_commands.clear()
+        client.commands.remove_guild_commands(2, "a")
+        client.commands.add_guild_commands(3, [DynamicCommand("c", _callback)])
+        await client.commands.sync_guild_commands()
+
+        assert self.posted_commands.keys() == {2, 3}
+        assert [command.name for command in self.posted_commands[2]] == ["b"]
+        assert client.commands.guild_commands(2) == ("b",)
+
+        self.posted_commands.clear()
+        await client.commands.sync_guild_commands()
+        assert not self.posted_commands
+
+    def test_static_command_conflict(self):
+        client = MockClient()
+
+        @client.include
+        @command(guild=1)
+        async def static(ctx: Context):
+            pass
+
+        with raises(AlreadyRegisteredError):
+            client.commands.add_guild_commands(1, [DynamicCommand("static", _callback)])
+
+    def test_replace_guild_commands(self):
+        client = MockClient()
+
+        client.commands.set_guild_commands(1, [DynamicCommand("a", _callback)])
+        client.commands.set_guild_commands(1, [DynamicCommand("b", _callback)])
+
+        assert client.commands.guild_commands(1) == ("b",)
+        assert [c.app_command.name for c in client.commands.crescent_commands] == ["b"]
+
+    @mark.asyncio
+    async def test_dynamic_commands_are_lightweight(self):
+        async def before(ctx: Context) -> None:
+            pass
+
+        client = MockClient(command_hooks=[before])
+
+        @client.include
+        @command(guild=1)
+        async def static(ctx: Context):
+            pass
+
+        client.commands.set_guild_commands(1, [DynamicCommand("a", _callback)])
+        client.commands.set_guild_commands(2, [DynamicCommand("a", _callback)])
+
+        # Dynamic commands are only stored with their app command.
+        assert list(client.commands._registry) == [static.metadata.unique]
+
+        dynamic = client.commands._get(Unique("a", CommandType.SLASH, 2, None, None))
+        assert dynamic.metadata.callback is _callback
+        assert dynamic.metadata.hooks == (before,)
+        assert dynamic.client is client
+
+        await client.commands.sync_guild_commands()
+        static_commands = client.commands._built_guild_commands
+        assert static_commands == {1: [static.metadata.app_command]}
+
+        client.commands.add_guild_commands(2, [DynamicCommand("b", _callback)])
+        await client.commands.sync_guild_commands()
+        assert client.commands._built_guild_commands is static_commands
+        assert [command.name for command in self.posted_commands[2]] == ["a", "b"]
@@ -0,0 +1,120 @@
+import subprocess
+import sys
+from asyncio import create_task, sleep
+from unittest.mock import AsyncMock, Mock
+
+from pytest import fixture, mark
+
+from crescent import CommandSnapshot, Context, command
+from crescent.internal import CommandHandler
+from tests.utils import MockClient
+
+
+@fixture
+def register(monkeypatch) -> AsyncMock:
+    mock = AsyncMock()
+    monkeypatch.setattr(CommandHandler, "register_commands", mock)
+    return mock
+
+
+def _client(*names: str) -> MockClient:
+    client = MockClient()
+
+    for name in names:
+
+        async def callback(ctx: Context) -> None: ...
+
+        client.include(command(name=name)(callback))
+
+    return client
+
+
+@mark.asyncio
+async def test_first_process_publishes(tmp_path, register):
+    snapshot = CommandSnapshot(tmp_path / "commands.json")
+    client = _client("a", "b")
+
+    assert await snapshot.sync(client.commands)
+    register.assert_awaited_once()
+
+    stored = snapshot.read()
+    assert stored is not None
+    assert stored["hash"] == snapshot.fingerprint(client.commands)
+    assert stored["commands"] == {
+        "1:a": f"{__name__}:_client.<locals>.callback",
+        "1:b": f"{__name__}:_client.<locals>.callback",
+    }
+    assert [payload["command"]["name"] for payload in stored["payloads"]] == ["a", "b"]
+    assert snapshot._acquire()
+
+
+@mark.asyncio
+async def test_matching_process_skips_sync(tmp_path, register, monkeypatch):
+    snapshot = CommandSnapshot(tmp_path / "commands.json")
+    await snapshot.sync(_client("a", "b").commands)
+
+    # Workers only fingerprint their commands and never build the command tree.
+    with monkeypatch.context() as m:
+        m.setattr(CommandHandler, "_build_commands", Mock(side_effect=AssertionError))
+        assert not await snapshot.sync(_client("a", "b").commands)
+    assert register.await_count == 1
+
+    assert await snapshot.sync(_client("a", "c").commands)
+    assert register.await_count == 2
+
+
+def test_fingerprint_changes_with_commands(tmp_path):
+    snapshot = CommandSnapshot(tmp_path / "commands.json")
+
+    client = MockClient()
+
+    @client.include
+    @command(name="a", description="first")
+    async def first(ctx: Context) -> None: ...
+
+    other = MockClient()
+
+    @other.include
+    @command(name="a", description="second")
+    async def second(ctx: Context) -> None: ...
+
+    assert snapshot.fingerprint(client.commands) != snapshot.fingerprint(other.commands)
+    assert snapshot.fingerprint(_client("a").commands) == snapshot.fingerprint(
+        _client("a").commands
+    )
+
+
+@mark.asyncio
+async def test_waits_for_lock(tmp_path, register):
+    snapshot = CommandSnapshot(tmp_path / "commands.json", poll_interval=0.01)
+    coordinator = CommandSnapshot(tmp_path / "commands.json")
+
+    assert coordinator._acquire()
+    assert not snapshot._acquire()
+    task = create_task(snapshot.sync(_client("a").commands))
+    await sleep(0.05)
+    assert not task.done()
+
+    coordinator.write(coordinator.build(_client("a").commands))
+    coordinator._release()
+
+    assert not await task
+    register.assert_not_awaited()
+
+
+@mark.asyncio
+async def test_lock_of_dead_process(tmp_path, register):
+    snapshot = CommandSnapshot(tmp_path / "commands.json")
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import fcntl, os, sys;"
+            "fd = os.open(sys.argv[1], os.O_RDWR | os.O_CREAT);"
+            "fcntl.flock(fd, fcntl.LOCK_EX)",
+            str(snapshot.lock_path),
+        ],
+        check=True,
+    )
+
+    assert await snapshot.sync(_client("a").commands)
@@ -1,3 +1,6 @@
+from unittest.mock import Mock
+
+from crescent import Context, Group, command
 from crescent.locale import str_or_build_locale
 from tests.utils import Locale
 
@@ -12,3 +15,26 @@ def test_str_or_build_locale():
 
     assert default == "test"
     assert not locales
+
+
+def test_locale_built_once():
+    locale = Locale("default", en_US="en-localization")
+    locale.build = Mock(wraps=locale.build)
+
+    assert str_or_build_locale(locale) is str_or_build_locale(locale)
+    locale.build.assert_called_once()
+
+
+def test_unique_follows_group():
+    @command(name=Locale("name"))
+    async def callback(ctx: Context) -> None: ...
+
+    unique = callback.metadata.unique
+    assert unique.name == "name"
+    assert callback.metadata.unique is unique
+
+    callback.metadata.group = Group("group")
+    assert callback.metadata.unique.group == "group"
+
+    callback.metadata.app_command.guild_id = 1234
+    assert callback.metadata.unique.guild_id == 1234
@@ -0,0 +1,110 @@
+import time
+from asyncio import gather, get_event_loop, sleep
+from datetime import timedelta
+from threading import Lock
+from unittest.mock import AsyncMock
+
+from hikari import StoppingEvent
+from hikari.api import InteractionDeferredBuilder, InteractionMessageBuilder
+from hikari.impl import RESTClientImpl
+from pytest import MonkeyPatch, mark
+
+from crescent import Context, OffloadPools, command
+from crescent.internal.handle_resp import handle_resp
+from tests.utils import MockClient, MockEvent, MockRESTClient
+
+
+def _client(defer_after: timedelta | None) -> MockRESTClient:
+    client = MockRESTClient()
+    client.offload_pools = OffloadPools(max_threads=4, defer_after=defer_after)
+    return client
+
+
+@mark.asyncio
+async def test_offload_defers_slow_work(monkeypatch: MonkeyPatch) -> None:
+    edit_interaction_response = AsyncMock()
+    monkeypatch.setattr(RESTClientImpl, "edit_interaction_response", edit_interaction_response)
+    client = _client(timedelta(milliseconds=10))
+    future = get_event_loop().create_future()
+
+    @client.include
+    @command
+    async def test_command(ctx: Context) -> None:
+        await ctx.offload(time.sleep, 0.05)
+        await ctx.respond("done")
+
+    await handle_resp(client, MockEvent("test_command", client).interaction, future=future)
+
+    assert isinstance(future.result(), InteractionDeferredBuilder)
+    edit_interaction_response.assert_awaited_once()
+
+
+@mark.asyncio
+async def test_offload_fast_work() -> None:
+    client = _client(timedelta(seconds=1))
+    future = get_event_loop().create_future()
+
+    @client.include
+    @command
+    async def test_command(ctx: Context) -> None:
+        await ctx.respond(str(await ctx.offload(pow, 2, 10)))
+
+    await handle_resp(client, MockEvent("test_command", client).interaction, future=future)
+    await sleep(0.02)
+
+    assert isinstance(future.result(), InteractionMessageBuilder)
+    assert future.result().content == "1024"
+
+
+@mark.asyncio
+async def test_offload_defer_after() -> None:
+    client = _client(None)
+    future = get_event_loop().create_future()
+
+    @client.include
+    @command
+    async def test_command(ctx: Context) -> None:
+        await ctx.offload(time.sleep, 0.05, defer_after=timedelta(0))
+        await ctx.respond("done")
+
+    await handle_resp(client, MockEvent("test_command", client).interaction, future=future)
+
+    assert isinstance(future.result(), InteractionDeferredBuilder)
+
+
+@mark.asyncio
+async def test_offload_limit() -> None:
+    client = _client(None)
+    lock = Lock()
+    running = 0
+    most_running = 0
+
+    def work() -> None:
+        nonlocal running, most_running
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    @client.include
+    @command
+    async def test_command(ctx: Context) -> None:
+        await gather(*(ctx.offload(work, limit=2) for _ in range(6)))
+
+    await handle_resp(client, MockEvent("test_command", client).interaction, future=None)
+
+    assert most_running == 2
+    client.offload_pools.shutdown()
+
+
+@mark.asyncio
+async def test_pools_are_shut_down_on_stop() -> None:
+    client = MockClient()
+    pool = client.offload_pools.executor("thread")
+
+    await client.app.event_manager.dispatch(StoppingEvent(app=client.app), return_tasks=True)
+
+    assert client.offload_pools._thread_pool is None
+    assert pool._shutdown
@@ -0,0 +1,107 @@
+from asyncio import Event, sleep
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from hikari import Snowflake
+from pytest import mark, raises
+
+from crescent import Client, Context, FairScheduler, command, option
+from tests.utils import MockClient, MockEvent, MockRESTClient
+
+
+def _interaction(client: Client, arg: str, guild: int, user: int, age: float = 0):
+    interaction = MockEvent("test_command", client, arg).interaction
+    created_at = datetime.now(timezone.utc) - timedelta(seconds=age)
+    interaction.id = Snowflake.from_datetime(created_at)
+    interaction.guild_id = Snowflake(guild)
+    interaction.user = Mock(id=Snowflake(user))
+    return interaction
+
+
+def _client(scheduler: FairScheduler) -> tuple[MockClient, list[str], Event]:
+    client = MockClient()
+    client.scheduler = scheduler
+    handled: list[str] = []
+    gate = Event()
+
+    @client.include
+    @command
+    class test_command:
+        arg = option(str)
+
+        async def callback(self, ctx: Context) -> None:
+            if self.arg == "blocker":
+                await gate.wait()
+            handled.append(self.arg)
+
+    return client, handled, gate
+
+
+async def _drain(scheduler: FairScheduler) -> None:
+    while scheduler.running or scheduler.queued:
+        await sleep(0)
+
+
+@mark.asyncio
+async def test_weighted_round_robin() -> None:
+    scheduler = FairScheduler(max_running=1, guild_weights={1: 2})
+    client, handled, gate = _client(scheduler)
+
+    submit = scheduler._submit
+    submit(client, _interaction(client, "blocker", 3, 30), None)
+    for arg, guild, user in [
+        ("a", 1, 10),
+        ("b", 1, 10),
+        ("c", 1, 11),
+        ("d", 1, 11),
+        ("e", 2, 20),
+        ("f", 2, 20),
+    ]:
+        submit(client, _interaction(client, arg, guild, user), None)
+
+    assert scheduler.queued == 6
+    gate.set()
+    await _drain(scheduler)
+
+    # Guild 1 is served twice per turn, and its users take turns.
+    assert handled == ["blocker", "a", "c", "e", "b", "d", "f"]
+
+
+@mark.asyncio
+async def test_drops() -> None:
+    scheduler = FairScheduler(
+        max_running=1,
+        max_user_queue=1,
+        is_low_priority=lambda interaction: interaction.options[0].value == "low",
+    )
+    client, handled, gate = _client(scheduler)
+
+    submit = scheduler._submit
+    submit(client, _interaction(client, "blocker", 1, 10), None)
+    submit(client, _interaction(client, "queued", 1, 10), None)
+    submit(client, _interaction(client, "queue full", 1, 10), None)
+    submit(client, _interaction(client, "expired", 1, 11, age=5), None)
+    submit(client, _interaction(client, "low", 1, 12, age=2.8), None)
+    submit(client, _interaction(client, "late", 1, 13, age=2.8), None)
+
+    gate.set()
+    await _drain(scheduler)
+
+    assert handled == ["blocker", "queued", "late"]
+    assert scheduler.dropped == 3
+
+
+@mark.asyncio
+async def test_rest_drop() -> None:
+    client = MockRESTClient()
+    client.scheduler = FairScheduler()
+
+    interaction = _interaction(client, "expired", 1, 10, age=5)
+    assert await client._on_rest_interaction(interaction) is None
+    assert client.scheduler.dropped == 1
+
+
+@mark.parametrize("kwargs", [{"guild_weights": {1: 0}}, {"max_guild_queue": 0}])
+def test_invalid_arguments(kwargs) -> None:
+    with raises(ValueError):
+        FairScheduler(**kwargs)
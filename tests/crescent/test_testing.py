@@ -0,0 +1,142 @@
+import tracemalloc
+from asyncio import sleep
+from pathlib import Path
+
+from hikari import ShardPayloadEvent
+from pytest import mark
+
+from crescent import Client, Context, Group, command, option
+from crescent.testing import (
+    InteractionRecorder,
+    LoadDriver,
+    StubBot,
+    generate_payload,
+    load_payloads,
+)
+
+
+def _client() -> Client:
+    return Client(StubBot(), update_commands=False)
+
+
+@mark.asyncio
+async def test_load_driver() -> None:
+    client = _client()
+    values: list[int] = []
+    group = Group("group")
+
+    @client.include
+    @command
+    class roll:
+        sides = option(int)
+
+        async def callback(self, ctx: Context) -> None:
+            values.append(self.sides)
+            await ctx.respond(str(self.sides))
+
+    @client.include
+    @group.child
+    @command
+    async def grouped(ctx: Context) -> None:
+        values.append(0)
+
+    payloads = [generate_payload("roll", {"sides": n}, guild_id=1) for n in (1, 2, 3)]
+    payloads.append(generate_payload("grouped", group="group"))
+
+    report = await LoadDriver(client, payloads, concurrency=2, requests=8).run()
+
+    assert report.requests == 8
+    assert report.errors == 0
+    assert sorted(values) == [0, 0, 1, 1, 2, 2, 3, 3]
+    assert report.rest_calls == {"create_interaction_response": 6}
+    assert 0 < report.latency_p50 <= report.latency_p99 <= report.latency_max
+    assert report.throughput > 0
+    assert "requests:   8 (0 errors)" in report.summary()
+
+
+@mark.asyncio
+async def test_load_driver_concurrency() -> None:
+    client = _client()
+    running = 0
+    most_running = 0
+
+    @client.include
+    @command
+    async def ping(ctx: Context) -> None:
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await sleep(0.001)
+        running -= 1
+
+    report = await LoadDriver(client, [generate_payload("ping")], concurrency=3, requests=12).run()
+
+    assert report.requests == 12
+    assert most_running == 3
+
+
+@mark.asyncio
+async def test_load_driver_memory() -> None:
+    client = _client()
+    kept: list[bytes] = []
+
+    @client.include
+    @command
+    async def ping(ctx: Context) -> None:
+        kept.append(bytes(100_000))
+
+    payloads = [generate_payload("ping")]
+    report = await LoadDriver(client, payloads, requests=5, trace_memory=True).run()
+
+    assert report.memory_growth is not None and report.memory_peak is not None
+    assert report.memory_peak >= report.memory_growth >= 500_000
+    assert "memory:" in report.summary()
+    assert not tracemalloc.is_tracing()
+
+    report = await LoadDriver(client, payloads, requests=1).run()
+    assert report.memory_growth is None and report.memory_peak is None
+
+
+@mark.asyncio
+async def test_load_driver_duration() -> None:
+    client = _client()
+
+    @client.include
+    @command
+    async def ping(ctx: Context) -> None:
+        pass
+
+    report = await LoadDriver(
+        client, [generate_payload("ping")], rate=100, duration=0.05, lag_interval=0.001
+    ).run()
+
+    assert 1 <= report.requests <= 6
+    assert report.loop_lag_max >= 0
+
+
+def test_recorder(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    recorder = InteractionRecorder(path, max_records=2)
+
+    for n in range(3):
+        recorder.record(generate_payload("roll", {"sides": n}))
+    recorder.close()
+
+    payloads = load_payloads(path)
+    assert recorder.records == 2
+    assert [p["data"]["options"][0]["value"] for p in payloads] == [0, 1]
+    assert all(p["token"] == "recorded" for p in payloads)
+
+
+@mark.asyncio
+async def test_recorder_only_records_interactions(tmp_path: Path) -> None:
+    recorder = InteractionRecorder(tmp_path / "traffic.jsonl")
+    payload = generate_payload("ping")
+
+    await recorder._on_payload(ShardPayloadEvent(app=None, shard=None, payload={}, name="READY"))
+    await recorder._on_payload(
+        ShardPayloadEvent(app=None, shard=None, payload=payload, name="INTERACTION_CREATE")
+    )
+    recorder.close()
+
+    assert load_payloads(recorder.path) == [{**payload, "token": "recorded"}]
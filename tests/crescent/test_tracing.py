@@ -0,0 +1,128 @@
+from contextlib import contextmanager
+from unittest.mock import AsyncMock
+
+from hikari import Snowflake
+from hikari.impl import RESTClientImpl
+from pytest import MonkeyPatch, mark
+
+from crescent import (
+    Context,
+    MemoryTracer,
+    OpenTelemetryTracer,
+    ResponseTemplate,
+    command,
+    hook,
+    option,
+)
+from crescent.internal.handle_resp import handle_resp
+from tests.utils import MockClient, MockEvent
+
+
+async def check(ctx: Context) -> None: ...
+
+
+@mark.asyncio
+async def test_spans(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(RESTClientImpl, "create_interaction_response", AsyncMock())
+
+    tracer = MemoryTracer()
+    client = MockClient()
+    client.tracer = tracer
+
+    @client.include
+    @hook(check)
+    @command
+    class test_command:
+        arg = option(str).convert(int)
+
+        async def callback(self, ctx: Context) -> None:
+            await ctx.respond(str(self.arg))
+
+    interaction = MockEvent("test_command", client, "1").interaction
+    interaction.id = Snowflake(123)
+    await handle_resp(client, interaction, None)
+
+    names = [span.name for span in tracer.spans]
+    assert names == [
+        "crescent.interaction",
+        "crescent.context",
+        "crescent.hook",
+        "crescent.callback",
+        "crescent.converters",
+        "crescent.respond",
+    ]
+
+    (root,) = tracer.find("crescent.interaction")
+    assert root.attributes == {
+        "crescent.interaction.id": 123,
+        "crescent.command": "test_command",
+    }
+    assert root.parent is None
+    assert tracer.find("crescent.hook")[0].attributes == {"crescent.hook": check.__qualname__}
+
+    (callback,) = tracer.find("crescent.callback")
+    assert callback.parent is root
+    assert tracer.find("crescent.converters")[0].parent is callback
+    assert tracer.find("crescent.respond")[0].parent is callback
+    assert all(span.duration is not None for span in tracer.spans)
+
+
+@mark.asyncio
+async def test_template_respond_span(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(RESTClientImpl, "create_interaction_response", AsyncMock())
+
+    tracer = MemoryTracer()
+    client = MockClient()
+    client.tracer = tracer
+    template = ResponseTemplate("hello")
+
+    @client.include
+    @command
+    async def test_command(ctx: Context) -> None:
+        await ctx.respond_with_template(template)
+
+    interaction = MockEvent("test_command", client).interaction
+    interaction.id = Snowflake(123)
+    await handle_resp(client, interaction, None)
+
+    (respond,) = tracer.find("crescent.respond")
+    assert respond.parent is tracer.find("crescent.callback")[0]
+
+
+@mark.asyncio
+async def test_error_spans() -> None:
+    tracer = MemoryTracer()
+    client = MockClient()
+    client.tracer = tracer
+
+    @client.include
+    @command
+    async def test_command(ctx: Context) -> None:
+        raise ValueError
+
+    interaction = MockEvent("test_command", client).interaction
+    interaction.id = Snowflake(123)
+    await handle_resp(client, interaction, None)
+
+    (callback,) = tracer.find("crescent.callback")
+    assert isinstance(callback.exception, ValueError)
+
+    (error_handler,) = tracer.find("crescent.error_handler")
+    assert error_handler.attributes == {"crescent.exception": "ValueError"}
+    assert error_handler.parent is tracer.find("crescent.interaction")[0]
+
+
+def test_opentelemetry_tracer() -> None:
+    started: list[tuple[str, object]] = []
+
+    class FakeTracer:
+        @contextmanager
+        def start_as_current_span(self, name, attributes=None):
+            started.append((name, attributes))
+            yield
+
+    tracer = OpenTelemetryTracer(FakeTracer())
+    with tracer.span("crescent.callback", {"a": 1}):
+        pass
+
+    assert started == [("crescent.callback", {"a": 1})]
@@ -0,0 +1,105 @@
+import time
+from asyncio import sleep
+from threading import Thread
+from threading import enumerate as enumerate_threads
+
+from hikari import StartedEvent, StoppingEvent
+from pytest import LogCaptureFixture, mark
+
+from crescent import Context, LoopWatchdog, command
+from crescent.internal.handle_resp import handle_resp
+from crescent.watchdog import watch
+from tests.utils import MockClient, MockEvent
+
+
+def _watchdog() -> LoopWatchdog:
+    return LoopWatchdog(threshold=0.05, interval=0.01)
+
+
+async def _wait_for_reports(watchdog: LoopWatchdog, count: int) -> None:
+    for _ in range(100):
+        if len(watchdog.reports) >= count:
+            return
+        await sleep(0.01)
+
+
+@mark.asyncio
+async def test_command_stall() -> None:
+    client = MockClient()
+    client.watchdog = watchdog = _watchdog()
+
+    @client.include
+    @command
+    async def blocking_command(ctx: Context) -> None:
+        time.sleep(0.2)
+
+    watchdog.start()
+    try:
+        await handle_resp(client, MockEvent("blocking_command", client).interaction, None)
+        await _wait_for_reports(watchdog, 1)
+    finally:
+        watchdog.stop()
+
+    (report,) = watchdog.reports
+    assert report.handler == "command `blocking_command`"
+    assert report.duration >= 0.15
+    assert report.samples
+    assert "time.sleep(0.2)" in report.samples[0]
+    assert watchdog.max_lag >= 0.15
+
+
+@mark.asyncio
+async def test_reports_are_rate_limited(caplog: LogCaptureFixture) -> None:
+    watchdog = _watchdog()
+    watchdog.start()
+    try:
+        for _ in range(2):
+            with watch(watchdog, "my handler"):
+                time.sleep(0.1)
+            await _wait_for_reports(watchdog, _ + 1)
+        time.sleep(0.1)
+        await _wait_for_reports(watchdog, 3)
+    finally:
+        watchdog.stop()
+
+    assert [report.handler for report in watchdog.reports] == [
+        "my handler",
+        "my handler",
+        "unknown",
+    ]
+    assert [r.message.split(" by ")[1].split(".")[0] for r in caplog.records] == [
+        "my handler",
+        "unknown",
+    ]
+
+
+@mark.asyncio
+async def test_client_starts_and_stops_watchdog() -> None:
+    client = MockClient()
+    client.watchdog = watchdog = _watchdog()
+    events = client.app.event_manager
+
+    await events.dispatch(StartedEvent(app=client.app), return_tasks=True)
+    assert watchdog.running
+
+    await events.dispatch(StoppingEvent(app=client.app), return_tasks=True)
+    assert not watchdog.running
+
+
+@mark.asyncio
+async def test_restart_runs_one_thread() -> None:
+    watchdog = _watchdog()
+
+    def threads() -> list[Thread]:
+        return [thread for thread in enumerate_threads() if thread.name == "crescent-watchdog"]
+
+    watchdog.start()
+    watchdog.stop()
+    assert not threads()
+
+    watchdog.start()
+    watchdog.start()
+    assert len(threads()) == 1
+
+    watchdog.stop()
+    assert not threads()
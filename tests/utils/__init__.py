@@ -3,10 +3,14 @@ from typing import Sequence
 from tests.utils.arrays import arrays_contain_same_elements
 from tests.utils.locale import Locale
 from tests.utils.mock_client import MockBot, MockClient, MockRESTClient
+from tests.utils.mock_event import MockAutocompleteEvent, MockChannel, MockEvent
 
 __all__: Sequence[str] = (
+    "MockAutocompleteEvent",
     "MockBot",
+    "MockChannel",
     "MockClient",
+    "MockEvent",
     "MockRESTClient",
     "arrays_contain_same_elements",
     "Locale",
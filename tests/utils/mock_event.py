@@ -0,0 +1,98 @@
+from hikari import (
+    ApplicationContextType,
+    AutocompleteInteraction,
+    AutocompleteInteractionOption,
+    CommandInteraction,
+    CommandInteractionOption,
+    CommandType,
+    InteractionChannel,
+    InteractionCreateEvent,
+    InteractionType,
+    OptionType,
+)
+
+
+def MockChannel(client):
+    return InteractionChannel(
+        app=client.app,
+        id=0,
+        name="channel",
+        type=0,
+        permissions=0,
+        parent_id=None,
+        thread_metadata=None,
+    )
+
+
+def MockEvent(name, client, arg: "str | None" = None):
+    if arg:
+        options = (
+            CommandInteractionOption(name="arg", type=OptionType.STRING, value=arg, options=None),
+        )
+    else:
+        options = None
+
+    return InteractionCreateEvent(
+        shard=None,
+        interaction=CommandInteraction(
+            app=client.app,
+            id=None,
+            context=ApplicationContextType.GUILD,
+            authorizing_integration_owners={},
+            application_id=...,
+            type=InteractionType.APPLICATION_COMMAND,
+            token=None,
+            version=0,
+            guild_id=None,
+            registered_guild_id=None,
+            guild_locale=None,
+            member=None,
+            user=None,
+            channel=MockChannel(client),
+            locale=None,
+            command_id=None,
+            command_name=name,
+            command_type=CommandType.SLASH,
+            resolved=None,
+            options=options,
+            app_permissions=None,
+            entitlements=None,
+        ),
+    )
+
+
+def MockAutocompleteEvent(name, option_name, client):
+    return InteractionCreateEvent(
+        shard=None,
+        interaction=AutocompleteInteraction(
+            app=client.app,
+            app_permissions=0,
+            id=None,
+            context=ApplicationContextType.GUILD,
+            authorizing_integration_owners={},
+            application_id=...,
+            type=InteractionType.AUTOCOMPLETE,
+            token=client.app._token,
+            version=0,
+            guild_id=None,
+            guild_locale=None,
+            member=None,
+            user=None,
+            channel=MockChannel(client),
+            locale=None,
+            command_id=None,
+            command_name=name,
+            command_type=CommandType.SLASH,
+            registered_guild_id=None,
+            entitlements=None,
+            options=[
+                AutocompleteInteractionOption(
+                    name=option_name,
+                    type=OptionType.STRING,
+                    value="abcd",
+                    is_focused=True,
+                    options=None,
+                )
+            ],
+        ),
+    )